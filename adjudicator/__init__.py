@@ -1,9 +1,21 @@
+from marshmallow import ValidationError
+
 from adjudicator import order, piece, territory
 from adjudicator.named_coast import NamedCoast
 from adjudicator.nation import Nation
-from adjudicator.base import OrderType, Phase, PieceType, Season, TerritoryType
+from adjudicator.base import (
+    OrderType, Phase, PieceType, Season, TerritoryType, Variant
+)
+from adjudicator.compiled_map import MapCache
+from adjudicator.estimate import estimate_outcomes  # noqa: F401
+from adjudicator.exceptions import UnknownMapException
+from adjudicator.instrumentation import Instrumentation
+from adjudicator.parallel import (  # noqa: F401
+    process_game_states, process_turn_clusters
+)
 from adjudicator.processor import process
-from adjudicator.schema import TurnSchema
+from adjudicator.result_cache import canonical_turn, match_order, turn_hash
+from adjudicator.schema import OrderSchema, TurnSchema, TurnStateSchema
 from adjudicator.state import State
 
 
@@ -29,13 +41,64 @@ piece_type_dict = {
 }
 
 
-def process_game_state(data):
-    territory_map = {}
-    named_coast_map = {}
+# Compiled maps of the variants processed by this process.
+map_cache = MapCache()
+
+
+def process_game_state(data, trusted=False, cache=None, instrument=False,
+                       trace=False):
+    """
+    Process a turn.
+
+    Args:
+        * `data` - `dict` - turn data in the format of `TurnSchema`.
+        * `[trusted]` - `bool` - skip validation. Only for data which is
+          known to be valid, e.g. data built from the database.
+        * `[cache]` - result cache, e.g. `MemoryResultCache`. Turns are
+          processed in their canonical form and the result is stored under the
+          hash of that form, so a turn which has already been processed, even
+          with its lists in a different order, is not processed again.
+        * `[instrument]` - `bool` - count the work done to resolve the turn
+          (see `Instrumentation`). The counts are returned as
+          `instrumentation`. The turn is always processed, even if its
+          result is in the cache, and the counts are not cached.
+        * `[trace]` - `bool` - also record how each order was resolved.
+
+    Returns:
+        * `dict` - the processed turn.
+    """
+    if cache is not None:
+        key = turn_hash(data)
+        result = None
+        if not (instrument or trace):
+            result = cache.get(key)
+        if result is None:
+            result = process_game_state(
+                canonical_turn(data), trusted, instrument=instrument,
+                trace=trace,
+            )
+            cache.set(key, {
+                k: v for k, v in result.items() if k != 'instrumentation'
+            })
+        return match_order(result, data)
 
     # Marshall data into expected format and validate
-    validated_data = TurnSchema().load(data)
+    if trusted:
+        validated_data = TurnSchema().load_trusted(data)
+    else:
+        validated_data = TurnSchema().load(data)
 
+    state = create_state(validated_data)
+    if instrument or trace:
+        state.instrumentation = Instrumentation(trace=trace)
+    return _process_turn(state, validated_data)
+
+
+def create_state(validated_data):
+    """
+    Create the state for a validated turn and add its territories and named
+    coasts.
+    """
     season = validated_data['season']
     phase = validated_data['phase']
     year = validated_data['year']
@@ -43,55 +106,219 @@ def process_game_state(data):
     # Instantiate `State` for this turn
     state = State(season, phase, year)
 
-    # Initialise territory instances and register each to state. Add to
-    # territory map
+    # Initialise territory instances and register each to state
     for territory_data in validated_data['territories']:
         territory_type = territory_data.pop('type')
         territory_class = territory_type_dict[territory_type]
-        territory = territory_class(state, **territory_data)
-        territory_map[territory_data['id']] = territory
+        territory_class(state, **territory_data)
 
-    # Initialise named coasts - grab parent from territory map
+    # Initialise named coasts - grab parent from state
     for named_coast_data in validated_data['named_coasts']:
-        named_coast_data['parent'] = territory_map[named_coast_data['parent']]
-        named_coast = NamedCoast(state, **named_coast_data)
-        named_coast_map[named_coast.id] = named_coast
+        named_coast_data['parent'] = state.get_territory_by_id(named_coast_data['parent'])
+        NamedCoast(state, **named_coast_data)
+    return state
+
+
+def compile_map(data):
+    """
+    Compile the map of a variant so that turns of that variant can be
+    processed with `process_turn_state`.
+
+    Args:
+        * `data` - `dict` with `variant`, `territories` and `named_coasts`.
+          A full turn payload can also be given.
+
+    Returns:
+        * `str` - the content hash of the map, to be sent with each turn.
+    """
+    return map_cache.compile(data).content_hash
+
+
+def process_turn_state(data, trusted=False, instrument=False, trace=False):
+    """
+    Process a turn of a variant whose map has been compiled with
+    `compile_map`. Territories only need `id`, `controlled_by` and `contested`.
+    The turn must give the `map_hash` returned by `compile_map`.
+
+    Raises `UnknownMapException` if the map is not in the map cache. If
+    `trusted` is given the turn is not validated. `instrument` and `trace`
+    are as for `process_game_state`.
+    """
+    compiled_map, validated_data = load_turn_state(data, trusted)
+    state = create_turn_state(compiled_map, validated_data)
+    if instrument or trace:
+        state.instrumentation = Instrumentation(trace=trace)
+    return _process_turn(state, validated_data)
+
+
+def load_turn_state(data, trusted=False):
+    """
+    Validate a turn in the format of `TurnStateSchema` against the compiled
+    map it gives. Raises `UnknownMapException` if the map is not in the map
+    cache.
+
+    Returns:
+        * `tuple` of the `CompiledMap` and the validated turn data.
+    """
+    variant = data.get('variant', Variant.STANDARD)
+    compiled_map = map_cache.get(variant, data.get('map_hash'))
+    if compiled_map is None:
+        raise UnknownMapException(
+            f'Map {data.get("map_hash")} for variant {variant} has not been compiled.'
+        )
+
+    schema = TurnStateSchema()
+    schema.context['territory_ids'] = compiled_map.territory_ids
+    if trusted:
+        validated_data = schema.load_trusted(data)
+    else:
+        validated_data = schema.load(data)
+    return compiled_map, validated_data
 
-    # Initialise orders - grab source, target, aux, target_coast from maps
+
+def create_turn_state(compiled_map, validated_data):
+    """
+    Create the state for a validated turn of a compiled map, with the season,
+    phase and year of the turn and the state of each of its territories.
+    """
+    state = _map_state(compiled_map)
+    state.season = validated_data['season']
+    state.phase = validated_data['phase']
+    state.year = validated_data['year']
+
+    # Set the state of each territory this turn. The territories themselves
+    # are shared by every turn of the map.
+    for territory_state in validated_data['territories']:
+        map_territory = state.get_territory_by_id(territory_state['id'])
+        if territory_state.get('contested'):
+            state.contested.add(map_territory)
+        controlled_by = territory_state.get('controlled_by')
+        if controlled_by and not map_territory.is_sea:
+            state.controlled_by[map_territory] = controlled_by
+    return state
+
+
+def _map_state(compiled_map):
+    """
+    Get a state holding the territories and named coasts of a compiled map,
+    ready for the orders, pieces and nations of a turn.
+
+    The territories, named coasts and map graph are built once for each
+    compiled map and are shared by the state of every turn (see
+    `State.fork`).
+    """
+    if compiled_map.state is None:
+        state = State(None, None, None)
+        for territory_data in compiled_map.territories:
+            territory_class = territory_type_dict[territory_data['type']]
+            territory_class(
+                state,
+                territory_data['id'],
+                territory_data['name'],
+                nationality=territory_data['nationality'],
+                neighbours=territory_data['neighbours'],
+                shared_coasts=territory_data['shared_coasts'],
+                supply_center=territory_data['supply_center'],
+            )
+        for named_coast_data in compiled_map.named_coasts:
+            NamedCoast(
+                state,
+                named_coast_data['id'],
+                named_coast_data['name'],
+                state.get_territory_by_id(named_coast_data['parent']),
+                named_coast_data['neighbours'],
+            )
+        compiled_map.state = state
+    return compiled_map.state.fork(orders=False)
+
+
+def add_turn(state, validated_data):
+    """
+    Add the orders, pieces and nations of a validated turn to a state which
+    has its map.
+    """
+    # Initialise orders - grab source, target, aux, target_coast from state
     for order_data in validated_data['orders']:
-        order_type = order_data.pop('type')
-        order_class = order_type_dict[order_type]
-        for arg_name in ['source', 'target', 'aux']:
-            territory_id = order_data[arg_name]
-            if territory_id:
-                order_data[arg_name] = territory_map[territory_id]
-        target_coast_id = order_data['target_coast']
-        if target_coast_id:
-            order_data['target_coast'] = named_coast_map[target_coast_id]
-        order_class(state, **order_data)
+        create_order(state, order_data)
+
+    # Index orders by the territories they relate to now that all orders are
+    # registered
+    state.index_orders()
 
-    # Initialise pieces - grab source, target, aux, target_coast from maps
+    # Initialise pieces - grab territory, attacker_territory, named_coast from
+    # state
     for piece_data in validated_data['pieces']:
         piece_type = piece_data.pop('type')
         piece_class = piece_type_dict[piece_type]
         for arg_name in ['territory', 'attacker_territory']:
             territory_id = piece_data[arg_name]
             if territory_id:
-                piece_data[arg_name] = territory_map[territory_id]
+                piece_data[arg_name] = state.get_territory_by_id(territory_id)
         named_coast_id = piece_data['named_coast']
         if named_coast_id:
-            piece_data['named_coast'] = named_coast_map[named_coast_id]
+            piece_data['named_coast'] = state.get_named_coast_by_id(named_coast_id)
         piece_class(state, **piece_data)
 
+    # Index pieces by territory and bind each piece to its order
+    state.index_pieces()
+
     # Initialise nation instances and register each to state
     for nation_data in validated_data['nations']:
         Nation(state, **nation_data)
 
+
+def create_order(state, order_data):
+    """
+    Create an order from validated order data, grabbing source, target, aux
+    and target_coast from the state.
+    """
+    order_data = dict(order_data)
+    order_type = order_data.pop('type')
+    order_class = order_type_dict[order_type]
+    for arg_name in ['source', 'target', 'aux']:
+        territory_id = order_data[arg_name]
+        if territory_id:
+            order_data[arg_name] = state.get_territory_by_id(territory_id)
+    target_coast_id = order_data['target_coast']
+    if target_coast_id:
+        order_data['target_coast'] = state.get_named_coast_by_id(target_coast_id)
+    return order_class(state, **order_data)
+
+
+def load_order(state, data):
+    """
+    Validate order data in the format of `OrderSchema` against the
+    territories of a state.
+
+    Returns:
+        * `dict` - validated order data, to be given to `create_order`.
+    """
+    order_data = OrderSchema().load(data)
+    error_message = 'Territory id does not have a corresponding territory.'
+    errors = {}
+    for field_name in ['source', 'target', 'aux']:
+        territory_id = order_data[field_name]
+        if territory_id and not state.get_territory_by_id(territory_id):
+            errors[field_name] = [error_message]
+    if errors:
+        raise ValidationError(errors)
+    return order_data
+
+
+def _process_turn(state, validated_data):
+    """
+    Add the orders, pieces and nations of a turn to a state which has its map
+    and process the turn.
+    """
+    add_turn(state, validated_data)
+
     # Process game state
     process(state)
 
-    # Serialize processed game state and return
+    # Serialize processed game state and return. The turn id is included so
+    # that results can be matched to turns when processed in bulk.
     processed_data = TurnSchema().dump(state)
+    processed_data['id'] = validated_data['id']
     return processed_data
 
 
@@ -0,0 +1,15 @@
+"""
+Benchmarks of the adjudicator.
+
+Each benchmark case is a turn in the format of `TurnSchema`, taken from the
+DATC tests, from the recorded games in `order_histories`, from synthetic
+stress boards or from large generated variants (see `variant`), and is
+processed with `process_game_state`. Run with:
+
+    python -m adjudicator.benchmarks [-o results.json] [--compare baseline.json]
+
+The wall time, decision evaluation count and peak memory of each case are
+printed and optionally written to a JSON file. With `--compare` the results
+are checked against an earlier JSON file and the command exits with status 1
+if any case has regressed.
+"""
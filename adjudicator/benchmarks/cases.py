@@ -0,0 +1,248 @@
+"""
+The turns which are benchmarked, as `TurnSchema` payloads so that each case
+is processed with `process_game_state` exactly as a turn of a real game.
+"""
+import importlib
+import os
+import pkgutil
+import unittest
+
+from adjudicator.base import PieceType, TerritoryType
+
+from . import standard, stress, variant
+
+
+class Case:
+    """
+    A turn to benchmark.
+
+    * `name` - `str` - unique name of the case.
+    * `group` - `str` - one of `datc`, `game`, `stress` or `variant`.
+    * `data` - `dict` - turn data in the format of `TurnSchema`.
+    * `trusted` - `bool` - process the turn without validation, for turns
+      which are not valid for their phase, as in some DATC cases.
+    """
+
+    def __init__(self, name, group, data, trusted=False):
+        self.name = name
+        self.group = group
+        self.data = data
+        self.trusted = trusted
+
+    def __repr__(self):
+        return f'Case({self.name!r})'
+
+
+def _id(item):
+    return None if item is None else str(item.id)
+
+
+def _nation(nation):
+    return None if nation is None else str(nation)
+
+
+def territory_type(territory):
+    if territory.is_sea:
+        return TerritoryType.SEA
+    if territory.is_coastal:
+        return TerritoryType.COASTAL
+    return TerritoryType.INLAND
+
+
+def turn_from_state(state):
+    """
+    Get the turn data of a state which has not been processed, in the format
+    of `TurnSchema`. Ids are given as strings. Pieces and orders are numbered
+    from one, as states built by hand may repeat ids.
+
+    Args:
+        * `state` - `State`
+
+    Returns:
+        * `dict`
+    """
+    from adjudicator import order_type_dict
+
+    order_types = {v: k for k, v in order_type_dict.items()}
+    nations = {_nation(n.id) for n in state.nations}
+
+    territories = []
+    for territory in state.territories:
+        data = {
+            'id': _id(territory),
+            'type': territory_type(territory),
+            'name': territory.name,
+            'neighbours': [str(i) for i in territory.neighbour_ids],
+            'contested': territory in state.contested,
+        }
+        if not territory.is_sea:
+            data['nationality'] = _nation(territory.nationality)
+            data['controlled_by'] = _nation(state.controlled_by.get(territory))
+            data['supply_center'] = territory.supply_center
+            nations.update([data['nationality'], data['controlled_by']])
+        if territory.is_coastal:
+            data['shared_coasts'] = [str(i) for i in territory.shared_coast_ids]
+        territories.append(data)
+
+    named_coasts = [
+        {
+            'id': _id(named_coast),
+            'name': named_coast.name,
+            'parent': _id(named_coast.parent),
+            'neighbours': [str(i) for i in named_coast.neighbour_ids],
+        }
+        for named_coast in state.named_coasts
+    ]
+
+    pieces = []
+    for i, piece in enumerate(state.pieces, 1):
+        pieces.append({
+            'id': i,
+            'type': PieceType.FLEET if piece.is_fleet else PieceType.ARMY,
+            'nation': _nation(piece.nation),
+            'territory': _id(piece.territory),
+            'named_coast': _id(getattr(piece, 'named_coast', None)),
+            'retreating': piece.retreating,
+            'attacker_territory': _id(piece.attacker_territory),
+        })
+        nations.add(_nation(piece.nation))
+
+    orders = []
+    for order in state.orders:
+        order_type = order_types.get(type(order))
+        if order_type is None:
+            continue
+        data = {
+            'id': len(orders) + 1,
+            'type': order_type,
+            'nation': _nation(order.nation),
+            'source': _id(order.source),
+        }
+        if order.is_move or order.is_retreat:
+            data['target'] = _id(order.target)
+            data['target_coast'] = _id(order.target_coast)
+        if order.is_move:
+            data['via_convoy'] = order.via_convoy
+        if order.is_support or order.is_convoy:
+            data['aux'] = _id(order.aux)
+            data['target'] = _id(order.target)
+        if order.is_build:
+            data['piece_type'] = order.piece_type
+            data['target_coast'] = _id(order.named_coast)
+        orders.append(data)
+        nations.add(_nation(order.nation))
+
+    nations.discard(None)
+    return {
+        'id': 1,
+        'season': state.season,
+        'phase': state.phase,
+        'year': state.year,
+        'territories': territories,
+        'named_coasts': named_coasts,
+        'nations': [{'id': n, 'name': n} for n in sorted(nations)],
+        'pieces': pieces,
+        'orders': orders,
+    }
+
+
+def _tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _tests(test)
+        else:
+            yield test
+
+
+def datc_cases():
+    """
+    Capture the turn of each DATC test case. Each test is run with the
+    `process` of its module replaced by a function which records the state
+    before processing it. Turns which cannot be processed, e.g. in tests
+    which expect an error, are left out.
+
+    The DATC tests give orders of any type in the order phase, so these cases
+    are processed without validation.
+    """
+    from adjudicator.tests import datc
+
+    cases = []
+    loader = unittest.TestLoader()
+    for module_info in pkgutil.iter_modules(datc.__path__):
+        if not module_info.name.startswith('test_'):
+            continue
+        module = importlib.import_module(f'{datc.__name__}.{module_info.name}')
+        process = module.process
+        for test in _tests(loader.loadTestsFromModule(module)):
+            turns = []
+
+            def capture(state):
+                data = turn_from_state(state)
+                result = process(state)
+                turns.append(data)
+                return result
+
+            module.process = capture
+            try:
+                test.run(unittest.TestResult())
+            finally:
+                module.process = process
+            name = test.id().replace('adjudicator.tests.', '')
+            for i, data in enumerate(turns):
+                suffix = f'[{i}]' if len(turns) > 1 else ''
+                cases.append(Case(name + suffix, 'datc', data, trusted=True))
+    return cases
+
+
+def game_cases():
+    """
+    The turns of each recorded game in `order_histories`.
+    """
+    if not os.path.isdir(standard.ORDER_HISTORIES_DIR):
+        return []
+    cases = []
+    for game in sorted(os.listdir(standard.ORDER_HISTORIES_DIR)):
+        directory = os.path.join(standard.ORDER_HISTORIES_DIR, game)
+        for name, data in standard.game_turns(directory):
+            cases.append(Case(f'{game}/{name}', 'game', data))
+    return cases
+
+
+def stress_cases(sizes=stress.STRESS_SIZES):
+    return [
+        Case(f'{name}-{size}', 'stress', board(size))
+        for name, board in stress.STRESS_BOARDS.items()
+        for size in sizes
+    ]
+
+
+def variant_cases(sizes=variant.VARIANT_SIZES, seed=variant.VARIANT_SEED):
+    """
+    Generated variants of increasing size, to track how adjudication time
+    grows with the size of the map.
+    """
+    return [
+        Case(f'variant-{size}-{players}', 'variant', variant.generate_turn(size, players, seed))
+        for size, players in sizes
+    ]
+
+
+CASE_GROUPS = {
+    'datc': datc_cases,
+    'game': game_cases,
+    'stress': stress_cases,
+    'variant': variant_cases,
+}
+
+
+def all_cases(groups=None):
+    """
+    Get the cases of the given groups, or of every group.
+
+    Returns:
+        * `list` of `Case`
+    """
+    cases = []
+    for group in groups or CASE_GROUPS:
+        cases += CASE_GROUPS[group]()
+    return cases
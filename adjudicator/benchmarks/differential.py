@@ -0,0 +1,398 @@
+"""
+Differential testing of alternative resolvers against the reference
+adjudicator, `process_game_state`.
+
+Each turn is processed by both and every order outcome and illegal code,
+every piece's dislodgement and every territory's `bounce_occurred` and
+`captured_by` are compared. Each turn which does not match is shrunk to a
+minimal reproducer, which is printed. Run with:
+
+    python -m adjudicator.benchmarks.differential RESOLVER [--random N]
+
+`RESOLVER` is the name of a built-in alternative (see `ALTERNATIVES`) or
+`module:function` for a function taking turn data and `trusted` and
+returning the processed turn.
+"""
+import argparse
+import importlib
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from adjudicator import process_game_state
+
+from .cases import CASE_GROUPS, all_cases
+from .variant import generate_turn
+
+# The fields compared for each kind of item in a processed turn.
+COMPARED_FIELDS = {
+    'orders': ['outcome', 'illegal_code'],
+    'pieces': ['dislodged', 'dislodged_by', 'dislodged_from'],
+    'territories': ['bounce_occurred', 'captured_by'],
+}
+
+
+def process_with_clusters(data, trusted=False):
+    """
+    Resolve each cluster of orders of a turn as a batch of its own and merge
+    the results, as `process_turn_clusters` does with many workers.
+    """
+    from adjudicator import (
+        add_turn, compile_map, create_turn_state, load_turn_state
+    )
+    from adjudicator.cluster import find_data_clusters
+    from adjudicator.parallel import (
+        cluster_batch, merge_cluster_results, resolve_clusters
+    )
+    from adjudicator.processor import conclude
+    from adjudicator.schema import TurnSchema
+
+    map_hash = compile_map(data)
+    turn_data = {k: v for k, v in data.items() if k != 'named_coasts'}
+    turn_data['map_hash'] = map_hash
+    compiled_map, validated_data = load_turn_state(turn_data, trusted)
+    clusters = find_data_clusters(
+        validated_data['orders'], validated_data['pieces']
+    )
+    results = [
+        resolve_clusters(
+            compiled_map.variant, map_hash,
+            cluster_batch(validated_data, [cluster]),
+        )
+        for cluster in clusters
+    ]
+    state = create_turn_state(compiled_map, validated_data)
+    add_turn(state, validated_data)
+    merge_cluster_results(state, results)
+    conclude(state)
+    processed_data = TurnSchema().dump(state)
+    processed_data['id'] = validated_data['id']
+    return processed_data
+
+
+def process_with_session(data, trusted=False):
+    """
+    Process a turn without its orders in a `Session` and add its orders one
+    at a time.
+    """
+    from adjudicator.session import Session
+
+    session = Session({**data, 'orders': []}, trusted=trusted)
+    for order in data['orders']:
+        session.add_order(order)
+    return session.dump()
+
+
+def process_with_cache(data, trusted=False):
+    """
+    Process a turn in its canonical form, through a result cache.
+    """
+    from adjudicator.result_cache import MemoryResultCache
+
+    return process_game_state(data, trusted, cache=MemoryResultCache())
+
+
+def process_with_compiled_map(data, trusted=False):
+    """
+    Process a turn with the compiled map of its variant.
+    """
+    from adjudicator.parallel import _process
+
+    return _process(data, trusted)
+
+
+ALTERNATIVES = {
+    'clusters': process_with_clusters,
+    'session': process_with_session,
+    'cache': process_with_cache,
+    'compiled': process_with_compiled_map,
+}
+
+
+def get_resolver(spec):
+    """
+    Get a resolver from the name of a built-in alternative or a
+    `module:function` path.
+    """
+    if spec in ALTERNATIVES:
+        return ALTERNATIVES[spec]
+    module_name, _, function_name = spec.partition(':')
+    if not function_name:
+        raise ValueError(
+            f'Unknown resolver {spec!r}. Use one of {", ".join(ALTERNATIVES)} '
+            'or module:function.'
+        )
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+class Mismatch:
+    """
+    A field of a processed turn which differs between the reference and an
+    alternative resolver.
+
+    * `collection` - `str` - `orders`, `pieces`, `territories` or `error`.
+    * `id` - id of the item.
+    * `field` - `str`
+    * `expected` - value from the reference.
+    * `actual` - value from the alternative.
+    """
+
+    def __init__(self, collection, id, field, expected, actual):
+        self.collection = collection
+        self.id = id
+        self.field = field
+        self.expected = expected
+        self.actual = actual
+
+    @property
+    def kind(self):
+        return self.collection, self.field
+
+    def __eq__(self, other):
+        return isinstance(other, Mismatch) and vars(self) == vars(other)
+
+    def __repr__(self):
+        return (
+            f'{self.collection} {self.id} {self.field}: '
+            f'expected {self.expected!r}, got {self.actual!r}'
+        )
+
+
+def compare_results(expected, actual):
+    """
+    Compare the processed turn of the reference with that of an alternative.
+
+    Returns:
+        * `list` of `Mismatch`
+    """
+    mismatches = []
+    for collection, fields in COMPARED_FIELDS.items():
+        actual_items = {i['id']: i for i in actual.get(collection, [])}
+        for item in expected[collection]:
+            other = actual_items.get(item['id'], {})
+            for field in fields:
+                if item.get(field) != other.get(field):
+                    mismatches.append(Mismatch(
+                        collection, item['id'], field, item.get(field), other.get(field)
+                    ))
+    return mismatches
+
+
+def check_turn(data, resolver, trusted=False):
+    """
+    Process a turn with the reference and with an alternative resolver.
+
+    Returns:
+        * `list` of `Mismatch`, or `None` if the reference cannot process the
+          turn. An exception raised by the alternative is a mismatch.
+    """
+    try:
+        expected = process_game_state(data, trusted=trusted)
+    except Exception:
+        return None
+    try:
+        actual = resolver(data, trusted=trusted)
+    except Exception as e:
+        return [Mismatch('error', None, 'exception', None, f'{type(e).__name__}: {e}')]
+    return compare_results(expected, actual)
+
+
+def minimize(data, resolver, mismatches, trusted=False):
+    """
+    Shrink a turn which does not match to a smaller turn which still has a
+    mismatch of one of the same kinds. Orders and then pieces are removed in
+    chunks of decreasing size, until no single order or piece can be removed,
+    then territories which nothing refers to.
+    Pieces and orders keep their ids, so they can be matched with those of
+    the original turn.
+
+    Returns:
+        * `dict` - the minimized turn.
+    """
+    kinds = {m.kind for m in mismatches}
+
+    def fails(candidate):
+        found = check_turn(candidate, resolver, trusted)
+        return bool(found) and any(m.kind in kinds for m in found)
+
+    # Checks are quicker on a smaller map, so first try to drop the
+    # territories far from any piece or order.
+    candidate = _prune_map(data, 1)
+    if fails(candidate):
+        data = candidate
+    # Removing one item can let another be removed, so single items are
+    # tried until none can be removed.
+    changed = True
+    while changed:
+        changed = False
+        for key in ['orders', 'pieces']:
+            items = data[key]
+            chunk = max(len(items) // 2, 1)
+            while items:
+                removed = False
+                i = 0
+                while i < len(items):
+                    candidate = {**data, key: items[:i] + items[i + chunk:]}
+                    if fails(candidate):
+                        data = candidate
+                        items = candidate[key]
+                        removed = changed = True
+                    else:
+                        i += chunk
+                if chunk == 1 and not removed:
+                    break
+                chunk = max(chunk // 2, 1)
+
+    for ring in [0, 1]:
+        candidate = _prune_map(data, ring)
+        if fails(candidate):
+            return candidate
+    return data
+
+
+def _prune_map(data, ring):
+    """
+    Remove the territories which the pieces and orders of a turn do not refer
+    to and which are more than `ring` moves from those which they do.
+    """
+    kept = set()
+    for piece in data['pieces']:
+        kept.update([piece['territory'], piece.get('attacker_territory')])
+    for order in data['orders']:
+        kept.update([order['source'], order.get('target'), order.get('aux')])
+    kept.discard(None)
+    neighbours = {t['id']: t['neighbours'] for t in data['territories']}
+    for _ in range(ring):
+        kept.update(n for t in list(kept) for n in neighbours.get(t, []))
+
+    territories = [
+        {
+            **t,
+            'neighbours': [n for n in t['neighbours'] if n in kept],
+            'shared_coasts': [n for n in t.get('shared_coasts', []) if n in kept],
+        }
+        for t in data['territories'] if t['id'] in kept
+    ]
+    named_coasts = [
+        {**n, 'neighbours': [t for t in n['neighbours'] if t in kept]}
+        for n in data['named_coasts'] if n['parent'] in kept
+    ]
+    return {**data, 'territories': territories, 'named_coasts': named_coasts}
+
+
+def format_reproducer(name, data, mismatches):
+    """
+    Describe a mismatch and the turn which reproduces it.
+    """
+    lines = [f'Mismatch in {name}:']
+    lines += [f'  {m!r}' for m in mismatches]
+    lines.append(json.dumps(data, sort_keys=True))
+    return '\n'.join(lines)
+
+
+def random_turn(seed, max_size=60):
+    """
+    A small generated variant with a random number of territories and
+    players. Small turns are quick to check, so many can be checked, and are
+    quick to minimize.
+    """
+    rng = random.Random(seed)
+    size = rng.randint(12, max_size)
+    sea_fraction = rng.uniform(0.2, 0.5)
+    # Each player needs a land territory for its capital.
+    land = size - round(size * sea_fraction)
+    players = rng.randint(2, min(7, land // 2))
+    return generate_turn(
+        size, players, seed=seed, sea_fraction=sea_fraction,
+        occupancy=rng.uniform(0.3, 0.9),
+    )
+
+
+def _check_random_turn(args):
+    seed, spec, max_size = args
+    data = random_turn(seed, max_size)
+    return seed, check_turn(data, get_resolver(spec))
+
+
+def check_random_turns(spec, count, seed=0, max_size=60, workers=1):
+    """
+    Check random turns against the reference, across a pool of worker
+    processes if there is more than one worker.
+
+    Args:
+        * `spec` - `str` - the resolver, as given to `get_resolver`.
+        * `count` - `int` - number of turns.
+        * `[seed]` - `int` - seed of the first turn. Turn `i` has seed
+          `seed + i`.
+        * `[max_size]` - `int` - most territories in a turn.
+        * `[workers]` - `int` - number of worker processes.
+
+    Yields:
+        * `(seed, mismatches)` for each turn.
+    """
+    tasks = ((s, spec, max_size) for s in range(seed, seed + count))
+    if workers == 1:
+        yield from map(_check_random_turn, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_check_random_turn, tasks, chunksize=64)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m adjudicator.benchmarks.differential',
+        description='Compare a resolver with the reference adjudicator.',
+    )
+    parser.add_argument(
+        'resolver',
+        help=f'one of {", ".join(ALTERNATIVES)} or module:function',
+    )
+    parser.add_argument(
+        '--group', action='append', choices=list(CASE_GROUPS),
+        help='check the cases of this group. Defaults to every group.',
+    )
+    parser.add_argument('--filter', default='', help='only check cases whose name contains this')
+    parser.add_argument('--random', type=int, default=1000, help='number of random turns to check')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first random turn')
+    parser.add_argument('--max-size', type=int, default=60, help='most territories in a random turn')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='worker processes for random turns')
+    args = parser.parse_args(argv)
+
+    resolver = get_resolver(args.resolver)
+    checked = 0
+    failures = 0
+
+    def report(name, data, mismatches, trusted=False):
+        data = minimize(data, resolver, mismatches, trusted)
+        mismatches = check_turn(data, resolver, trusted)
+        print(format_reproducer(name, data, mismatches))
+
+    for case in all_cases(args.group):
+        if args.filter not in case.name:
+            continue
+        mismatches = check_turn(case.data, resolver, case.trusted)
+        if mismatches is None:
+            continue
+        checked += 1
+        if mismatches:
+            failures += 1
+            report(case.name, case.data, mismatches, case.trusted)
+
+    results = check_random_turns(
+        args.resolver, args.random, args.seed, args.max_size, args.workers
+    )
+    for seed, mismatches in results:
+        if mismatches is None:
+            continue
+        checked += 1
+        if mismatches:
+            failures += 1
+            report(f'random turn {seed}', random_turn(seed, args.max_size), mismatches)
+
+    print(f'Checked {checked} turns, {failures} did not match.')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from adjudicator import process_game_state
+
+from .cases import CASE_GROUPS, all_cases
+
+# Metrics compared with a baseline and whether any increase is a regression,
+# rather than only an increase beyond the threshold.
+COMPARED_METRICS = {
+    'min_time': False,
+    'peak_memory': False,
+    'evaluations': True,
+}
+
+
+def run_case(case, repeat=5):
+    """
+    Benchmark a case. The case is processed `repeat` times to time it, then
+    once instrumented to count evaluations and once to measure its peak
+    memory use, so that neither measurement slows the timed runs.
+
+    Returns:
+        * `dict`
+    """
+    def process(**kwargs):
+        return process_game_state(case.data, trusted=case.trusted, **kwargs)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process()
+        times.append(time.perf_counter() - start)
+
+    counts = process(instrument=True)['instrumentation']
+
+    tracemalloc.start()
+    try:
+        process()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'group': case.group,
+        'time': statistics.median(times),
+        'min_time': min(times),
+        'evaluations': counts['evaluations'],
+        'decisions': sum(counts['decisions'].values()),
+        'convoy_searches': counts['convoy_searches'],
+        'peak_memory': peak_memory,
+        'orders': len(case.data['orders']),
+    }
+
+
+def run(cases, repeat=5):
+    """
+    Benchmark each case.
+
+    Returns:
+        * `dict` - results in the format written by `main`.
+    """
+    results = {case.name: run_case(case, repeat) for case in cases}
+    totals = {}
+    for result in results.values():
+        total = totals.setdefault(
+            result['group'], {'cases': 0, 'time': 0, 'evaluations': 0}
+        )
+        total['cases'] += 1
+        total['time'] += result['time']
+        total['evaluations'] += result['evaluations']
+    return {
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'cases': results,
+        'totals': totals,
+    }
+
+
+def compare(baseline, results, threshold=0.1):
+    """
+    Find the cases which have regressed since a baseline. Times and memory
+    regress when they grow by more than `threshold`, as a fraction of the
+    baseline. Evaluation counts are deterministic, so any increase is a
+    regression. Cases which are not in the baseline are ignored.
+
+    Returns:
+        * `list` of `(case_name, metric, baseline_value, value)`
+    """
+    regressions = []
+    for name, result in results['cases'].items():
+        old = baseline['cases'].get(name)
+        if old is None:
+            continue
+        for metric, exact in COMPARED_METRICS.items():
+            if metric not in old:
+                continue
+            limit = old[metric] if exact else old[metric] * (1 + threshold)
+            if result[metric] > limit:
+                regressions.append((name, metric, old[metric], result[metric]))
+    return regressions
+
+
+def print_results(results, baseline=None, file=None):
+    file = file or sys.stdout
+    width = max([len(name) for name in results['cases']] + [4])
+    print(
+        f'{"case":<{width}}  {"time (ms)":>10}  {"evaluations":>11}  '
+        f'{"peak (KiB)":>10}',
+        file=file,
+    )
+    for name, result in results['cases'].items():
+        line = (
+            f'{name:<{width}}  {result["time"] * 1000:>10.3f}  '
+            f'{result["evaluations"]:>11}  {result["peak_memory"] / 1024:>10.1f}'
+        )
+        old = (baseline or {}).get('cases', {}).get(name)
+        if old:
+            line += f'  {result["time"] / old["time"]:>6.2f}x'
+        print(line, file=file)
+    for group, total in results['totals'].items():
+        print(
+            f'{group}: {total["cases"]} cases, {total["time"] * 1000:.1f} ms, '
+            f'{total["evaluations"]} evaluations',
+            file=file,
+        )
+
+
+def main(argv=None, file=None):
+    file = file or sys.stdout
+    parser = argparse.ArgumentParser(
+        prog='python -m adjudicator.benchmarks',
+        description='Benchmark the adjudicator.',
+    )
+    parser.add_argument('-o', '--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare the results with this JSON file')
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='fraction by which time and memory may grow before regressing',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--group', action='append', choices=list(CASE_GROUPS),
+        help='only run the cases of this group',
+    )
+    parser.add_argument('--filter', default='', help='only run cases whose name contains this')
+    args = parser.parse_args(argv)
+
+    cases = [c for c in all_cases(args.group) if args.filter in c.name]
+    results = run(cases, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline, file=file)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(baseline, results, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f'Regression: {name} {metric} {old} -> {new}', file=file)
+        return 1 if regressions else 0
+    return 0
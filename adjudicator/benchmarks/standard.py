@@ -0,0 +1,328 @@
+"""
+Turns of the standard variant, built from the fixtures of the `core` app and
+the recorded games in `order_histories`.
+
+The recorded games list the orders of each turn in the text format of
+playdiplomacy.com, e.g.:
+
+    ENGLAND
+    Edinburgh MOVE Norwegian Sea -> resolved
+    North Sea SUPPORT Norwegian Sea to Norway -> resolved
+    BUILD fleet St. Petersburg (North Coast) -> resolved
+
+Each turn is processed in order and the position of the next turn is built
+from the processed turn, in the same way as `core.game`.
+"""
+import json
+import os
+import re
+
+from adjudicator.base import OrderType, Phase, Variant
+from adjudicator.decisions import Outcomes
+
+REPO_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+STANDARD_FIXTURES_DIR = os.path.join(REPO_DIR, 'core', 'fixtures', 'prod', 'standard')
+ORDER_HISTORIES_DIR = os.path.join(REPO_DIR, 'order_histories')
+
+# Names used in recorded games which differ from the names of the map.
+NAME_ALIASES = {
+    'skagerrack': 'skagerrak',
+}
+
+FILENAME_REGEX = re.compile(
+    r'^\d+_(?P<season>spring|fall)_(?P<year>\d{4})_(?P<phase>[a-z_]+)$'
+)
+PHASES = {
+    'order': Phase.ORDER,
+    'retreat_and_disband': Phase.RETREAT,
+    'build': Phase.BUILD,
+}
+
+PLACE = r'[^()]+?(?: \([A-Za-z]+ Coast\))?'
+ORDER_REGEXES = [
+    re.compile(rf'^BUILD (?P<piece_type>army|fleet) (?P<source>{PLACE}) ->'),
+    re.compile(rf'^(?P<source>{PLACE}) (?P<type>MOVE|RETREAT) (?P<target>{PLACE}) ->'),
+    re.compile(
+        rf'^(?P<source>{PLACE}) (?P<type>SUPPORT|SPPORT|CONVOY) '
+        rf'(?P<aux>{PLACE}) to (?P<target>{PLACE}) ->'
+    ),
+    re.compile(rf'^(?P<source>{PLACE}) (?P<type>HOLD|DISBAND|DESTROY) ->'),
+]
+ORDER_TYPES = {
+    'MOVE': OrderType.MOVE,
+    'RETREAT': OrderType.RETREAT,
+    'SUPPORT': OrderType.SUPPORT,
+    'SPPORT': OrderType.SUPPORT,
+    'CONVOY': OrderType.CONVOY,
+    'HOLD': OrderType.HOLD,
+    'DISBAND': OrderType.DISBAND,
+    'DESTROY': OrderType.DISBAND,
+}
+
+
+def _load_fixture(name):
+    with open(os.path.join(STANDARD_FIXTURES_DIR, f'{name}.json')) as f:
+        return json.load(f)
+
+
+def load_standard_map():
+    """
+    Load the territories, named coasts, nations and starting pieces of the
+    standard variant.
+
+    Returns:
+        * `dict` with `territories`, `named_coasts`, `nations` and `pieces`
+          in the format of `TurnSchema`.
+    """
+    nations = {n['pk']: n['fields'] for n in _load_fixture('nation')}
+    territories = {t['pk']: t['fields'] for t in _load_fixture('territory')}
+    named_coasts = _load_fixture('named_coast')
+
+    def nation_id(pk):
+        return nations[pk]['id'] if pk else None
+
+    data = {
+        'nations': [
+            {'id': n['id'], 'name': n['name']} for n in nations.values()
+        ],
+        'territories': [
+            {
+                'id': t['id'],
+                'type': t['type'],
+                'name': t['name'],
+                'nationality': nation_id(t['nationality']),
+                'controlled_by': nation_id(t['controlled_by_initial']),
+                'supply_center': t['supply_center'],
+                'neighbours': [territories[pk]['id'] for pk in t['neighbours']],
+                'shared_coasts': [territories[pk]['id'] for pk in t['shared_coasts']],
+            }
+            for t in territories.values()
+        ],
+        'named_coasts': [
+            {
+                'id': n['pk'],
+                'name': n['fields']['name'],
+                'parent': territories[n['fields']['parent']]['id'],
+                'neighbours': [
+                    territories[pk]['id'] for pk in n['fields']['neighbours']
+                ],
+            }
+            for n in named_coasts
+        ],
+        'pieces': [],
+    }
+    starting_coasts = {
+        territories[n['fields']['parent']]['id']: n['pk']
+        for n in named_coasts if n['fields']['piece_starts_here']
+    }
+    for t in territories.values():
+        if t['initial_piece_type']:
+            data['pieces'].append({
+                'id': len(data['pieces']) + 1,
+                'type': t['initial_piece_type'],
+                'nation': nation_id(t['nationality']),
+                'territory': t['id'],
+                'named_coast': starting_coasts.get(t['id']),
+            })
+    return data
+
+
+class OrderParser:
+    """
+    Parses the orders of a recorded turn into order data in the format of
+    `OrderSchema`.
+
+    Args:
+        * `map_data` - `dict` returned by `load_standard_map`.
+    """
+
+    def __init__(self, map_data):
+        self.territories = {t['name']: t['id'] for t in map_data['territories']}
+        self.named_coasts = {n['name']: n for n in map_data['named_coasts']}
+        self.neighbours = {
+            t['id']: set(t['neighbours']) for t in map_data['territories']
+        }
+        self.nations = {
+            n['name'].split('-')[0].upper(): n['id'] for n in map_data['nations']
+        }
+
+    def place(self, text):
+        """
+        Get the territory id and named coast id of a place, e.g.
+        'Spain (South Coast)'.
+        """
+        name = text.lower()
+        coast = None
+        if name.endswith(' coast)'):
+            name, coast = name[:-1].split(' (')
+        name = NAME_ALIASES.get(name, name)
+        if coast:
+            return self.named_coasts[f'{name} {coast}']['parent'], \
+                self.named_coasts[f'{name} {coast}']['id']
+        return self.territories[name], None
+
+    def parse(self, text, pieces, phase):
+        """
+        Parse the orders of a turn.
+
+        Args:
+            * `text` - `str` - the recorded orders.
+            * `pieces` - `list` of the pieces of the turn, used to tell
+              convoyed moves from other moves.
+            * `phase` - `str`
+
+        Returns:
+            * `list` of `dict`
+        """
+        armies = {
+            p['territory'] for p in pieces if p['type'] == 'army'
+            and p.get('retreating', False) == (phase == Phase.RETREAT)
+        }
+        orders = []
+        nation = None
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.upper() == line and line in self.nations:
+                nation = self.nations[line]
+                continue
+            match = next(filter(None, (r.match(line) for r in ORDER_REGEXES)), None)
+            if match is None:
+                raise ValueError(f'Could not parse order: {line!r}')
+            fields = match.groupdict()
+            source, source_coast = self.place(fields['source'])
+            order = {
+                'id': len(orders) + 1,
+                'nation': nation,
+                'source': source,
+            }
+            if 'piece_type' in fields:
+                order['type'] = OrderType.BUILD
+                order['piece_type'] = fields['piece_type']
+                order['target_coast'] = source_coast
+                orders.append(order)
+                continue
+            order['type'] = ORDER_TYPES[fields['type']]
+            if fields.get('aux'):
+                order['aux'], _ = self.place(fields['aux'])
+            if fields.get('target') == 'hold':
+                order['target'] = order['aux']
+            elif fields.get('target'):
+                order['target'], order['target_coast'] = self.place(fields['target'])
+            if order['type'] == OrderType.MOVE and source in armies \
+                    and order['target'] not in self.neighbours[source]:
+                order['via_convoy'] = True
+            orders.append(order)
+        return orders
+
+
+def next_position(turn, result):
+    """
+    Get the pieces and territory states of the turn after a processed turn.
+
+    Returns:
+        * `tuple` - `list` of pieces and `dict` of the `controlled_by` and
+          `contested` of each territory, keyed by territory id.
+    """
+    piece_results = {p['id']: p for p in result['pieces']}
+    outcomes = {o['id']: Outcomes.code(o['outcome']) for o in result['orders']}
+    retreat_phase = turn['phase'] == Phase.RETREAT
+
+    orders = {}
+    for order in turn['orders']:
+        orders[(order['source'], order['nation'])] = order
+
+    pieces = []
+    for piece in turn['pieces']:
+        piece_result = piece_results[piece['id']]
+        if piece_result['destroyed']:
+            continue
+        if retreat_phase and not piece.get('retreating'):
+            order = None
+        else:
+            order = orders.get((piece['territory'], piece['nation']))
+        succeeded = order and outcomes[order['id']] == Outcomes.SUCCEEDS
+        if succeeded and order['type'] == OrderType.DISBAND:
+            continue
+        piece = {
+            **piece,
+            'retreating': bool(piece_result['dislodged']),
+            'attacker_territory': piece_result['dislodged_from'],
+        }
+        if succeeded and order['type'] in [OrderType.MOVE, OrderType.RETREAT]:
+            piece['territory'] = order['target']
+            piece['named_coast'] = order.get('target_coast')
+        pieces.append(piece)
+
+    next_id = max([p['id'] for p in turn['pieces']], default=0) + 1
+    for order in turn['orders']:
+        if order['type'] == OrderType.BUILD and outcomes[order['id']] == Outcomes.SUCCEEDS:
+            pieces.append({
+                'id': next_id,
+                'type': order['piece_type'],
+                'nation': order['nation'],
+                'territory': order['source'],
+                'named_coast': order.get('target_coast'),
+            })
+            next_id += 1
+
+    territory_results = {t['id']: t for t in result['territories']}
+    territory_states = {}
+    for territory in turn['territories']:
+        territory_result = territory_results[territory['id']]
+        territory_states[territory['id']] = {
+            'controlled_by': territory_result.get('captured_by')
+            or territory.get('controlled_by'),
+            'contested': territory_result['bounce_occurred'],
+        }
+    return pieces, territory_states
+
+
+def game_turns(directory):
+    """
+    Build the turns of a recorded game by processing each turn in order.
+
+    Args:
+        * `directory` - `str` - directory holding one file of orders for each
+          turn, named like `01_spring_1901_order`.
+
+    Returns:
+        * `list` of `(name, turn)` pairs, where `turn` is in the format of
+          `TurnSchema`.
+    """
+    from adjudicator import process_game_state
+
+    map_data = load_standard_map()
+    parser = OrderParser(map_data)
+    pieces = map_data['pieces']
+    territory_states = {}
+    turns = []
+    for i, filename in enumerate(sorted(os.listdir(directory)), 1):
+        match = FILENAME_REGEX.match(filename)
+        if not match:
+            continue
+        with open(os.path.join(directory, filename)) as f:
+            text = f.read()
+        phase = PHASES[match['phase']]
+        turn = {
+            'id': i,
+            'variant': Variant.STANDARD,
+            'season': match['season'],
+            'phase': phase,
+            'year': int(match['year']),
+            'territories': [
+                {**t, **territory_states.get(t['id'], {})}
+                for t in map_data['territories']
+            ],
+            'named_coasts': map_data['named_coasts'],
+            'nations': map_data['nations'],
+            'pieces': pieces,
+            'orders': parser.parse(text, pieces, phase),
+        }
+        turns.append((filename, turn))
+        result = process_game_state(turn)
+        pieces, territory_states = next_position(turn, result)
+    return turns
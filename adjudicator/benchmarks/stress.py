@@ -0,0 +1,154 @@
+"""
+Synthetic turns which stress parts of the adjudicator which the standard map
+rarely reaches: large rotations, territories with many supports and long
+convoy chains.
+"""
+from adjudicator.base import OrderType, Phase, PieceType, Season, TerritoryType
+
+
+def _turn(territories, pieces, orders, nations):
+    return {
+        'id': 1,
+        'season': Season.SPRING,
+        'phase': Phase.ORDER,
+        'year': 1901,
+        'territories': territories,
+        'named_coasts': [],
+        'nations': [{'id': n, 'name': n} for n in nations],
+        'pieces': pieces,
+        'orders': orders,
+    }
+
+
+def _territory(id, type, neighbours, shared_coasts=()):
+    territory = {'id': id, 'type': type, 'name': id, 'neighbours': list(neighbours)}
+    if type == TerritoryType.COASTAL:
+        territory['shared_coasts'] = list(shared_coasts)
+    return territory
+
+
+def rotation(size):
+    """
+    A ring of `size` inland territories, each holding an army which moves to
+    the next territory of the ring.
+    """
+    ids = [f'ring-{i}' for i in range(size)]
+    territories = [
+        _territory(id, TerritoryType.INLAND, [ids[i - 1], ids[(i + 1) % size]])
+        for i, id in enumerate(ids)
+    ]
+    nations = [f'nation-{i}' for i in range(min(size, 7))]
+    pieces = []
+    orders = []
+    for i, id in enumerate(ids):
+        nation = nations[i % len(nations)]
+        pieces.append({'id': i + 1, 'type': PieceType.ARMY, 'nation': nation, 'territory': id})
+        orders.append({
+            'id': i + 1, 'type': OrderType.MOVE, 'nation': nation,
+            'source': id, 'target': ids[(i + 1) % size],
+        })
+    return _turn(territories, pieces, orders, nations)
+
+
+def supports(size):
+    """
+    A hub territory surrounded by `size` territories. An army attacks the
+    army in the hub, half of the surrounding armies support the attack and
+    the other half support the hub to hold. An outer territory next to each
+    supporting territory holds an army which tries to cut every other
+    support.
+    """
+    hub = 'hub'
+    spokes = [f'spoke-{i}' for i in range(size + 1)]
+    outer = [f'outer-{i}' for i in range(size + 1)]
+    territories = [_territory(hub, TerritoryType.INLAND, spokes)]
+    for spoke, edge in zip(spokes, outer):
+        territories.append(_territory(spoke, TerritoryType.INLAND, [hub, edge]))
+        territories.append(_territory(edge, TerritoryType.INLAND, [spoke]))
+
+    attacker, defender = 'attacker', 'defender'
+    pieces = [
+        {'id': 1, 'type': PieceType.ARMY, 'nation': defender, 'territory': hub},
+        {'id': 2, 'type': PieceType.ARMY, 'nation': attacker, 'territory': spokes[0]},
+    ]
+    orders = [
+        {'id': 1, 'type': OrderType.HOLD, 'nation': defender, 'source': hub},
+        {
+            'id': 2, 'type': OrderType.MOVE, 'nation': attacker,
+            'source': spokes[0], 'target': hub,
+        },
+    ]
+    for i, (spoke, edge) in enumerate(zip(spokes[1:], outer[1:]), 1):
+        nation = attacker if i % 2 else defender
+        support = {
+            'id': len(orders) + 1, 'type': OrderType.SUPPORT, 'nation': nation,
+            'source': spoke, 'aux': spokes[0] if nation == attacker else hub,
+            'target': hub,
+        }
+        pieces.append({'id': len(pieces) + 1, 'type': PieceType.ARMY, 'nation': nation, 'territory': spoke})
+        orders.append(support)
+        if i % 4 in [1, 2]:
+            other = defender if nation == attacker else attacker
+            pieces.append({'id': len(pieces) + 1, 'type': PieceType.ARMY, 'nation': other, 'territory': edge})
+            orders.append({
+                'id': len(orders) + 1, 'type': OrderType.MOVE, 'nation': other,
+                'source': edge, 'target': spoke,
+            })
+    return _turn(territories, pieces, orders, [attacker, defender])
+
+
+def convoy(size):
+    """
+    A chain of `size` sea territories between two coastal territories. An
+    army is convoyed along the whole chain while an army on the other end
+    moves the other way by land, around a ring of inland territories.
+    """
+    seas = [f'sea-{i}' for i in range(size)]
+    start, end = 'start', 'end'
+    land = [f'land-{i}' for i in range(3)]
+    territories = [
+        _territory(start, TerritoryType.COASTAL, [seas[0], land[0]]),
+        _territory(end, TerritoryType.COASTAL, [seas[-1], land[-1]]),
+    ]
+    for i, sea in enumerate(seas):
+        neighbours = seas[max(i - 1, 0):i] + seas[i + 1:i + 2]
+        if i == 0:
+            neighbours.append(start)
+        if i == size - 1:
+            neighbours.append(end)
+        territories.append(_territory(sea, TerritoryType.SEA, neighbours))
+    for i, id in enumerate(land):
+        neighbours = land[max(i - 1, 0):i] + land[i + 1:i + 2]
+        if i == 0:
+            neighbours.append(start)
+        if i == len(land) - 1:
+            neighbours.append(end)
+        territories.append(_territory(id, TerritoryType.INLAND, neighbours))
+
+    nation = 'convoying'
+    pieces = [
+        {'id': 1, 'type': PieceType.ARMY, 'nation': nation, 'territory': start},
+        {'id': 2, 'type': PieceType.ARMY, 'nation': nation, 'territory': end},
+    ]
+    orders = [
+        {
+            'id': 1, 'type': OrderType.MOVE, 'nation': nation, 'source': start,
+            'target': end, 'via_convoy': True,
+        },
+        {'id': 2, 'type': OrderType.MOVE, 'nation': nation, 'source': end, 'target': land[-1]},
+    ]
+    for sea in seas:
+        pieces.append({'id': len(pieces) + 1, 'type': PieceType.FLEET, 'nation': nation, 'territory': sea})
+        orders.append({
+            'id': len(orders) + 1, 'type': OrderType.CONVOY, 'nation': nation,
+            'source': sea, 'aux': start, 'target': end,
+        })
+    return _turn(territories, pieces, orders, [nation])
+
+
+STRESS_BOARDS = {
+    'rotation': rotation,
+    'supports': supports,
+    'convoy': convoy,
+}
+STRESS_SIZES = [10, 100, 500]
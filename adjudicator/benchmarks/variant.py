@@ -0,0 +1,364 @@
+"""
+Seeded generator of large synthetic variants, for measuring how the
+adjudicator scales with the size of the map and the number of players.
+
+Maps are planar: territories are placed on a jittered grid and joined to the
+territories next to them and across one diagonal of each grid cell. Seas are
+grown from random seeds, land next to a sea is coastal and other land is
+inland. A coastal territory whose sea neighbours form more than one arc
+around it may be given a named coast for each arc, like Spain or St.
+Petersburg on the standard map.
+"""
+import math
+import random
+from collections import deque
+
+from adjudicator.base import OrderType, Phase, PieceType, Season, TerritoryType
+
+# The `(size, players)` of the variants benchmarked, and the seed they are
+# generated with, so that results can be compared between runs.
+VARIANT_SIZES = [(200, 15), (500, 20), (1000, 30)]
+VARIANT_SEED = 0
+
+
+class VariantGenerator:
+    """
+    Generates the map, pieces and orders of a turn of a synthetic variant.
+
+    Args:
+        * `size` - `int` - number of territories.
+        * `players` - `int` - number of nations.
+        * `[seed]` - seed for the random number generator.
+        * `[sea_fraction]` - `float` - fraction of territories which are sea.
+        * `[occupancy]` - `float` - fraction of territories which hold a
+          piece.
+    """
+
+    # Chance that a territory which could have named coasts is given them.
+    complex_chance = 0.5
+    # Chance that a land territory other than a home center is a supply center.
+    neutral_center_chance = 0.15
+    # Chance that an army on a coastal territory is a fleet.
+    fleet_chance = 0.4
+    # Chances of each kind of order. The rest of the pieces support.
+    hold_chance = 0.15
+    move_chance = 0.55
+    # Chance that an army next to a fleet at sea is convoyed.
+    convoy_chance = 0.2
+
+    def __init__(self, size, players, seed=None, sea_fraction=0.35, occupancy=0.5):
+        self.size = size
+        self.players = players
+        self.sea_fraction = sea_fraction
+        self.occupancy = occupancy
+        self.random = random.Random(seed)
+
+    def turn(self):
+        """
+        Generate a turn in the order phase.
+
+        Returns:
+            * `dict` - turn data in the format of `TurnSchema`.
+        """
+        self._build_map()
+        self._place_nations()
+        self._place_pieces()
+        orders = self._orders()
+        return {
+            'id': 1,
+            'season': Season.SPRING,
+            'phase': Phase.ORDER,
+            'year': 1901,
+            'territories': self._territory_data(),
+            'named_coasts': self.named_coasts,
+            'nations': [{'id': n, 'name': n} for n in self.nations],
+            'pieces': self.pieces,
+            'orders': orders,
+        }
+
+    def _build_map(self):
+        rng = self.random
+        cols = math.ceil(math.sqrt(self.size))
+        self.ids = [f'territory-{i}' for i in range(self.size)]
+        self.positions = [
+            (i % cols + rng.uniform(-0.3, 0.3), i // cols + rng.uniform(-0.3, 0.3))
+            for i in range(self.size)
+        ]
+        self.adjacent = [set() for _ in range(self.size)]
+
+        def join(a, b):
+            if a < self.size and b < self.size:
+                self.adjacent[a].add(b)
+                self.adjacent[b].add(a)
+
+        for i in range(self.size):
+            right = i + 1 if (i + 1) % cols else self.size
+            below = i + cols
+            join(i, right)
+            join(i, below)
+            if right < self.size and below + 1 < self.size:
+                if rng.random() < 0.5:
+                    join(i, below + 1)
+                else:
+                    join(right, below)
+
+        # Grow seas from random seeds.
+        self.sea = set()
+        target = round(self.size * self.sea_fraction)
+        frontier = rng.sample(range(self.size), max(1, self.size // 60))
+        while len(self.sea) < target and frontier:
+            i = frontier.pop(rng.randrange(len(frontier)))
+            if i not in self.sea:
+                self.sea.add(i)
+                frontier.extend(self.adjacent[i] - self.sea)
+        self.land = [i for i in range(self.size) if i not in self.sea]
+        self.coastal = {i for i in self.land if self.adjacent[i] & self.sea}
+
+        self.shared_coasts = {
+            i: sorted(
+                j for j in self.adjacent[i] & self.coastal
+                if self.adjacent[i] & self.adjacent[j] & self.sea
+            )
+            for i in self.coastal
+        }
+        self.named_coasts = []
+        self.coasts = {}
+        for i in sorted(self.coastal):
+            arcs = self._sea_arcs(i)
+            if len(arcs) > 1 and rng.random() < self.complex_chance:
+                self.coasts[i] = []
+                for k, neighbours in enumerate(arcs):
+                    coast_id = f'{self.ids[i]}-coast-{k}'
+                    self.coasts[i].append(coast_id)
+                    self.named_coasts.append({
+                        'id': coast_id,
+                        'name': f'{self.ids[i]} coast {k}',
+                        'parent': self.ids[i],
+                        'neighbours': [self.ids[j] for j in neighbours],
+                    })
+
+    def _sea_arcs(self, i):
+        """
+        The neighbours of each coast of a coastal territory. Neighbours are
+        taken in order around the territory and each run of seas is a coast,
+        joined by the coastal territories on either side of the run which
+        border its seas.
+        """
+        x, y = self.positions[i]
+        around = sorted(
+            self.adjacent[i],
+            key=lambda j: math.atan2(self.positions[j][1] - y, self.positions[j][0] - x),
+        )
+        if all(j in self.sea for j in around):
+            return [around]
+        # Start just after a land neighbour so that no run wraps around.
+        start = next(k for k, j in enumerate(around) if j not in self.sea)
+        around = around[start + 1:] + around[:start + 1]
+        arcs = []
+        run = []
+        for k, j in enumerate(around):
+            if j in self.sea:
+                run.append(j)
+                continue
+            if run:
+                ends = [around[k - len(run) - 1], j]
+                seas = set(run)
+                arcs.append(run + [
+                    e for e in dict.fromkeys(ends)
+                    if e in self.coastal and self.adjacent[e] & seas
+                ])
+                run = []
+        return arcs
+
+    def _place_nations(self):
+        rng = self.random
+        self.nations = [f'nation-{n}' for n in range(self.players)]
+        capitals = rng.sample(self.land, self.players)
+        self.nationality = {}
+        self.supply_centers = set()
+        for nation, capital in zip(self.nations, capitals):
+            homes = [capital] + [
+                j for j in sorted(self.adjacent[capital])
+                if j not in self.sea and j not in self.nationality
+                and j not in capitals
+            ][:2]
+            for j in homes:
+                self.nationality[j] = nation
+                self.supply_centers.add(j)
+        for i in self.land:
+            if i not in self.nationality and rng.random() < self.neutral_center_chance:
+                self.supply_centers.add(i)
+
+        # Each territory belongs to the nation whose capital is nearest.
+        self.owner = {c: n for n, c in zip(self.nations, capitals)}
+        queue = deque(capitals)
+        while queue:
+            i = queue.popleft()
+            for j in sorted(self.adjacent[i]):
+                if j not in self.owner:
+                    self.owner[j] = self.owner[i]
+                    queue.append(j)
+
+    def _place_pieces(self):
+        rng = self.random
+        self.pieces = []
+        self.occupied = {}
+        for i in sorted(self.nationality):
+            self._add_piece(i)
+        free = [i for i in range(self.size) if i not in self.occupied]
+        rng.shuffle(free)
+        count = max(0, round(self.size * self.occupancy) - len(self.pieces))
+        for i in free[:count]:
+            self._add_piece(i)
+
+    def _add_piece(self, i):
+        if i in self.sea:
+            piece_type = PieceType.FLEET
+        elif i in self.coastal and self.random.random() < self.fleet_chance:
+            piece_type = PieceType.FLEET
+        else:
+            piece_type = PieceType.ARMY
+        named_coast = None
+        if piece_type == PieceType.FLEET and i in self.coasts:
+            named_coast = self.random.choice(self.coasts[i])
+        piece = {
+            'id': len(self.pieces) + 1,
+            'type': piece_type,
+            'nation': self.nationality.get(i, self.owner[i]),
+            'territory': self.ids[i],
+            'named_coast': named_coast,
+        }
+        self.pieces.append(piece)
+        self.occupied[i] = piece
+
+    def _territory_data(self):
+        territories = []
+        for i, id in enumerate(self.ids):
+            neighbours = [self.ids[j] for j in sorted(self.adjacent[i])]
+            if i in self.sea:
+                territories.append({
+                    'id': id, 'type': TerritoryType.SEA, 'name': id,
+                    'neighbours': neighbours,
+                })
+                continue
+            nation = self.nationality.get(i)
+            territory = {
+                'id': id,
+                'type': TerritoryType.COASTAL if i in self.coastal else TerritoryType.INLAND,
+                'name': id,
+                'neighbours': neighbours,
+                'nationality': nation,
+                'controlled_by': nation,
+                'supply_center': i in self.supply_centers,
+            }
+            if i in self.coastal:
+                territory['shared_coasts'] = [self.ids[j] for j in self.shared_coasts[i]]
+            territories.append(territory)
+        return territories
+
+    def _orders(self):
+        """
+        Give each piece a random legal order. Moves are drawn from the
+        reachability table of the map, so that they are legal, and supports
+        only support orders which were given.
+        """
+        from adjudicator import create_state
+        from adjudicator.legal import ReachabilityTable
+        from adjudicator.schema import TurnSchema
+
+        rng = self.random
+        validated_data = TurnSchema().load({
+            'id': 1, 'season': Season.SPRING, 'phase': Phase.ORDER, 'year': 1901,
+            'territories': self._territory_data(), 'named_coasts': self.named_coasts,
+            'nations': [{'id': n} for n in self.nations], 'pieces': [], 'orders': [],
+        })
+        table = ReachabilityTable(create_state(validated_data).territories)
+        index = {id: i for i, id in enumerate(self.ids)}
+
+        def key(piece):
+            return piece['type'], piece['territory'], piece['named_coast']
+
+        orders = {}
+        supporting = []
+        for piece in self.pieces:
+            order = {
+                'type': OrderType.HOLD, 'nation': piece['nation'],
+                'source': piece['territory'],
+            }
+            orders[piece['id']] = order
+            chance = rng.random()
+            moves = table.moves.get(key(piece))
+            if chance < self.hold_chance or not moves:
+                continue
+            if chance < self.hold_chance + self.move_chance:
+                order['type'] = OrderType.MOVE
+                order['target'], order['target_coast'] = rng.choice(moves)
+            else:
+                supporting.append(piece)
+
+        # Convoy armies across a fleet at sea next to them.
+        for piece in self.pieces:
+            source = index[piece['territory']]
+            if piece['type'] != PieceType.ARMY or source not in self.coastal \
+                    or rng.random() >= self.convoy_chance:
+                continue
+            fleets = [
+                self.occupied[s] for s in sorted(self.adjacent[source] & self.sea)
+                if s in self.occupied and self.occupied[s] not in supporting
+            ]
+            if not fleets:
+                continue
+            fleet = rng.choice(fleets)
+            sea = index[fleet['territory']]
+            targets = sorted(self.adjacent[sea] & self.coastal - {source})
+            if not targets:
+                continue
+            target = self.ids[rng.choice(targets)]
+            orders[piece['id']].update(type=OrderType.MOVE, target=target, via_convoy=True)
+            orders[piece['id']].pop('target_coast', None)
+            orders[fleet['id']] = {
+                'type': OrderType.CONVOY, 'nation': fleet['nation'],
+                'source': fleet['territory'], 'aux': piece['territory'],
+                'target': target,
+            }
+
+        held = {}
+        moving = {}
+        for piece in self.pieces:
+            order = orders[piece['id']]
+            if order['type'] == OrderType.MOVE:
+                moving.setdefault(order['target'], []).append(order)
+            else:
+                held[piece['territory']] = order
+        for piece in supporting:
+            reach = table.supports.get(key(piece), set())
+            candidates = [
+                (o['source'], target) for target in sorted(reach)
+                for o in [held.get(target)] + moving.get(target, []) if o
+                if o['source'] != piece['territory']
+            ]
+            candidates = [c for c in candidates if c[1] != piece['territory']]
+            if candidates:
+                aux, target = rng.choice(candidates)
+                orders[piece['id']].update(type=OrderType.SUPPORT, aux=aux, target=target)
+
+        return [{'id': i, **order} for i, order in enumerate(orders.values(), 1)]
+
+
+def generate_turn(size, players, seed=None, **kwargs):
+    """
+    Generate a turn of a synthetic variant. The same arguments always give
+    the same turn.
+
+    Args:
+        * `size` - `int` - number of territories.
+        * `players` - `int` - number of nations.
+        * `[seed]` - seed for the random number generator.
+        * `[sea_fraction]` - `float` - fraction of territories which are sea.
+        * `[occupancy]` - `float` - fraction of territories which hold a
+          piece.
+
+    Returns:
+        * `dict` - turn data in the format of `TurnSchema`.
+    """
+    return VariantGenerator(size, players, seed, **kwargs).turn()
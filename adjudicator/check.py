@@ -11,7 +11,7 @@ class SourcePieceBelongsToNation(Check):
     message = 'Cannot order a piece belonging to another nation.'
 
     def fail_condition(self, order):
-        return order.source.piece.nation != order.nation
+        return order.state.piece_in(order.source).nation != order.nation
 
 
 class SourceAndTargetDistinct(Check):
@@ -29,7 +29,7 @@ class ArmyMovesToAdjacentTerritoryNotConvoy(Check):
     message = 'Army cannot reach non-adjacent territory without convoy.'
 
     def fail_condition(self, order):
-        piece = order.source.piece
+        piece = order.state.piece_in(order.source)
         return piece.is_army and not order.source.adjacent_to(order.target) \
             and not order.via_convoy
 
@@ -40,7 +40,7 @@ class FleetMovesToAdjacentTerritory(Check):
     message = 'Fleet cannot reach non-adjacent territory.'
 
     def fail_condition(self, order):
-        piece = order.source.piece
+        piece = order.state.piece_in(order.source)
         return piece.is_fleet and not order.source.adjacent_to(order.target)
 
 
@@ -50,7 +50,7 @@ class ArmyCanReachTarget(Check):
     message = 'Army cannot enter a sea territory'
 
     def fail_condition(self, order):
-        piece = order.source.piece
+        piece = order.state.piece_in(order.source)
         return piece.is_army and not piece.can_reach(order.target)
 
 
@@ -60,7 +60,7 @@ class FleetCanReachTarget(Check):
     message = 'Fleet cannot enter an inland territory'
 
     def fail_condition(self, order):
-        piece = order.source.piece
+        piece = order.state.piece_in(order.source)
         return not piece.can_reach(order.target, order.target_coast) \
             and piece.is_fleet and not order.target.is_coastal
 
@@ -73,7 +73,7 @@ class FleetCanReachTargetCoastal(Check):
     )
 
     def fail_condition(self, order):
-        piece = order.source.piece
+        piece = order.state.piece_in(order.source)
         return piece.is_fleet \
             and not piece.can_reach(order.target, order.target_coast) \
             and order.target.is_coastal
@@ -87,7 +87,7 @@ class ConvoyeeIsArmy(Check):
     )
 
     def fail_condition(self, order):
-        return order.aux.piece.is_fleet
+        return order.state.piece_in(order.aux).is_fleet
 
 
 class AtSea(Check):
@@ -109,7 +109,7 @@ class CanReachTargetWithoutConvoy(Check):
     )
 
     def fail_condition(self, order):
-        piece = order.source.piece
+        piece = order.state.piece_in(order.source)
         return not piece.can_reach_support(order.target)
 
 
@@ -121,7 +121,7 @@ class SourceNotOccupied(Check):
     )
 
     def fail_condition(self, order):
-        return bool(order.source.piece)
+        return bool(order.state.piece_in(order.source))
 
 
 class SourceHasSupplyCenter(Check):
@@ -155,7 +155,7 @@ class SourceIsControlled(Check):
     )
 
     def fail_condition(self, order):
-        return not order.source.controlled_by == order.nation
+        return not order.state.controlled_by.get(order.source) == order.nation
 
 
 class PieceTypeCanExist(Check):
@@ -190,7 +190,7 @@ class TargetNotAttackerTerritory(Check):
     )
 
     def fail_condition(self, order):
-        piece = order.source.piece
+        piece = order.state.piece_in(order.source)
         return order.target == piece.attacker_territory
 
 
@@ -203,4 +203,4 @@ class TargetNotContested(Check):
     )
 
     def fail_condition(self, order):
-        return order.target.contested
+        return order.target in order.state.contested
@@ -0,0 +1,110 @@
+"""
+Adjudicate turns from a JSON Lines file.
+
+Each line of the input is a turn in the format of `TurnSchema`. Each line of
+the output is the processed turn, or an error record with the turn's `id`
+and the `error` if the turn could not be processed. Turns are read and
+results written as they go, so large files are processed in bounded memory.
+
+Usage:
+    python -m adjudicator [INFILE] [-o OUTFILE] [--workers N] [--unordered]
+"""
+import argparse
+import json
+import sys
+
+from marshmallow import ValidationError
+
+from adjudicator.parallel import TurnError, process_game_states
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m adjudicator',
+        description='Adjudicate turns read as JSON Lines.',
+    )
+    parser.add_argument(
+        'infile',
+        nargs='?',
+        type=argparse.FileType('r'),
+        default=sys.stdin,
+        help='JSON Lines file of turns. Defaults to stdin.',
+    )
+    parser.add_argument(
+        '-o', '--outfile',
+        type=argparse.FileType('w'),
+        default=sys.stdout,
+        help='File to write processed turns to. Defaults to stdout.',
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes. 0 uses every CPU. Defaults to 1.',
+    )
+    parser.add_argument(
+        '--unordered',
+        action='store_true',
+        help='Write results as soon as they are ready rather than in input order.',
+    )
+    parser.add_argument(
+        '--trusted',
+        action='store_true',
+        help='Do not validate turns.',
+    )
+    return parser
+
+
+def read_turns(lines, errors):
+    """
+    Parse each non-blank line as a turn. Lines which cannot be parsed are
+    reported to stderr and counted in `errors`.
+    """
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            turn = json.loads(line)
+        except ValueError as e:
+            errors['count'] += 1
+            sys.stderr.write(f'Line {line_number}: invalid JSON: {e}\n')
+            continue
+        if not isinstance(turn, dict):
+            errors['count'] += 1
+            sys.stderr.write(f'Line {line_number}: turn must be an object\n')
+            continue
+        yield turn
+
+
+def error_record(result):
+    exception = result.exception
+    if isinstance(exception, ValidationError):
+        error = exception.messages
+    else:
+        error = f'{exception.__class__.__name__}: {exception}'
+    return {'id': result.turn_id, 'error': error}
+
+
+def main(argv=None):
+    """
+    Run the command.
+
+    Returns:
+        * `int` - exit status. 1 if any turn could not be processed.
+    """
+    args = get_parser().parse_args(argv)
+    errors = {'count': 0}
+    results = process_game_states(
+        read_turns(args.infile, errors),
+        workers=args.workers or None,
+        ordered=not args.unordered,
+        trusted=args.trusted,
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, TurnError):
+            errors['count'] += 1
+            result = error_record(result)
+        args.outfile.write(json.dumps(result, default=str) + '\n')
+    args.outfile.flush()
+    return 1 if errors['count'] else 0
@@ -0,0 +1,135 @@
+class Cluster:
+    """
+    Orders and pieces which can affect each other's outcome.
+
+    * `territories` - `set` of the territories the orders relate to and the
+      pieces are in.
+    * `orders` - `list` of orders.
+    * `pieces` - `list` of pieces.
+    """
+
+    def __init__(self):
+        self.territories = set()
+        self.orders = []
+        self.pieces = []
+
+
+def order_territories(order):
+    """
+    The territories an order relates to - its source, and its aux and target
+    if it has them.
+
+    Returns:
+        * `list` of `Territory` instances.
+    """
+    territories = [order.source]
+    for name in ['aux', 'target']:
+        territory = getattr(order, name, None)
+        if territory is not None and territory not in territories:
+            territories.append(territory)
+    return territories
+
+
+def order_data_territories(order_data):
+    """
+    The ids of the territories order data relates to, as for
+    `order_territories`.
+
+    Args:
+        * `order_data` - `dict` - order data as loaded by `OrderSchema`.
+
+    Returns:
+        * `list` of `str`.
+    """
+    territories = [order_data['source']]
+    for name in ['aux', 'target']:
+        territory = order_data.get(name)
+        if territory is not None and territory not in territories:
+            territories.append(territory)
+    return territories
+
+
+def find_clusters(orders, pieces):
+    """
+    Partition orders and pieces into clusters which can be resolved
+    independently.
+
+    Every decision about an order reads only orders and pieces whose
+    territories are the source, aux or target of that order, or are the
+    territories of orders which relate to those territories. Territories are
+    linked through each order and the clusters are the connected groups of
+    territories.
+
+    Args:
+        * `orders` - `list` of `Order` instances.
+        * `pieces` - `list` of `Piece` instances.
+
+    Returns:
+        * `list` of `Cluster` instances, in order of the first order or piece
+          in each.
+    """
+    return _partition(
+        orders, pieces, order_territories, lambda piece: piece.territory
+    )
+
+
+def find_data_clusters(orders, pieces):
+    """
+    Partition order and piece data into the clusters that `find_clusters`
+    would find for the orders and pieces created from it, so that a turn can
+    be split before it is built. The territories of each cluster are ids.
+
+    Args:
+        * `orders` - `list` of `dict` - order data as loaded by `OrderSchema`.
+        * `pieces` - `list` of `dict` - piece data as loaded by `PieceSchema`.
+
+    Returns:
+        * `list` of `Cluster` instances holding the given `dict` instances.
+    """
+    return _partition(
+        orders, pieces, order_data_territories,
+        lambda piece: piece['territory'],
+    )
+
+
+def _partition(orders, pieces, get_order_territories, get_piece_territory):
+    parents = {}
+
+    def find(territory):
+        root = territory
+        while parents[root] is not root:
+            root = parents[root]
+        # Point every territory on the way directly at the root.
+        while parents[territory] is not root:
+            parents[territory], territory = root, parents[territory]
+        return root
+
+    def union(territory, other):
+        root, other_root = find(territory), find(other)
+        if root is not other_root:
+            parents[other_root] = root
+
+    order_roots = []
+    for order in orders:
+        territories = get_order_territories(order)
+        for territory in territories:
+            parents.setdefault(territory, territory)
+        for territory in territories[1:]:
+            union(territories[0], territory)
+        order_roots.append(territories[0])
+    piece_territories = []
+    for piece in pieces:
+        territory = get_piece_territory(piece)
+        parents.setdefault(territory, territory)
+        piece_territories.append(territory)
+
+    clusters = {}
+    for order, territory in zip(orders, order_roots):
+        cluster = clusters.setdefault(find(territory), Cluster())
+        cluster.orders.append(order)
+    for piece, territory in zip(pieces, piece_territories):
+        cluster = clusters.setdefault(find(territory), Cluster())
+        cluster.pieces.append(piece)
+    for territory in parents:
+        clusters[find(territory)].territories.add(territory)
+    return list(clusters.values())
@@ -0,0 +1,117 @@
+import hashlib
+import json
+from collections import OrderedDict
+
+from adjudicator.base import Variant
+from adjudicator.schema import MapSchema
+
+
+# Territory fields which are the same on every turn of a variant.
+STATIC_TERRITORY_FIELDS = [
+    'id', 'type', 'name', 'neighbours', 'shared_coasts', 'nationality',
+    'supply_center',
+]
+
+
+def content_hash(data):
+    """
+    Hash the territories and named coasts of a map. Only the fields which are
+    the same on every turn are hashed, so the full turn payload of any turn
+    of a variant has the same hash.
+
+    Args:
+        * `data` - `dict` with `territories` and `named_coasts`
+
+    Returns:
+        * `str`
+    """
+    territories = [
+        {k: t[k] for k in STATIC_TERRITORY_FIELDS if k in t}
+        for t in data['territories']
+    ]
+    content = json.dumps(
+        [territories, data['named_coasts']],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class CompiledMap:
+    """
+    The validated territories and named coasts of a variant. Compiled once and
+    used to build the map of each turn of that variant.
+
+    `state` is the `State` holding the built territories and named coasts,
+    which each turn is given copies of. It is built for the first turn
+    processed with the map.
+    """
+
+    def __init__(self, variant, content_hash, territories, named_coasts):
+        self.variant = variant
+        self.content_hash = content_hash
+        self.territories = territories
+        self.named_coasts = named_coasts
+        self.territory_ids = frozenset(t['id'] for t in territories)
+        self.state = None
+
+
+class MapCache:
+    """
+    Compiled maps keyed by variant and content hash. Once `maxsize` maps are
+    held the least recently used map is evicted.
+    """
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._maps = OrderedDict()
+
+    def __len__(self):
+        return len(self._maps)
+
+    def clear(self):
+        self._maps.clear()
+
+    def get(self, variant, content_hash):
+        """
+        Get a compiled map.
+
+        Returns:
+            * `CompiledMap` or `None` if the map is not in the cache.
+        """
+        key = (variant, content_hash)
+        compiled_map = self._maps.get(key)
+        if compiled_map is not None:
+            self._maps.move_to_end(key)
+        return compiled_map
+
+    def compile(self, data):
+        """
+        Validate the map in the given data and add it to the cache. Maps which
+        are already in the cache are not validated again.
+
+        Args:
+            * `data` - `dict` with `territories`, `named_coasts` and optionally
+              `variant`. May be a full turn payload.
+
+        Returns:
+            * `CompiledMap`
+        """
+        variant = data.get('variant', Variant.STANDARD)
+        key = content_hash(data)
+        compiled_map = self.get(variant, key)
+        if compiled_map is not None:
+            return compiled_map
+
+        validated_data = MapSchema().load(data)
+        compiled_map = CompiledMap(
+            validated_data['variant'],
+            key,
+            validated_data['territories'],
+            validated_data['named_coasts'],
+        )
+        self._maps[(compiled_map.variant, key)] = compiled_map
+        while len(self._maps) > self.maxsize:
+            self._maps.popitem(last=False)
+        return compiled_map
@@ -1,35 +1,67 @@
+from collections import deque
+
 from adjudicator.decisions import Outcomes
 
 
-class ConvoyChain:
+class ConvoyRoute:
     """
-    Represents a chain of one or more fleet paths which are attempting to
-    convoy an army from a source to a destination.
+    The convoy orders which could carry an army from `source` to `target`.
+
+    Whether a route exists is found by searching the graph of sea territories
+    occupied by the convoying fleets rather than by enumerating chains. The
+    result is kept until the outcome of one of the convoys changes.
     """
 
-    def __init__(self, convoys):
+    def __init__(self, state, source, target, convoys):
+        self.state = state
+        self.source = source
+        self.target = target
         self.convoys = list(convoys)
+        self.possible = self._search(self.convoys)
+        self._key = None
         self.result = Outcomes.UNRESOLVED
 
     def resolve(self):
-
-        if all([c.outcome == Outcomes.SUCCEEDS for c in self.convoys]) and \
-                all([c.legal for c in self.convoys]):
-            self.result = Outcomes.SUCCEEDS
-            return
-
-        if any([c.outcome == Outcomes.FAILS for c in self.convoys]) or \
-                any([c.illegal for c in self.convoys]):
-            self.result = Outcomes.FAILS
-            return
-        self.result = Outcomes.UNRESOLVED
-
-
-def get_convoy_chains(source, target, convoys):
+        """
+        Determine whether the army can be convoyed.
+
+        Returns:
+            * `str` - `succeeds` if there is a route through convoys which
+              succeed, `fails` if every route passes through a convoy which
+              fails or is illegal, otherwise `unresolved`.
+        """
+        key = tuple((c.outcome, c.illegal) for c in self.convoys)
+        if key != self._key:
+            self._key = key
+            self.result = self._resolve()
+        return self.result
+
+    def _resolve(self):
+        successful = [
+            c for c in self.convoys
+            if c.legal and c.outcome == Outcomes.SUCCEEDS
+        ]
+        if self._search(successful):
+            return Outcomes.SUCCEEDS
+        not_failed = [
+            c for c in self.convoys
+            if c.legal and c.outcome != Outcomes.FAILS
+        ]
+        if not self._search(not_failed):
+            return Outcomes.FAILS
+        return Outcomes.UNRESOLVED
+
+    def _search(self, convoys):
+        instrumentation = self.state.instrumentation
+        if instrumentation is not None:
+            instrumentation.convoy_searches += 1
+        return route_exists(self.source, self.target, convoys)
+
+
+def route_exists(source, target, convoys):
     """
-    Given a list of convoy orders, get every convoy chain between `source` and
-    `target`. It is assumed that the convoys are convoying from `source` to
-    `target`.
+    Breadth first search from `source` to `target` through the territories of
+    the given convoy orders.
 
     Args:
         * `source` - `Territory`
@@ -37,48 +69,17 @@ def get_convoy_chains(source, target, convoys):
         * `convoys` - `list` of `Convoy` instances
 
     Returns:
-        * `list` where each element in the list is a `ConvoyChain` instance.
+        * `bool`
     """
-    convoy_paths = set()
-    for convoy in convoys:
-        if convoy.source.adjacent_to(source):
-            # if direct convoy
-            if convoy.source.adjacent_to(target):
-                # add single order tuple to `convoy_paths`
-                path = (convoy,)
-                convoy_paths.add(path)
-            else:
-                remaining = [c for c in convoys if not c == convoy]
-                paths = build_chain([convoy], target, remaining)
-                if paths:
-                    [convoy_paths.add(p) for p in paths]
-    return [ConvoyChain(p) for p in list(convoy_paths)]
-
-
-def build_chain(initial_chain, target, convoys):
-    """
-    Recursive method which attempts to build a chain of convoying orders
-    to a given ``target``.
-    """
-    complete_chains = []
-    for convoy in convoys:
-        # if order neigbouring last node in chain, add order to chain
-        if convoy.source.adjacent_to(initial_chain[-1].source):
-            chain = initial_chain + [convoy]
-
-            # path found - neighboring piece is adjacent to target
-            if convoy.source.adjacent_to(target):
-                complete_chains.append(tuple(chain))
-                continue
-
-            # path not found - check new node's neighbours (recurse)
-            remaining = [c for c in convoys if not c == convoy]
-            inner_chains = build_chain(chain, target, remaining)
-
-            # if the inner method returns complete chains, add them to
-            # outer method's complete chains
-            if inner_chains:
-                complete_chains.append(inner_chains[0])
-
-    if complete_chains:
-        return complete_chains
+    unvisited = {c.source for c in convoys}
+    frontier = deque(t for t in unvisited if t.adjacent_to(source))
+    unvisited.difference_update(frontier)
+    while frontier:
+        territory = frontier.popleft()
+        if territory.adjacent_to(target):
+            return True
+        # Each fleet must be adjacent to the previous fleet in the route.
+        reached = [t for t in unvisited if t.adjacent_to(territory)]
+        unvisited.difference_update(reached)
+        frontier.extend(reached)
+    return False
@@ -1,5 +1,4 @@
 from .base import Decision, Outcomes
-from .path import Path
 
 
 class AttackStrength(Decision):
@@ -21,46 +20,54 @@ class AttackStrength(Decision):
         """
         if self.min_strength == self.max_strength:
             return self.min_strength, self.max_strength
-        self.min_strength, self.max_strength = self._resolve()
+        self.min_strength, self.max_strength = self._evaluate()
         return self.min_strength, self.max_strength
 
     def _resolve(self):
         return self._minimum(), self._maximum()
 
     def _minimum(self):
-        path = Path(self.order)()
+        path = self.order.path_decision()
 
         if path == Outcomes.NO_PATH or path == Outcomes.UNRESOLVED:
             return 0
 
-        if not self.order.target.piece or self.order.target.piece.moves:
-            return 1 + len(self.order.move_support(Outcomes.SUCCEEDS))
+        target_piece = self.state.piece_in(self.order.target)
 
-        if self.order.is_head_to_head() or not self.order.target.piece.moves:
-            if self.order.target.piece.nation == self.order.nation:
+        if not target_piece or target_piece.moves:
+            return 1 + self.order.move_support_count(Outcomes.SUCCEEDS)
+
+        if self.order.is_head_to_head() or not target_piece.moves:
+            if target_piece.nation == self.order.nation:
                 return 0
             # if convoy swap
             if self.order.is_convoy_swap():
-                return 1 + len(self.order.move_support(Outcomes.SUCCEEDS))
+                return 1 + self.order.move_support_count(Outcomes.SUCCEEDS)
 
-            return 1 + len([c for c in self.order.move_support(Outcomes.SUCCEEDS)
-                            if c.nation != self.order.target.piece.nation])
+            return 1 + self.order.move_support_count(
+                Outcomes.SUCCEEDS,
+                exclude_nation=target_piece.nation,
+            )
 
-        return 1 + len(self.order.move_support(Outcomes.SUCCEEDS))
+        return 1 + self.order.move_support_count(Outcomes.SUCCEEDS)
 
     def _maximum(self):
-        path = Path(self.order)()
+        path = self.order.path_decision()
 
         if path == Outcomes.NO_PATH:
             return 0
 
-        if not self.order.target.piece or self.order.target.piece.moves:
-            return 1 + len(self.order.move_support(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED))
+        target_piece = self.state.piece_in(self.order.target)
+
+        if not target_piece or target_piece.moves:
+            return 1 + self.order.move_support_count(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED)
 
-        if self.order.is_head_to_head() or self.order.target.piece.stays:
-            if self.order.target.piece.nation == self.order.nation:
+        if self.order.is_head_to_head() or target_piece.stays:
+            if target_piece.nation == self.order.nation:
                 return 0
-            return 1 + len([c for c in self.order.move_support(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED)
-                            if c.nation != self.order.target.piece.nation])
+            return 1 + self.order.move_support_count(
+                Outcomes.SUCCEEDS, Outcomes.UNRESOLVED,
+                exclude_nation=target_piece.nation,
+            )
 
-        return 1 + len(self.order.move_support(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED))
+        return 1 + self.order.move_support_count(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED)
@@ -1,16 +1,68 @@
 class Outcomes:
-    UNRESOLVED = 'unresolved'
-    PATH = 'path'
-    NO_PATH = 'no path'
-    SUCCEEDS = 'succeeds'
-    FAILS = 'fails'
-    MOVES = 'moves'
-    GIVEN = 'given'
-    CUT = 'cut'
-    LEGAL = 'legal'
-    ILLEGAL = 'illegal'
-    DISLODGED = 'dislodged'
-    SUSTAINS = 'sustains'
+    """
+    Outcome codes for orders, pieces and decisions.
+
+    Outcomes are compared throughout adjudication so they are stored as
+    integers. They are converted to their names with `Outcomes.name` when the
+    results are dumped.
+    """
+    UNRESOLVED = 0
+    PATH = 1
+    NO_PATH = 2
+    SUCCEEDS = 3
+    FAILS = 4
+    MOVES = 5
+    GIVEN = 6
+    CUT = 7
+    LEGAL = 8
+    ILLEGAL = 9
+    DISLODGED = 10
+    SUSTAINS = 11
+
+    NAMES = {
+        UNRESOLVED: 'unresolved',
+        PATH: 'path',
+        NO_PATH: 'no path',
+        SUCCEEDS: 'succeeds',
+        FAILS: 'fails',
+        MOVES: 'moves',
+        GIVEN: 'given',
+        CUT: 'cut',
+        LEGAL: 'legal',
+        ILLEGAL: 'illegal',
+        DISLODGED: 'dislodged',
+        SUSTAINS: 'sustains',
+    }
+
+    @classmethod
+    def name(cls, outcome):
+        """
+        Get the name of an outcome code.
+
+        Args:
+            * `outcome` - `int`
+
+        Returns:
+            * `str` or `None` if `outcome` is `None`.
+        """
+        if outcome is None:
+            return None
+        return cls.NAMES[outcome]
+
+    @classmethod
+    def code(cls, name):
+        """
+        Get the outcome code of an outcome name.
+
+        Args:
+            * `name` - `str`
+
+        Returns:
+            * `int` or `None` if `name` is `None`.
+        """
+        if name is None:
+            return None
+        return next(k for k, v in cls.NAMES.items() if v == name)
 
 
 class Decision:
@@ -27,9 +79,24 @@ class Decision:
         """
         if self.result != Outcomes.UNRESOLVED:
             return self.result
-        self.result = self._resolve()
+        self.result = self._evaluate()
         return self.result
 
+    @property
+    def state(self):
+        return self.order.state
+
+    def _evaluate(self):
+        """
+        Resolve the decision, telling the state's instrumentation if it has
+        any.
+        """
+        result = self._resolve()
+        instrumentation = self.state.instrumentation
+        if instrumentation is not None:
+            instrumentation.decision_evaluated(self, result)
+        return result
+
     def _resolve(self):
         raise NotImplementedError(
             'Subclasses of Decision must implement _resolve method.'
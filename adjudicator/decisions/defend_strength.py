@@ -8,13 +8,13 @@ class DefendStrength(Decision):
     decision that results in a value equal or greater than zero.
     """
     def __call__(self):
-        return self._resolve()
+        return self._evaluate()
 
     def _resolve(self):
         return self._minimum(), self._maximum()
 
     def _minimum(self):
-        return 1 + len(self.order.move_support(Outcomes.SUCCEEDS))
+        return 1 + self.order.move_support_count(Outcomes.SUCCEEDS)
 
     def _maximum(self):
-        return 1 + len(self.order.move_support(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED))
+        return 1 + self.order.move_support_count(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED)
@@ -1,5 +1,4 @@
 from .base import Decision, Outcomes
-from .attack_strength import AttackStrength
 
 
 class HoldStrength(Decision):
@@ -11,10 +10,15 @@ class HoldStrength(Decision):
     min_strength = 0
     max_strength = 50
 
-    def __init__(self, territory):
+    def __init__(self, state, territory):
+        self._state = state
         self.territory = territory
         self.result = Outcomes.UNRESOLVED
 
+    @property
+    def state(self):
+        return self._state
+
     def __call__(self):
         """
         Return the result of the min and max strength if resolved (if both
@@ -26,14 +30,14 @@ class HoldStrength(Decision):
         """
         if self.min_strength == self.max_strength:
             return self.min_strength, self.max_strength
-        self.min_strength, self.max_strength = self._resolve()
+        self.min_strength, self.max_strength = self._evaluate()
         return self.min_strength, self.max_strength
 
     def _resolve(self):
         return self._minimum(), self._maximum()
 
     def _minimum(self):
-        piece = self.territory.piece
+        piece = self.state.piece_in(self.territory)
 
         if not piece:
             return 0
@@ -45,20 +49,20 @@ class HoldStrength(Decision):
             # NOTE this is bullsh relating to how convoy swaps work
             # TODO clean
             if piece.order.is_convoy_swap():
-                _, max_attack_strength = AttackStrength(piece.order)()
+                _, max_attack_strength = piece.order.attack_strength_decision()
                 target_min_prevent = max(
                     [p.order.prevent_strength_decision()[0] for p in
-                     piece.order.target.other_attacking_pieces(piece)],
+                     self.state.other_attacking_pieces(piece.order.target, piece)],
                     default=0
                 )
                 if max_attack_strength <= target_min_prevent:
                     return 1
             return 0
 
-        return 1 + len(piece.order.hold_support(Outcomes.SUCCEEDS))
+        return 1 + piece.order.hold_support_count(Outcomes.SUCCEEDS)
 
     def _maximum(self):
-        piece = self.territory.piece
+        piece = self.state.piece_in(self.territory)
 
         if not piece:
             return 0
@@ -70,14 +74,14 @@ class HoldStrength(Decision):
             # NOTE this is bullsh relating to how convoy swaps work
             # TODO clean
             if piece.order.is_convoy_swap():
-                min_attack_strength, _ = AttackStrength(piece.order)()
+                min_attack_strength, _ = piece.order.attack_strength_decision()
                 target_max_prevent = max(
                     [p.order.prevent_strength_decision()[1] for p in
-                     piece.order.target.other_attacking_pieces(piece)],
+                     self.state.other_attacking_pieces(piece.order.target, piece)],
                     default=0
                 )
                 if min_attack_strength > target_max_prevent:
                     return 0
             return 1
 
-        return 1 + len(piece.order.hold_support(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED))
+        return 1 + piece.order.hold_support_count(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED)
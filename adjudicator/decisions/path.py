@@ -16,19 +16,18 @@ class Path(Decision):
         if not self.order.via_convoy:
             return Outcomes.PATH
 
-        chains = self.order.convoy_chains
+        route = self.order.convoy_route
 
-        if not chains:
+        if not route.possible:
             self.message = 'no convoy route available for move.'
             return Outcomes.NO_PATH
 
-        for chain in chains:
-            chain.resolve()
+        result = route.resolve()
 
-        if any([c.result == Outcomes.SUCCEEDS for c in chains]):
+        if result == Outcomes.SUCCEEDS:
             return Outcomes.PATH
 
-        if all([c.result == Outcomes.FAILS for c in chains]):
+        if result == Outcomes.FAILS:
             self.message = 'convoy route was disrupted.'
             return Outcomes.NO_PATH
 
@@ -21,7 +21,7 @@ class PreventStrength(Decision):
         """
         if self.min_strength == self.max_strength:
             return self.min_strength, self.max_strength
-        self.min_strength, self.max_strength = self._resolve()
+        self.min_strength, self.max_strength = self._evaluate()
         return self.min_strength, self.max_strength
 
     def _resolve(self):
@@ -31,16 +31,16 @@ class PreventStrength(Decision):
         if self.order.path_decision() in [Outcomes.NO_PATH, Outcomes.UNRESOLVED]:
             return 0
         if self.order.is_head_to_head():
-            opposing_order = self.order.target.piece.order
+            opposing_order = self.state.piece_in(self.order.target).order
             if opposing_order.outcome in [Outcomes.SUCCEEDS, Outcomes.UNRESOLVED]:
                 return 0
-        return 1 + len(self.order.move_support(Outcomes.SUCCEEDS))
+        return 1 + self.order.move_support_count(Outcomes.SUCCEEDS)
 
     def _maximum(self):
         if self.order.path_decision() == Outcomes.NO_PATH:
             return 0
         if self.order.is_head_to_head():
-            opposing_order = self.order.target.piece.order
+            opposing_order = self.state.piece_in(self.order.target).order
             if opposing_order.outcome == Outcomes.SUCCEEDS:
                 return 0
-        return 1 + len(self.order.move_support(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED))
+        return 1 + self.order.move_support_count(Outcomes.SUCCEEDS, Outcomes.UNRESOLVED)
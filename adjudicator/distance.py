@@ -0,0 +1,145 @@
+from collections import deque
+
+from adjudicator.base import PieceType
+from adjudicator.legal import MapTableCache, reachability_cache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Distance to a position which cannot be reached.
+UNREACHABLE = -1
+
+
+class DistanceMatrix:
+    """
+    The number of moves a type of piece needs to get between each pair of
+    positions on a map, found by a breadth first search from each position
+    over the moves of the map's `ReachabilityTable`. Army distances do not
+    include convoys.
+
+    * `piece_type` - `str`
+    * `positions` - `list` of the `(territory_id, named_coast_id)` positions
+      the piece can occupy. The named coast is only given for territories
+      with named coasts.
+    * `matrix` - the distance from each position to each other position, in
+      the order of `positions`, or `UNREACHABLE`. A NumPy `int16` array if
+      NumPy is installed, otherwise a `list` of `list`s.
+
+    Args:
+        * `piece_type` - `str`
+        * `table` - `ReachabilityTable`
+    """
+
+    def __init__(self, piece_type, table):
+        self.piece_type = piece_type
+        moves = {
+            (t, c): targets for (p, t, c), targets in table.moves.items()
+            if p == piece_type
+        }
+        self.positions = list(moves)
+        self.index = {p: i for i, p in enumerate(self.positions)}
+        self.territory_positions = {}
+        for i, (territory_id, _) in enumerate(self.positions):
+            self.territory_positions.setdefault(territory_id, []).append(i)
+
+        neighbours = [
+            [self.index[t] for t in moves[p] if t in self.index]
+            for p in self.positions
+        ]
+        rows = [_search(i, neighbours) for i in range(len(self.positions))]
+        if numpy is not None:
+            self.matrix = numpy.array(rows, dtype=numpy.int16).reshape(
+                len(rows), len(rows)
+            )
+        else:
+            self.matrix = rows
+
+    def distance(self, source, target, source_coast=None):
+        """
+        The number of moves from the source territory to the target
+        territory. If a named coast of the source is not given the nearest
+        named coast is used.
+
+        Args:
+            * `source` - territory id.
+            * `target` - territory id.
+            * `[source_coast]` - named coast id.
+
+        Returns:
+            * `int` or `None` if the piece cannot reach the target.
+        """
+        sources = self._source_positions(source, source_coast)
+        targets = self.territory_positions.get(target, [])
+        distances = [
+            self.matrix[s][t] for s in sources for t in targets
+            if self.matrix[s][t] != UNREACHABLE
+        ]
+        return int(min(distances)) if distances else None
+
+    def within(self, source, moves, source_coast=None):
+        """
+        The territories which the piece can reach from the source territory
+        in at most the given number of moves.
+
+        Returns:
+            * `set` of territory ids.
+        """
+        territories = set()
+        for s in self._source_positions(source, source_coast):
+            row = self.matrix[s]
+            if numpy is not None:
+                reached = numpy.flatnonzero((row != UNREACHABLE) & (row <= moves))
+            else:
+                reached = [
+                    i for i, d in enumerate(row)
+                    if d != UNREACHABLE and d <= moves
+                ]
+            territories.update(self.positions[i][0] for i in reached)
+        return territories
+
+    def _source_positions(self, source, source_coast):
+        if source_coast is not None:
+            position = self.index.get((source, source_coast))
+            return [] if position is None else [position]
+        return self.territory_positions.get(source, [])
+
+
+def _search(start, neighbours):
+    distances = [UNREACHABLE] * len(neighbours)
+    distances[start] = 0
+    queue = deque([start])
+    while queue:
+        position = queue.popleft()
+        for neighbour in neighbours[position]:
+            if distances[neighbour] == UNREACHABLE:
+                distances[neighbour] = distances[position] + 1
+                queue.append(neighbour)
+    return distances
+
+
+class Distances:
+    """
+    The army and fleet `DistanceMatrix` of a map.
+    """
+
+    def __init__(self, table):
+        self.army = DistanceMatrix(PieceType.ARMY, table)
+        self.fleet = DistanceMatrix(PieceType.FLEET, table)
+
+    def for_piece(self, piece):
+        return self.army if piece.is_army else self.fleet
+
+
+distance_cache = MapTableCache(
+    lambda state: Distances(reachability_cache.get(state))
+)
+
+
+def get_distances(state):
+    """
+    Get the `Distances` of the map of a state. Computed once for each map.
+    """
+    return distance_cache.get(state)
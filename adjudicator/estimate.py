@@ -0,0 +1,191 @@
+import random
+from collections import Counter
+from itertools import accumulate
+
+from marshmallow import ValidationError
+
+from adjudicator.decisions import Outcomes
+from adjudicator.cluster import find_data_clusters
+from adjudicator.processor import adjudicate, reset_clusters
+from adjudicator.schema import TurnSchema
+
+
+class Estimate:
+    """
+    The estimated results of a turn for one nation.
+
+    * `samples` - the number of order sets sampled.
+    * `adjudications` - the number of order sets which were adjudicated
+      because they held a cluster of orders not seen in an earlier set.
+    * `order_success` - `dict` of the probability that each order of the
+      nation succeeds, keyed by order id.
+    * `territory_held` - `dict` of the probability that each territory holds
+      a piece of the nation after the turn, keyed by territory id. Territories
+      which are never held are left out.
+    """
+
+    def __init__(self, samples, adjudications, order_success, territory_held):
+        self.samples = samples
+        self.adjudications = adjudications
+        self.order_success = order_success
+        self.territory_held = territory_held
+
+
+def estimate_outcomes(data, nation, distributions, samples=1000, seed=None,
+                      trusted=False):
+    """
+    Estimate the results of a turn for a nation by sampling the orders of the
+    other nations.
+
+    The turn is loaded once and each distinct order set is split into its
+    clusters of orders (see `find_data_clusters`). Clusters cannot affect
+    each other, so the results of each cluster are kept by the ids of its
+    orders and pieces and every other order set which holds the same cluster
+    uses them. Most sampled order sets differ from each other somewhere on
+    the board but are made up of clusters which have been seen before, so
+    only a few order sets are adjudicated. Those are adjudicated one after
+    another on the same state, in sorted order so that consecutive sets
+    differ in as few orders as possible, and only the clusters which have
+    not been seen are adjudicated again. On a standard map position this
+    estimates several thousand samples per second on one core.
+
+    Args:
+        * `data` - `dict` - turn data in the format of `TurnSchema`. Its
+          orders are the orders of `nation` and any other orders which are
+          known.
+        * `nation` - `str` - id of the nation whose results are estimated.
+        * `distributions` - `dict` of a `list` for each other nation, keyed
+          by nation id. The list holds the possible orders of each piece of
+          that nation, as a `list` of `(order_data, probability)` pairs.
+          Order data is in the format of `OrderSchema` and does not need an
+          `id` or `nation`.
+        * `[samples]` - `int` - number of order sets to sample.
+        * `[seed]` - seed for the random number generator.
+        * `[trusted]` - `bool` - skip validation of the turn.
+
+    Returns:
+        * `Estimate`
+    """
+    from adjudicator import add_turn, create_order, create_state, load_order
+
+    schema = TurnSchema()
+    if trusted:
+        validated_data = schema.load_trusted(data)
+    else:
+        validated_data = schema.load(data)
+    state = create_state(validated_data)
+    add_turn(state, validated_data)
+
+    order_ids = [o.id for o in state.orders if o.nation == nation]
+    next_id = max((o.id for o in state.orders), default=0) + 1
+    choices = []
+    errors = {}
+    for other_nation, pieces in distributions.items():
+        for i, piece_choices in enumerate(pieces):
+            if not piece_choices:
+                continue
+            orders = []
+            weights = []
+            for j, (order_data, probability) in enumerate(piece_choices):
+                order_data = {**order_data, 'id': next_id, 'nation': other_nation}
+                next_id += 1
+                try:
+                    orders.append(load_order(state, order_data))
+                except ValidationError as e:
+                    errors.setdefault(other_nation, {}).setdefault(i, {})[j] = e.messages
+                weights.append(probability)
+            choices.append((orders, weights))
+    if errors:
+        raise ValidationError(errors)
+
+    rng = random.Random(seed)
+    cum_weights = [(range(len(w)), list(accumulate(w))) for _, w in choices]
+    order_sets = Counter(
+        tuple(rng.choices(r, cum_weights=c)[0] for r, c in cum_weights)
+        for _ in range(samples)
+    )
+
+    # Orders and pieces by id, and the data which the clusters of each order
+    # set are found from.
+    known_orders = validated_data['orders']
+    pieces = {p.id: p for p in state.pieces}
+    piece_data = [{'id': p.id, 'territory': p.territory.id} for p in state.pieces]
+
+    # The results for the nation of each cluster which has been adjudicated,
+    # keyed by the ids of the orders and pieces in the cluster.
+    cluster_results = {}
+    # The order of each piece in `choices` registered to the state, as a
+    # `(choice, order)` pair.
+    current = [None] * len(choices)
+    adjudications = 0
+    succeeded = Counter()
+    held = Counter()
+    for order_set, count in sorted(order_sets.items()):
+        chosen = [orders[choice] for (orders, _), choice in zip(choices, order_set)]
+        clusters = find_data_clusters([*known_orders, *chosen], piece_data)
+        keys = [
+            (frozenset(o['id'] for o in c.orders), frozenset(p['id'] for p in c.pieces))
+            for c in clusters
+        ]
+        missing = [
+            (key, cluster) for key, cluster in zip(keys, clusters)
+            if key not in cluster_results
+        ]
+        if missing:
+            adjudications += 1
+            for i, ((orders, _), choice) in enumerate(zip(choices, order_set)):
+                if current[i] is not None:
+                    previous_choice, previous_order = current[i]
+                    if previous_choice == choice:
+                        continue
+                    state.unregister(previous_order)
+                current[i] = (choice, create_order(state, orders[choice]))
+            territories = [
+                state.get_territory_by_id(next(iter(cluster.territories)))
+                for _, cluster in missing
+            ]
+            adjudicate(state, *reset_clusters(state, territories))
+            orders_by_id = {o.id: o for o in state.orders}
+            for key, cluster in missing:
+                cluster_results[key] = _cluster_result(
+                    nation,
+                    [orders_by_id[o['id']] for o in cluster.orders],
+                    [pieces[p['id']] for p in cluster.pieces],
+                )
+        for key in keys:
+            succeeded_ids, held_ids = cluster_results[key]
+            for order_id in succeeded_ids:
+                succeeded[order_id] += count
+            for territory_id in held_ids:
+                held[territory_id] += count
+
+    return Estimate(
+        samples,
+        adjudications,
+        {i: succeeded[i] / samples for i in order_ids},
+        {t: n / samples for t, n in held.items()},
+    )
+
+
+def _cluster_result(nation, orders, pieces):
+    """
+    The results for a nation of an adjudicated cluster.
+
+    Returns:
+        * `tuple` of the ids of the nation's orders which succeed and the ids
+          of the territories which hold a piece of the nation after the turn.
+    """
+    order_ids = tuple(
+        o.id for o in orders
+        if o.nation == nation and o.outcome == Outcomes.SUCCEEDS
+    )
+    territory_ids = []
+    for piece in pieces:
+        if piece.nation != nation:
+            continue
+        order = piece.order
+        if order.is_move and order.outcome == Outcomes.SUCCEEDS:
+            territory_ids.append(order.target.id)
+        elif not piece.dislodged:
+            territory_ids.append(piece.territory.id)
+    return order_ids, tuple(territory_ids)
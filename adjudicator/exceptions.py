@@ -1,2 +1,19 @@
 class IllegalOrderException(Exception):
     pass
+
+
+class UnknownMapException(Exception):
+    """
+    Raised when a turn refers to a map which has not been compiled, or which
+    has been evicted from the map cache. The map should be compiled again.
+    """
+    pass
+
+
+class ResolutionStalledException(Exception):
+    """
+    Raised when resolution stalls on orders and pieces without an unresolved
+    move to guess. Every other decision depends on a move, so this means a
+    dependency was not tracked.
+    """
+    pass
@@ -0,0 +1,109 @@
+from contextlib import contextmanager
+
+from adjudicator.decisions import Outcomes
+
+# The decisions whose evaluations are counted.
+DECISION_TYPES = [
+    'AttackStrength', 'HoldStrength', 'PreventStrength', 'DefendStrength',
+    'Path',
+]
+
+
+class Instrumentation:
+    """
+    Counts the work done to resolve a turn and, if `trace` is given, records
+    how each order came to be resolved.
+
+    Set as the state's `instrumentation` before the turn is processed. When
+    it is not set the only cost to adjudication is checking that it is
+    `None`.
+
+    * `decisions` - `dict` - number of times each type of decision was
+      evaluated, i.e. not already resolved when it was called.
+    * `evaluations` - `int` - orders and pieces evaluated by a worklist.
+    * `iterations` - `int` - worklist runs, one for each cluster and one more
+      each time a fallback lets resolution continue.
+    * `cycle_fallbacks` - `int` - times a worklist stalled on a dependency
+      cycle, which was then settled as a circular movement or by guessing.
+    * `convoy_searches` - `int` - searches for a convoy route.
+    * `trace` - `dict` of order id to `list` of `str`, or `None`. Each change
+      to the result of one of the order's decisions, and to its outcome, in
+      the order they happened. An outcome set while another item was being
+      evaluated names that item, and one set while a dependency cycle was
+      being settled names the fallback, `circular movement` or `guess`.
+    """
+
+    def __init__(self, trace=False):
+        self.decisions = dict.fromkeys(DECISION_TYPES, 0)
+        self.evaluations = 0
+        self.iterations = 0
+        self.cycle_fallbacks = 0
+        self.convoy_searches = 0
+        self.trace = {} if trace else None
+        self.fallback = None
+        self._results = {}
+
+    def decision_evaluated(self, decision, result):
+        name = type(decision).__name__
+        self.decisions[name] = self.decisions.get(name, 0) + 1
+        order = getattr(decision, 'order', None)
+        if self.trace is None or order is None:
+            return
+        if self._results.get(decision, Outcomes.UNRESOLVED) != result:
+            self._results[decision] = result
+            if isinstance(result, tuple):
+                result = '-'.join(str(r) for r in result)
+            else:
+                result = Outcomes.name(result)
+            self.trace.setdefault(order.id, []).append(f'{name}: {result}')
+
+    def outcome_changed(self, order, tracker):
+        if self.trace is None:
+            return
+        event = f'outcome: {Outcomes.name(order._outcome)}'
+        causes = []
+        current = getattr(tracker, 'current', None)
+        if current is not None and current is not order:
+            kind = 'order' if hasattr(current, 'resolve') else 'piece'
+            causes.append(f'by {kind} {current.id}')
+        if self.fallback is not None:
+            causes.append(self.fallback)
+        if causes:
+            event += f' ({", ".join(causes)})'
+        self.trace.setdefault(order.id, []).append(event)
+
+    def dump(self):
+        """
+        The counters, and the trace if one was recorded.
+
+        Returns:
+            * `dict`
+        """
+        data = {
+            'decisions': dict(self.decisions),
+            'evaluations': self.evaluations,
+            'iterations': self.iterations,
+            'cycle_fallbacks': self.cycle_fallbacks,
+            'convoy_searches': self.convoy_searches,
+        }
+        if self.trace is not None:
+            data['trace'] = {k: list(v) for k, v in self.trace.items()}
+        return data
+
+
+@contextmanager
+def fallback(state, name):
+    """
+    Mark the outcomes traced while the context is open as set by the named
+    fallback. Does nothing if the state is not instrumented.
+    """
+    instrumentation = state.instrumentation
+    if instrumentation is None:
+        yield
+        return
+    previous = instrumentation.fallback
+    instrumentation.fallback = name
+    try:
+        yield
+    finally:
+        instrumentation.fallback = previous
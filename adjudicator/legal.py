@@ -0,0 +1,320 @@
+from collections import OrderedDict
+
+from adjudicator.base import OrderType, Phase, PieceType
+
+
+class ReachabilityTable:
+    """
+    Where each type of piece can go from each territory and named coast of a
+    map. Entries hold ids only, so one table serves every state which has
+    the same map.
+
+    Entries are keyed by `(piece_type, territory_id, named_coast_id)`. The
+    named coast is only given for fleets on territories with named coasts.
+
+    * `moves` - `list` of the `(territory_id, named_coast_id)` pairs a piece
+      can move to without a convoy. The named coast is only given for
+      territories with named coasts.
+    * `supports` - `set` of the ids of the territories a piece can support
+      into.
+    * `coastal` - `list` of the ids of the coastal territories, which an army
+      on a coastal territory can reach by convoy.
+    """
+
+    def __init__(self, territories):
+        self.moves = {}
+        self.supports = {}
+        self.coastal = [t.id for t in territories if t.is_coastal]
+        for territory in territories:
+            if not territory.is_sea:
+                self._add_army(territory)
+            if not territory.is_inland:
+                for named_coast in territory.named_coasts or [None]:
+                    self._add_fleet(territory, named_coast)
+
+    def _add_army(self, territory):
+        key = (PieceType.ARMY, territory.id, None)
+        # An army can reach, and support into, any adjacent land territory.
+        targets = [t for t in territory.neighbours if not t.is_sea]
+        self.moves[key] = [(t.id, None) for t in targets]
+        self.supports[key] = {t.id for t in targets}
+
+    def _add_fleet(self, territory, named_coast):
+        key = (PieceType.FLEET, territory.id, getattr(named_coast, 'id', None))
+        candidates = list(territory.neighbours)
+        if named_coast:
+            candidates += [t for t in named_coast.neighbours if t not in candidates]
+
+        moves = []
+        supports = set()
+        for target in candidates:
+            if fleet_can_reach(territory, named_coast, target):
+                supports.add(target.id)
+            # A fleet can only move to an adjacent territory.
+            if not territory.adjacent_to(target):
+                continue
+            if target.is_complex:
+                for target_coast in target.named_coasts:
+                    if target_coast.adjacent_to(territory):
+                        moves.append((target.id, target_coast.id))
+            elif target.id in supports:
+                moves.append((target.id, None))
+        self.moves[key] = moves
+        self.supports[key] = supports
+
+
+def fleet_can_reach(territory, named_coast, target):
+    """
+    Whether a fleet on the given territory and named coast can reach the
+    target territory, regardless of the target's named coasts. The same rule
+    as `Fleet.can_reach_support`.
+    """
+    if named_coast:
+        return named_coast.adjacent_to(target)
+    if territory.is_coastal and target.is_coastal:
+        return territory.shares_coast_with(target)
+    return territory.adjacent_to(target) and not target.is_inland
+
+
+def map_key(state):
+    """
+    Identify the map of a state by its territories, named coasts and their
+    adjacency.
+    """
+    territories = tuple(
+        (
+            t.id, type(t).__name__, tuple(t.neighbour_ids),
+            tuple(getattr(t, 'shared_coast_ids', ())),
+        )
+        for t in state.territories
+    )
+    named_coasts = tuple(
+        (n.id, n.parent.id, tuple(n.neighbour_ids)) for n in state.named_coasts
+    )
+    return territories, named_coasts
+
+
+class MapTableCache:
+    """
+    Tables built from the maps seen by this process, e.g. reachability
+    tables. Once `maxsize` tables are held the least recently used table is
+    evicted.
+
+    Args:
+        * `build` - function which builds the table of the map of a state.
+        * `[maxsize]` - `int`
+    """
+
+    def __init__(self, build, maxsize=8):
+        self.build = build
+        self.maxsize = maxsize
+        self._tables = OrderedDict()
+
+    def __len__(self):
+        return len(self._tables)
+
+    def clear(self):
+        self._tables.clear()
+
+    def get(self, state):
+        """
+        Get the table of the map of a state, building it if it has not been
+        built before.
+        """
+        key = map_key(state)
+        table = self._tables.get(key)
+        if table is None:
+            table = self.build(state)
+            self._tables[key] = table
+        self._tables.move_to_end(key)
+        while len(self._tables) > self.maxsize:
+            self._tables.popitem(last=False)
+        return table
+
+
+reachability_cache = MapTableCache(lambda state: ReachabilityTable(state.territories))
+
+
+def piece_key(piece):
+    if piece.is_army:
+        return PieceType.ARMY, piece.territory.id, None
+    named_coast = getattr(piece.named_coast, 'id', None)
+    return PieceType.FLEET, piece.territory.id, named_coast
+
+
+class LegalOrders:
+    """
+    Enumerates the legal orders of the pieces and nations of a state.
+
+    Orders are given as `dict`s in the format of `OrderSchema` without an
+    `id`. They pass the same checks as `Order.check_legal`, using the
+    reachability table of the state's map rather than checking each
+    candidate order. Armies are only given convoyed moves from a coastal
+    territory to another coastal territory.
+
+    Args:
+        * `state` - `State`
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.table = reachability_cache.get(state)
+        self._positions = {t.id: i for i, t in enumerate(state.territories)}
+
+    def piece_orders(self, piece):
+        """
+        The legal orders of a piece for the phase of the state.
+
+        Returns:
+            * `list` of `dict`
+        """
+        phase = self.state.phase
+        if phase == Phase.ORDER:
+            return [
+                self._order(OrderType.HOLD, piece),
+                *self._moves(piece),
+                *self._supports(piece),
+                *self._convoys(piece),
+            ]
+        if phase == Phase.RETREAT:
+            if not piece.retreating:
+                return []
+            return [*self._retreats(piece), self._order(OrderType.DISBAND, piece)]
+        return [self._order(OrderType.DISBAND, piece)]
+
+    def nation_orders(self, nation):
+        """
+        The legal orders of each piece of a nation.
+
+        Returns:
+            * `dict` of the `list` of orders of each piece, keyed by piece id.
+        """
+        return {
+            p.id: self.piece_orders(p) for p in self.state.pieces
+            if p.nation == nation
+        }
+
+    def build_orders(self, nation):
+        """
+        The legal build orders of a nation in the build phase.
+
+        Returns:
+            * `list` of `dict`
+        """
+        if self.state.phase != Phase.BUILD:
+            return []
+        orders = []
+        for territory in self.state.land_territories:
+            if not (
+                territory.supply_center
+                and territory.nationality == nation
+                and self.state.controlled_by.get(territory) == nation
+                and not self.state.piece_in(territory)
+            ):
+                continue
+            orders.append(self._build(nation, territory, PieceType.ARMY))
+            if territory.is_complex:
+                for named_coast in territory.named_coasts:
+                    orders.append(self._build(
+                        nation, territory, PieceType.FLEET, named_coast.id
+                    ))
+            elif territory.is_coastal:
+                orders.append(self._build(nation, territory, PieceType.FLEET))
+        return orders
+
+    def _order(self, order_type, piece, **kwargs):
+        return {
+            'type': order_type,
+            'nation': piece.nation,
+            'source': piece.territory.id,
+            **kwargs,
+        }
+
+    def _build(self, nation, territory, piece_type, target_coast=None):
+        order = {
+            'type': OrderType.BUILD,
+            'nation': nation,
+            'source': territory.id,
+            'piece_type': piece_type,
+        }
+        if target_coast:
+            order['target_coast'] = target_coast
+        return order
+
+    def _move_targets(self, piece):
+        """
+        The ids of the territories a piece can move to, with or without a
+        convoy.
+        """
+        targets = {t for t, _ in self.table.moves.get(piece_key(piece), ())}
+        if piece.is_army and piece.territory.is_coastal:
+            targets.update(self.table.coastal)
+        targets.discard(piece.territory.id)
+        return targets
+
+    def _moves(self, piece):
+        orders = []
+        for target, target_coast in self.table.moves.get(piece_key(piece), ()):
+            order = self._order(OrderType.MOVE, piece, target=target)
+            if target_coast:
+                order['target_coast'] = target_coast
+            orders.append(order)
+        if piece.is_army and piece.territory.is_coastal:
+            for target in self.table.coastal:
+                if target != piece.territory.id:
+                    orders.append(self._order(
+                        OrderType.MOVE, piece, target=target, via_convoy=True
+                    ))
+        return orders
+
+    def _supports(self, piece):
+        reach = self.table.supports.get(piece_key(piece), set())
+        source = piece.territory.id
+        orders = []
+        for other in self.state.pieces:
+            if other is piece or other.retreating:
+                continue
+            aux = other.territory.id
+            if aux in reach:
+                orders.append(self._order(
+                    OrderType.SUPPORT, piece, aux=aux, target=aux
+                ))
+            targets = (reach & self._move_targets(other)) - {source}
+            for target in sorted(targets, key=self._positions.__getitem__):
+                orders.append(self._order(
+                    OrderType.SUPPORT, piece, aux=aux, target=target
+                ))
+        return orders
+
+    def _convoys(self, piece):
+        if not (piece.is_fleet and piece.territory.is_sea):
+            return []
+        orders = []
+        for other in self.state.pieces:
+            if not other.is_army or not other.territory.is_coastal or other.retreating:
+                continue
+            aux = other.territory.id
+            for target in self.table.coastal:
+                if target != aux:
+                    orders.append(self._order(
+                        OrderType.CONVOY, piece, aux=aux, target=target
+                    ))
+        return orders
+
+    def _retreats(self, piece):
+        reach = self.table.supports.get(piece_key(piece), set())
+        orders = []
+        for target in self.state.territories:
+            if target.id not in reach or target in self.state.contested \
+                    or target == piece.attacker_territory:
+                continue
+            if piece.is_fleet and target.is_complex:
+                for target_coast in target.named_coasts:
+                    if target_coast.adjacent_to(piece.territory):
+                        orders.append(self._order(
+                            OrderType.RETREAT, piece, target=target.id,
+                            target_coast=target_coast.id,
+                        ))
+                continue
+            orders.append(self._order(OrderType.RETREAT, piece, target=target.id))
+        return orders
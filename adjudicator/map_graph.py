@@ -0,0 +1,61 @@
+class MapGraph:
+    """
+    Adjacency information for the territories and named coasts registered to
+    a state.
+
+    Built once from the `neighbour_ids` and `shared_coast_ids` of every
+    territory and named coast, so that neighbour lists are not rebuilt on
+    each access and adjacency checks are set lookups. Everything is keyed by
+    id. Neighbour lists keep the registration order of the state.
+    """
+
+    def __init__(self, territories, named_coasts):
+        position = {t: i for i, t in enumerate(territories)}
+        territories_by_id = {}
+        for territory in territories:
+            territories_by_id.setdefault(territory.id, []).append(territory)
+
+        def resolve(ids):
+            resolved = []
+            for id in set(ids):
+                resolved.extend(territories_by_id.get(id, []))
+            return sorted(resolved, key=position.__getitem__)
+
+        self.neighbours = {}
+        self.neighbour_ids = {}
+        self.shared_coasts = {}
+        self.shared_coast_ids = {}
+        for territory in territories:
+            neighbours = resolve(territory.neighbour_ids)
+            self.neighbours[territory.id] = neighbours
+            self.neighbour_ids[territory.id] = frozenset(t.id for t in neighbours)
+            shared_coasts = resolve(getattr(territory, 'shared_coast_ids', []))
+            self.shared_coasts[territory.id] = shared_coasts
+            self.shared_coast_ids[territory.id] = frozenset(t.id for t in shared_coasts)
+
+        self.named_coasts = {}
+        self.coast_neighbours = {}
+        self.coast_neighbour_ids = {}
+        for named_coast in named_coasts:
+            self.named_coasts.setdefault(named_coast.parent.id, []).append(named_coast)
+            neighbours = resolve(named_coast.neighbour_ids)
+            self.coast_neighbours[named_coast.id] = neighbours
+            self.coast_neighbour_ids[named_coast.id] = frozenset(t.id for t in neighbours)
+
+    def adjacent(self, territory, other):
+        """
+        Whether `other` is a neighbour of `territory`.
+        """
+        return other.id in self.neighbour_ids.get(territory.id, ())
+
+    def share_coast(self, territory, other):
+        """
+        Whether `other` shares a coastline with `territory`.
+        """
+        return other.id in self.shared_coast_ids.get(territory.id, ())
+
+    def coast_adjacent(self, named_coast, territory):
+        """
+        Whether `territory` can be reached from `named_coast`.
+        """
+        return territory.id in self.coast_neighbour_ids.get(named_coast.id, ())
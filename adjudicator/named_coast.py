@@ -3,6 +3,8 @@ from .state import register
 
 class NamedCoast:
 
+    __slots__ = ('state', 'id', 'name', 'parent', 'neighbour_ids')
+
     @register
     def __init__(self, state, id, name, parent, neighbours):
         self.state = state
@@ -16,4 +18,7 @@ class NamedCoast:
 
     @property
     def neighbours(self):
-        return [t for t in self.state.territories if t.id in self.neighbour_ids]
+        return self.state.graph.coast_neighbours.get(self.id, [])
+
+    def adjacent_to(self, territory):
+        return self.state.graph.coast_adjacent(self, territory)
@@ -4,6 +4,8 @@ from .state import register
 
 class Nation:
 
+    __slots__ = ('state', 'id', 'name')
+
     @register
     def __init__(self, state, id, name):
         self.id = id
@@ -19,11 +21,13 @@ class Nation:
 
     @property
     def controlled_territories(self):
-        return [t for t in self.state.land_territories if t.controlled_by == self.id]
+        controlled_by = self.state.controlled_by
+        return [t for t in self.state.land_territories if controlled_by.get(t) == self.id]
 
     @property
     def captured_territories(self):
-        return [t for t in self.state.land_territories if t.captured_by == self.id]
+        captures = self.state.captures
+        return [t for t in self.state.land_territories if captures.get(t) == self.id]
 
     @property
     def next_turn_piece_count(self):
@@ -31,6 +35,8 @@ class Nation:
         Get the number of pieces that the nation will have going into the next
         turn.
         """
+        if self.state.summary is not None:
+            return self.state.summary.piece_count(self.id)
         return len([
             p for p in self.pieces if not p.destroyed and not
             (p.order.is_disband and p.order.outcome == Outcomes.SUCCEEDS)
@@ -42,9 +48,11 @@ class Nation:
         Get the number of supply centers that the nation will control going
         into the next turn.
         """
+        if self.state.summary is not None:
+            return self.state.summary.supply_center_count(self.id)
         territories = self.captured_territories
         for territory in self.controlled_territories:
-            if not territory.captured_by:
+            if territory not in self.state.captures:
                 territories.append(territory)
         supply_centers = [t for t in territories if t.supply_center]
         return len(supply_centers)
@@ -1,25 +1,37 @@
 from . import decisions, check
-from .convoy_chain import get_convoy_chains
+from .convoy_chain import ConvoyRoute
 from .decisions import Outcomes
-from .decisions.attack_strength import AttackStrength
 from .state import register
 
 
 class Order:
 
+    __slots__ = (
+        'state', 'id', 'nation', 'source', '_outcome', 'outcome_verbose',
+        'illegal', 'illegal_code', 'illegal_verbose',
+    )
+
+    is_hold = False
+    is_move = False
+    is_support = False
+    is_convoy = False
+    is_retreat = False
+    is_build = False
+    is_disband = False
+
     @register
     def __init__(self, state, id, nation, source, *args, **kwargs):
+        self.state = state
         self.id = id
         self.nation = nation
         self.source = source
 
-        self.outcome = Outcomes.UNRESOLVED
+        self._outcome = Outcomes.UNRESOLVED
         self.outcome_verbose = None
 
         self.illegal = False
         self.illegal_code = None
         self.illegal_verbose = None
-        self.state = state
 
     def __str__(self):
         piece_type = self.piece.__class__.__name__.lower()
@@ -32,25 +44,23 @@ class Order:
             result += f'{aux}-> {self.target}'
         return result
 
-    def __getattr__(self, name):
-        """
-        Adds the ability to determine the type of an order using the syntax
-        `order.is_<order_subclass>`.
-        """
-        subclasses = Order.__subclasses__()
-        for s in subclasses:
-            if name == 'is_' + s.__name__.lower():
-                return isinstance(self, s)
-        raise AttributeError(
-            f'{self.__class__.__name__} has no attribute \'{name}\'.'
-        )
+    @property
+    def outcome(self):
+        tracker = self.state.tracker
+        if tracker is not None:
+            tracker.read(self)
+        return self._outcome
+
+    @outcome.setter
+    def outcome(self, outcome):
+        previous = self._outcome
+        self._outcome = outcome
+        if outcome != previous:
+            self.state.outcome_changed(self, previous)
 
     @property
     def piece(self):
-        return next(
-            iter([p for p in self.state.pieces if p.territory == self.source]),
-            None
-        )
+        return self.state.piece_index.order_piece(self)
 
     @property
     def legal(self):
@@ -58,10 +68,7 @@ class Order:
 
     @property
     def hold_support_orders(self):
-        return [
-            o for o in self.state.orders if isinstance(o, Support)
-            and o.aux == self.source and o.target == self.source
-        ]
+        return self.state.order_index.supports(self.source, self.source)
 
     def resolve(self):
         if not self.outcome == Outcomes.UNRESOLVED:
@@ -73,6 +80,17 @@ class Order:
         elif self.check_succeeds():
             self.outcome = Outcomes.SUCCEEDS
 
+    def reset(self):
+        """
+        Forget the outcome and legality of the order so that it can be
+        adjudicated again.
+        """
+        self._outcome = Outcomes.UNRESOLVED
+        self.outcome_verbose = None
+        self.illegal = False
+        self.illegal_code = None
+        self.illegal_verbose = None
+
     def set_illegal(self, code, message):
         self.illegal_code = code
         self.illegal_verbose = message
@@ -95,7 +113,7 @@ class Order:
             'illegal': self.illegal,
             'illegal_code': self.illegal_code,
             'illegal_verbose': self.illegal_verbose,
-            'outcome': self.outcome,
+            'outcome': Outcomes.name(self.outcome),
         }
 
     def hold_support(self, *args):
@@ -107,12 +125,27 @@ class Order:
         """
         return [s for s in self.hold_support_orders if s.outcome in args]
 
+    def hold_support_count(self, *args):
+        """
+        Number of support orders which are supporting the given order to hold.
+
+        Returns:
+            * `int`
+        """
+        key = (self.source, self.source)
+        if self.state.tracker is not None:
+            self.state.tracker.read(key)
+        return self.state.order_index.support_count(*key, *args)
+
 
 class DummyHold(Order):
     """
     Represents a hold order for a piece which did not receive an order. Does
     not get registered to the state.
     """
+
+    __slots__ = ()
+
     def __init__(self, state, nation, source, **kwargs):
         self.nation = nation
         self.source = source
@@ -127,6 +160,10 @@ class DummyHold(Order):
 
 class Hold(Order):
 
+    __slots__ = ()
+
+    is_hold = True
+
     checks = [
         check.SourcePieceBelongsToNation,
     ]
@@ -135,9 +172,21 @@ class Hold(Order):
         super().__init__(*args, **kwargs)
         self.outcome = Outcomes.SUCCEEDS
 
+    def reset(self):
+        super().reset()
+        self._outcome = Outcomes.SUCCEEDS
+
 
 class Move(Order):
 
+    __slots__ = (
+        'target', 'target_coast', 'via_convoy', 'attack_strength_decision',
+        'prevent_strength_decision', 'defend_strength_decision',
+        'path_decision', '_convoy_route',
+    )
+
+    is_move = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.SourceAndTargetDistinct,
@@ -154,50 +203,55 @@ class Move(Order):
         self.target = target
         self.target_coast = target_coast
         self.via_convoy = kwargs.get('via_convoy', False)
+        self._reset_decisions()
 
+    def _reset_decisions(self):
         self.attack_strength_decision = decisions.AttackStrength(self)
         self.prevent_strength_decision = decisions.PreventStrength(self)
         self.defend_strength_decision = decisions.DefendStrength(self)
         self.path_decision = decisions.Path(self)
+        self._convoy_route = None
+
+    def reset(self):
+        super().reset()
+        self._reset_decisions()
 
     @property
-    def convoy_chains(self):
-        if not self.via_convoy:
-            return []
-        eligible_convoys = [
-            o for o in self.state.orders if isinstance(o, Convoy)
-            and o.aux == self.source and o.target == self.target
-        ]
-        return get_convoy_chains(self.source, self.target, eligible_convoys)
+    def convoy_route(self):
+        """
+        The `ConvoyRoute` made up of the convoy orders for this move. Built on
+        first access.
+        """
+        if self._convoy_route is None:
+            eligible_convoys = self.state.order_index.convoys(self.source, self.target)
+            self._convoy_route = ConvoyRoute(self.state, self.source, self.target, eligible_convoys)
+        return self._convoy_route
 
     @property
     def move_support_orders(self):
-        return [
-            o for o in self.state.orders if isinstance(o, Support)
-            and o.aux == self.source and o.target == self.target
-        ]
+        return self.state.order_index.supports(self.source, self.target)
 
     def check_succeeds(self):
 
         if self.path_decision() != Outcomes.PATH:
             return False
 
-        min_attack_strength, _ = AttackStrength(self)()
+        min_attack_strength, _ = self.attack_strength_decision()
         _, max_to_beat = self._get_strength_to_beat()
         max_prevent = max(
             [p.order.prevent_strength_decision()[1]
-             for p in self.target.other_attacking_pieces(self.piece)],
+             for p in self.state.other_attacking_pieces(self.target, self.piece)],
             default=0
         )
 
         return min_attack_strength > max([max_to_beat, max_prevent])
 
     def check_fails(self):
-        _, max_attack_strength = AttackStrength(self)()
+        _, max_attack_strength = self.attack_strength_decision()
         min_to_beat, _ = self._get_strength_to_beat()
-        min_prevent = min([p.order.prevent_strength_decision()[0] for p in self.target.other_attacking_pieces(self.piece)], default=100)
+        min_prevent = min([p.order.prevent_strength_decision()[0] for p in self.state.other_attacking_pieces(self.target, self.piece)], default=100)
 
-        other_attacking_pieces = self.target.other_attacking_pieces(self.piece)
+        other_attacking_pieces = self.state.other_attacking_pieces(self.target, self.piece)
 
         if self.path_decision() == Outcomes.NO_PATH:
             self.outcome_verbose = 'Order cannot reach target - {}' \
@@ -223,6 +277,21 @@ class Move(Order):
         return [s for s in self.move_support_orders if
                 s.outcome in args and s.legal]
 
+    def move_support_count(self, *args, exclude_nation=None):
+        """
+        Number of support orders which are supporting this move. Illegal
+        supports always fail so are never counted as succeeding or unresolved.
+
+        Returns:
+            * `int`
+        """
+        key = (self.source, self.target)
+        if self.state.tracker is not None:
+            self.state.tracker.read(key)
+        return self.state.order_index.support_count(
+            *key, *args, exclude_nation=exclude_nation
+        )
+
     def is_head_to_head(self):
         """
         Determine whether the move is a head to head battle, i.e. the target
@@ -231,7 +300,7 @@ class Move(Order):
         Returns:
             * `bool`
         """
-        opposing_piece = self.target.piece
+        opposing_piece = self.state.piece_in(self.target)
         if opposing_piece:
             if opposing_piece.order.is_move:
                 if not (self.via_convoy or opposing_piece.order.via_convoy):
@@ -247,7 +316,7 @@ class Move(Order):
         Returns:
             * `bool`
         """
-        opposing_piece = self.target.piece
+        opposing_piece = self.state.piece_in(self.target)
         if opposing_piece:
             if opposing_piece.order.is_move:
                 if opposing_piece.order.via_convoy:
@@ -258,12 +327,16 @@ class Move(Order):
 
     def _get_strength_to_beat(self):
         if self.is_head_to_head():
-            return self.target.piece.order.defend_strength_decision()
-        return self.target.hold_strength
+            return self.state.piece_in(self.target).order.defend_strength_decision()
+        return self.state.hold_strength(self.target)
 
 
 class Support(Order):
 
+    __slots__ = ('aux', 'target')
+
+    is_support = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.SourceAndTargetDistinct,
@@ -279,29 +352,36 @@ class Support(Order):
     def check_succeeds(self):
         if not self.piece.dislodged_decision == Outcomes.SUSTAINS:
             return False
-        source_attacking_pieces = self.source.other_attacking_pieces(self.target.piece)
+        target_piece = self.state.piece_in(self.target)
+        aux_piece = self.state.piece_in(self.aux)
+        source_attacking_pieces = self.state.other_attacking_pieces(self.source, target_piece)
         if not source_attacking_pieces:
             return True
-        if self.target.piece and self.aux.piece:
+        if target_piece and aux_piece:
             # If the aux piece is moving to the right target.
-            if self.aux.piece.order.is_move and self.aux.piece.order.target == self.target:
+            if aux_piece.order.is_move and aux_piece.order.target == self.target:
                 # If no pieces (other than the target piece) have strength
                 if all([p.order.attack_strength_decision.max_strength == 0 for p in source_attacking_pieces]):
                     return True
-        if self.target.piece and self.aux.piece:
+        if target_piece and aux_piece:
+            return all([not p.order.attack_strength_decision.max_strength for p in source_attacking_pieces])
+        if not target_piece:
+            # A support to move into an empty territory is only cut by an
+            # attack which can have strength.
             return all([not p.order.attack_strength_decision.max_strength for p in source_attacking_pieces])
 
-        if isinstance(self.target.piece.order, Convoy):
-            convoying_order = self.target.piece.order
-            if convoying_order.aux.piece:
+        if isinstance(target_piece.order, Convoy):
+            convoying_order = target_piece.order
+            convoyed_piece = self.state.piece_in(convoying_order.aux)
+            if convoyed_piece:
                 if all([p.order.attack_strength == 0
-                        for p in self.source.other_attacking_pieces(convoying_order.aux.piece)]):
+                        for p in self.state.other_attacking_pieces(self.source, convoyed_piece)]):
                     return True
 
     def check_fails(self):
         if self.piece.dislodged_decision == Outcomes.DISLODGED:
             self.outcome_verbose = 'Support fails because dislodged.'
-        aux_order = self.aux.piece.order
+        aux_order = self.state.piece_in(self.aux).order
         aux_piece_moves = aux_order.is_move and aux_order.legal
         if aux_piece_moves and aux_order.target != self.target:
             self.outcome_verbose = 'Aux piece is does not move to target.'
@@ -309,9 +389,10 @@ class Support(Order):
             if self.target != self.aux:
                 self.outcome_verbose = 'Aux piece does not move.'
 
-        if self.source.attacking_pieces and \
+        source_attacking_pieces = self.state.attacking_pieces(self.source)
+        if source_attacking_pieces and \
                 any([p.order.attack_strength_decision()[0] >= 1
-                     for p in self.source.attacking_pieces
+                     for p in source_attacking_pieces
                      if p.territory != self.target]
                     ):
             self.outcome_verbose = 'Support is cut by attacking piece.'
@@ -320,6 +401,10 @@ class Support(Order):
 
 class Convoy(Order):
 
+    __slots__ = ('aux', 'target')
+
+    is_convoy = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.ConvoyeeIsArmy,
@@ -341,6 +426,10 @@ class Convoy(Order):
 
 class Retreat(Order):
 
+    __slots__ = ('target', 'target_coast')
+
+    is_retreat = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.TargetNotAttackerTerritory,
@@ -356,7 +445,7 @@ class Retreat(Order):
     def resolve(self):
 
         piece = self.piece
-        other_retreating_pieces = self.target.other_retreating_pieces(piece)
+        other_retreating_pieces = self.state.other_retreating_pieces(self.target, piece)
 
         if other_retreating_pieces:
             self.outcome = Outcomes.FAILS
@@ -366,6 +455,10 @@ class Retreat(Order):
 
 class Build(Order):
 
+    __slots__ = ('piece_type', 'named_coast')
+
+    is_build = True
+
     checks = [
         check.SourceNotOccupied,
         check.SourceHasSupplyCenter,
@@ -387,6 +480,10 @@ class Build(Order):
 
 class Disband(Order):
 
+    __slots__ = ()
+
+    is_disband = True
+
     checks = [
         check.SourcePieceBelongsToNation,
     ]
@@ -0,0 +1,97 @@
+class OrderIndex:
+    """
+    Orders grouped by the territories they relate to.
+
+    Built once the orders of a turn have been registered so that attackers,
+    supporters and convoyers of a given order can be looked up directly
+    instead of filtering every order in the state.
+
+    * `moves_by_target` - move orders keyed by target territory.
+    * `retreats_by_target` - retreat orders keyed by target territory.
+    * `supports_by_aux_and_target` - support orders keyed by `(aux, target)`.
+    * `convoys_by_aux_and_target` - convoy orders keyed by `(aux, target)`.
+
+    The number of supports for each `(aux, target)` is also kept per outcome,
+    and per outcome and nation, and updated as support outcomes change so
+    that strengths can be calculated without recounting supports.
+    """
+
+    def __init__(self, orders):
+        from adjudicator.order import Convoy, Move, Retreat, Support
+
+        self.moves_by_target = {}
+        self.retreats_by_target = {}
+        self.supports_by_aux_and_target = {}
+        self.convoys_by_aux_and_target = {}
+        self.support_keys = {}
+        self.support_counts = {}
+
+        for order in orders:
+            if isinstance(order, Move):
+                self.moves_by_target.setdefault(order.target, []).append(order)
+            elif isinstance(order, Retreat):
+                self.retreats_by_target.setdefault(order.target, []).append(order)
+            elif isinstance(order, Support):
+                key = (order.aux, order.target)
+                self.supports_by_aux_and_target.setdefault(key, []).append(order)
+                self.support_keys[order] = key
+                self._count_support(order, order.outcome, 1)
+            elif isinstance(order, Convoy):
+                key = (order.aux, order.target)
+                self.convoys_by_aux_and_target.setdefault(key, []).append(order)
+
+    def _count_support(self, support, outcome, change):
+        counts = self.support_counts.setdefault(self.support_keys[support], {})
+        for count_key in (outcome, (outcome, support.nation)):
+            counts[count_key] = counts.get(count_key, 0) + change
+
+    def outcome_changed(self, order, previous):
+        """
+        Update the support counts when the outcome of a support changes.
+
+        Returns:
+            * `tuple` - the `(aux, target)` of the support, or `None` if the
+              order is not a support.
+        """
+        key = self.support_keys.get(order)
+        if key is not None:
+            self._count_support(order, previous, -1)
+            self._count_support(order, order.outcome, 1)
+        return key
+
+    def support_count(self, aux, target, *outcomes, exclude_nation=None):
+        """
+        Get the number of supports from `aux` to `target` which have one of the
+        given outcomes.
+
+        Args:
+            * `aux` - `Territory`
+            * `target` - `Territory`
+            * `*outcomes` - `str`
+            * `[exclude_nation]` - `str` - do not count supports from this
+              nation.
+
+        Returns:
+            * `int`
+        """
+        counts = self.support_counts.get((aux, target))
+        if not counts:
+            return 0
+        total = 0
+        for outcome in outcomes:
+            total += counts.get(outcome, 0)
+            if exclude_nation is not None:
+                total -= counts.get((outcome, exclude_nation), 0)
+        return total
+
+    def moves(self, target):
+        return self.moves_by_target.get(target, [])
+
+    def retreats(self, target):
+        return self.retreats_by_target.get(target, [])
+
+    def supports(self, aux, target):
+        return self.supports_by_aux_and_target.get((aux, target), [])
+
+    def convoys(self, aux, target):
+        return self.convoys_by_aux_and_target.get((aux, target), [])
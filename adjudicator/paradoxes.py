@@ -1,26 +1,228 @@
-def find_circular_movements(ms):
+from adjudicator.decisions import Outcomes
+from adjudicator.exceptions import ResolutionStalledException
+from adjudicator.piece import Piece
+
+
+def find_circular_movements(moves):
+    """
+    Find every circular movement of three or more pieces among the given
+    moves. A head to head battle is not a circular movement.
+
+    Each territory has at most one piece moving out of it, so the moves form
+    a graph where every move has at most one successor - the move of the
+    piece in its target. Each move is visited once, so this is linear in the
+    number of moves.
+
+    Args:
+        * `moves` - `list` of `Move` instances
+
+    Returns:
+        * `list` where each element is a `list` of the `Move` instances in a
+          circular movement, in the order in which they are followed.
+    """
+    move_set = set(moves)
     circular_movements = []
-    moves = [m for m in ms]
-    while moves:
-        node_a = moves[0]
-        # look at the target of the first move
-        moves = [m for m in moves if m != node_a]
-        if node_a.target.piece:
-            node_b = node_a.target.piece.order
-            moves = [m for m in moves if m != node_b]
-            # This would be a head to head.
-            if node_b.is_move and node_b.target != node_a.source:
-                # go
-                next_node = node_b.target.piece.order
-                found_original_node = False
-                nodes = [node_a, node_b]
-                while not found_original_node:
-                    nodes.append(next_node)
-                    moves = [m for m in moves if m != next_node]
-                    if next_node.is_move:
-                        if next_node.target == node_a.source:
-                            found_original_node = True
-                            circular_movements.append(nodes)
-                        else:
-                            next_node = next_node.target.piece.order
+    # The walk in which each move was first visited.
+    visited = {}
+    for walk, move in enumerate(moves):
+        path = []
+        while move is not None and move not in visited:
+            visited[move] = walk
+            path.append(move)
+            piece = move.state.piece_in(move.target)
+            move = piece.order if piece else None
+            if move not in move_set:
+                move = None
+        # A cycle exists if the walk arrived back at a move it visited itself.
+        if move is not None and visited[move] == walk:
+            cycle = path[path.index(move):]
+            if len(cycle) > 2:
+                circular_movements.append(cycle)
     return circular_movements
+
+
+# The number of guesses which may be nested inside one another before the
+# remaining decisions are left unresolved. Each guess resolves the orders
+# twice, so this bounds the work done for a turn.
+MAX_GUESS_DEPTH = 4
+
+
+def save_resolution(state, items=None):
+    """
+    Take a copy of everything that changes while orders are resolved so that
+    it can be restored after a guess.
+
+    Args:
+        * `state` - `State`
+        * `[items]` - `list` of the orders and pieces to copy. Defaults to
+          every order and piece in the state.
+
+    Returns:
+        * `tuple` - order states and piece states.
+    """
+    if items is None:
+        items = [*state.orders, *state.pieces]
+    orders = []
+    for order in (i for i in items if not isinstance(i, Piece)):
+        decisions = [
+            (d, dict(vars(d))) for d in (
+                getattr(order, 'attack_strength_decision', None),
+                getattr(order, 'prevent_strength_decision', None),
+                getattr(order, 'path_decision', None),
+            ) if d is not None
+        ]
+        orders.append((order, order._outcome, order.outcome_verbose, decisions))
+    pieces = [
+        (p, p._dislodged_decision, p.dislodged_by, p.dislodged_from)
+        for p in items if isinstance(p, Piece)
+    ]
+    return orders, pieces
+
+
+def restore_resolution(state, saved):
+    """
+    Restore the state saved by `save_resolution`. Outcomes are restored
+    through their setters so that the support counts are kept in step.
+    """
+    orders, pieces = saved
+    for order, outcome, outcome_verbose, decisions in orders:
+        order.outcome = outcome
+        order.outcome_verbose = outcome_verbose
+        for decision, attributes in decisions:
+            vars(decision).clear()
+            vars(decision).update(attributes)
+    for piece, dislodged_decision, dislodged_by, dislodged_from in pieces:
+        piece.dislodged_decision = dislodged_decision
+        piece.dislodged_by = dislodged_by
+        piece.dislodged_from = dislodged_from
+
+
+def find_dependency_cycle(state, worklist, unresolved):
+    """
+    Follow the dependencies recorded by the worklist between the unresolved
+    items until an item is reached a second time.
+
+    Returns:
+        * `list` of the items in the cycle, or an empty list if no cycle is
+          found.
+    """
+    unresolved_set = set(unresolved)
+    dependencies = {}
+    for subject, readers in worklist.readers.items():
+        if isinstance(subject, tuple):
+            subjects = state.order_index.supports(*subject)
+        else:
+            subjects = [subject]
+        subjects = [s for s in subjects if s in unresolved_set]
+        for reader in readers:
+            if reader in unresolved_set:
+                dependencies.setdefault(reader, []).extend(subjects)
+
+    item = unresolved[0]
+    path = []
+    positions = {}
+    while item not in positions:
+        positions[item] = len(path)
+        path.append(item)
+        next_items = dependencies.get(item)
+        if not next_items:
+            return []
+        item = next_items[0]
+    return path[positions[item]:]
+
+
+def is_consistent(move, guess):
+    """
+    Whether the move resolves to the guessed outcome when every other
+    decision is resolved.
+    """
+    move.outcome = Outcomes.UNRESOLVED
+    move.resolve()
+    return move.outcome == guess
+
+
+def apply_szykman_rule(moves):
+    """
+    Apply the Szykman rule to a convoy paradox - each move via convoy whose
+    path depends on the paradox is treated as though its convoy was
+    disrupted. The move fails and has no effect on its target.
+
+    Returns:
+        * `bool` - whether any moves were affected.
+    """
+    affected = False
+    for move in moves:
+        if move.via_convoy and move.path_decision.result == Outcomes.UNRESOLVED:
+            move.path_decision.result = Outcomes.NO_PATH
+            move.path_decision.message = 'convoy paradox.'
+            affected = True
+    return affected
+
+
+def resolve_by_guessing(state, worklist, unresolved, resolve, depth,
+                        scope=None):
+    """
+    Resolve a dependency cycle which the worklist cannot make progress on
+    using Kruijswijk's guess and verify approach.
+
+    A move in the cycle is guessed to fail and the remaining orders are
+    resolved. The guess is consistent if the move then fails. The same is
+    done guessing that the move succeeds.
+
+    * If exactly one guess is consistent, that resolution is kept.
+    * If both guesses are consistent and the cycle does not involve a convoy
+      it is a circular movement and the move succeeds.
+    * Otherwise the cycle is a convoy paradox and the Szykman rule is applied.
+      If there are no convoyed moves to apply it to, the move fails.
+
+    Raises `ResolutionStalledException` if no move is unresolved, as there is
+    then nothing to guess.
+
+    Args:
+        * `state` - `State`
+        * `worklist` - `Worklist` which has stalled on `unresolved`.
+        * `unresolved` - `list` of unresolved orders and pieces.
+        * `resolve` - function used to resolve the orders and pieces after a
+          guess. Called with the items to resolve and the guess depth.
+        * `depth` - the number of guesses this one is nested inside.
+        * `[scope]` - `list` of the orders and pieces which can change while
+          guessing. Defaults to every order and piece in the state.
+    """
+    cycle = find_dependency_cycle(state, worklist, unresolved) or unresolved
+    moves = [i for i in cycle if getattr(i, 'is_move', False)]
+    if not moves:
+        moves = [i for i in unresolved if getattr(i, 'is_move', False)]
+    if not moves:
+        # Every support, convoy and dislodge decision depends on a move, so a
+        # stall without one means a dependency was not tracked.
+        raise ResolutionStalledException(
+            'Resolution stalled without an unresolved move: {}'.format(unresolved)
+        )
+    move = moves[0]
+    others = [i for i in unresolved if i is not move]
+    involves_convoy = any(
+        getattr(i, 'is_convoy', False) or getattr(i, 'via_convoy', False)
+        for i in cycle
+    )
+
+    saved = save_resolution(state, scope)
+    consistent = {}
+    for guess in [Outcomes.FAILS, Outcomes.SUCCEEDS]:
+        move.outcome = guess
+        remaining = resolve(others, depth + 1)
+        if not remaining and is_consistent(move, guess):
+            consistent[guess] = save_resolution(state, scope)
+        restore_resolution(state, saved)
+
+    if len(consistent) == 1:
+        restore_resolution(state, next(iter(consistent.values())))
+        return
+    if len(consistent) == 2 and not involves_convoy:
+        restore_resolution(state, consistent[Outcomes.SUCCEEDS])
+        return
+    # Only convoyed moves of the cluster being resolved are affected. Moves of
+    # other clusters may not have been resolved yet.
+    items = state.orders if scope is None else scope
+    convoyed_moves = [o for o in items if getattr(o, 'via_convoy', False)]
+    if not apply_szykman_rule(convoyed_moves):
+        move.outcome = Outcomes.FAILS
@@ -0,0 +1,334 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from adjudicator.cluster import find_data_clusters
+from adjudicator.exceptions import UnknownMapException
+
+
+class TurnError:
+    """
+    A turn which could not be processed.
+
+    * `turn_id` - the id of the turn, if it has one.
+    * `exception` - the exception raised while processing the turn.
+    """
+
+    def __init__(self, turn_id, exception):
+        self.turn_id = turn_id
+        self.exception = exception
+
+    def __repr__(self):
+        return f'TurnError({self.turn_id!r}, {self.exception!r})'
+
+
+def process_game_states(turns, workers=None, ordered=True, trusted=False,
+                        return_exceptions=False, max_pending=None):
+    """
+    Process many turns across a pool of worker processes.
+
+    Each worker compiles the map of a variant the first time it processes a
+    turn of that variant and keeps it, so the map of later turns is not
+    validated or built from scratch again. Turns are read from `turns` as workers become free, so only a
+    bounded number of turns and results are held in memory at once.
+
+    Args:
+        * `turns` - iterable of `dict` - turn data in the format of
+          `TurnSchema`.
+        * `[workers]` - `int` - number of worker processes. Defaults to the
+          number of CPUs. With one worker turns are processed in this process.
+        * `[ordered]` - `bool` - yield results in the order the turns were
+          given. Otherwise results are yielded as soon as they are ready.
+        * `[trusted]` - `bool` - skip validation of each turn.
+        * `[return_exceptions]` - `bool` - yield a `TurnError` holding the
+          exception raised while processing a turn instead of raising it.
+        * `[max_pending]` - `int` - maximum number of turns submitted to the
+          pool at once. Defaults to four per worker.
+
+    Yields:
+        * `dict` - the processed turn, or `TurnError` if `return_exceptions`
+          is given and the turn could not be processed.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for turn in turns:
+            yield _get_result(
+                turn.get('id'), _process, (turn, trusted), return_exceptions
+            )
+        return
+
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for turn in turns:
+            future = executor.submit(_process, turn, trusted)
+            pending.append((turn.get('id'), future))
+            if len(pending) >= max_pending:
+                yield from _collect(pending, ordered, return_exceptions)
+        while pending:
+            yield from _collect(pending, ordered, return_exceptions)
+
+
+def process_turn_clusters(data, workers=None, trusted=False, executor=None):
+    """
+    Process one turn with its clusters of orders (see `find_clusters`)
+    resolved across a pool of worker processes.
+
+    The map of the turn is compiled (see `compile_map`) and the clusters are
+    shared out between the workers in one batch each. A batch holds only the
+    orders and pieces of its clusters, the state of their territories and the
+    hash of the map. Each worker compiles the map the first time it is sent
+    a batch of that map, so a pool which is given as `executor` and kept for
+    many turns sends and compiles each map once per worker. The turn is built
+    while the workers resolve their batches. The outcome, legality and path
+    of each order and the dislodged decision of each piece are then set from
+    the results of the batches and the turn is summarized as usual. The
+    result is the same as `process_game_state`.
+
+    Starting a pool costs more than resolving a turn, so a pool should only
+    be started for a single turn when its clusters are very large.
+
+    Args:
+        * `data` - `dict` - turn data in the format of `TurnSchema`.
+        * `[workers]` - `int` - number of batches, and of worker processes if
+          no `executor` is given. Defaults to the number of CPUs. With one
+          worker, or a turn with only one cluster, the turn is processed in
+          this process.
+        * `[trusted]` - `bool` - skip validation of the turn.
+        * `[executor]` - `ProcessPoolExecutor` to resolve the batches with.
+
+    Returns:
+        * `dict` - the processed turn.
+    """
+    from adjudicator import (
+        add_turn, create_turn_state, compile_map, load_turn_state
+    )
+    from adjudicator.processor import conclude, process
+    from adjudicator.schema import TurnSchema
+
+    map_hash = compile_map(data)
+    turn_data = {k: v for k, v in data.items() if k != 'named_coasts'}
+    turn_data['map_hash'] = map_hash
+    compiled_map, validated_data = load_turn_state(turn_data, trusted)
+
+    workers = workers or os.cpu_count() or 1
+    clusters = []
+    if workers > 1:
+        clusters = find_data_clusters(
+            validated_data['orders'], validated_data['pieces']
+        )
+    if len(clusters) < 2:
+        state = create_turn_state(compiled_map, validated_data)
+        add_turn(state, validated_data)
+        process(state)
+    else:
+        batches = [
+            cluster_batch(validated_data, batch)
+            for batch in batch_clusters(clusters, workers)
+        ]
+        map_data = {
+            'variant': compiled_map.variant,
+            'territories': data['territories'],
+            'named_coasts': data['named_coasts'],
+        }
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=len(batches)) as executor:
+                state = _resolve_batches(
+                    executor, validated_data, compiled_map, batches, map_data
+                )
+        else:
+            state = _resolve_batches(
+                executor, validated_data, compiled_map, batches, map_data
+            )
+        conclude(state)
+
+    processed_data = TurnSchema().dump(state)
+    processed_data['id'] = validated_data['id']
+    return processed_data
+
+
+def batch_clusters(clusters, count):
+    """
+    Share clusters out between at most `count` batches so that each batch
+    holds about the same number of orders and pieces.
+
+    Returns:
+        * `list` of `list` of `Cluster` instances.
+    """
+    batches = [[] for _ in range(min(count, len(clusters)))]
+    sizes = [0] * len(batches)
+    clusters = sorted(
+        clusters, key=lambda c: len(c.orders) + len(c.pieces), reverse=True
+    )
+    for cluster in clusters:
+        i = sizes.index(min(sizes))
+        batches[i].append(cluster)
+        sizes[i] += len(cluster.orders) + len(cluster.pieces)
+    return batches
+
+
+def cluster_batch(validated_data, clusters):
+    """
+    Get the validated data of a turn holding only the orders and pieces of
+    the given clusters and the state of their territories.
+    """
+    territories = set()
+    orders = []
+    pieces = []
+    for cluster in clusters:
+        territories |= cluster.territories
+        orders += cluster.orders
+        # Pieces are copied as building a turn changes its piece data.
+        pieces += [dict(p) for p in cluster.pieces]
+    return {
+        'season': validated_data['season'],
+        'phase': validated_data['phase'],
+        'year': validated_data['year'],
+        'territories': [
+            t for t in validated_data['territories'] if t['id'] in territories
+        ],
+        'orders': orders,
+        'pieces': pieces,
+        'nations': [],
+    }
+
+
+def merge_cluster_results(state, results):
+    """
+    Set the outcome, legality and path of each order, and the dislodged
+    decision of each piece, from the results of batches of clusters (see
+    `resolve_clusters`).
+    """
+    orders = {o.id: o for o in state.orders}
+    pieces = {p.id: p for p in state.pieces}
+    for order_results, piece_results in results:
+        for order_id, outcome, illegal, path, path_message in order_results:
+            order = orders[order_id]
+            if illegal:
+                order.illegal = True
+                order.illegal_code, order.illegal_verbose = illegal
+            order.outcome = outcome
+            if path is not None:
+                order.path_decision.result = path
+                order.path_decision.message = path_message
+        for piece_id, dislodged_decision, dislodged_by, dislodged_from \
+                in piece_results:
+            piece = pieces[piece_id]
+            piece.dislodged_decision = dislodged_decision
+            piece.dislodged_by = pieces.get(dislodged_by)
+            if dislodged_from is not None:
+                piece.dislodged_from = state.get_territory_by_id(dislodged_from)
+
+
+def resolve_clusters(variant, map_hash, validated_data, map_data=None):
+    """
+    Resolve a batch of clusters (see `cluster_batch`) on a compiled map.
+    Raises `UnknownMapException` if the map is not in the map cache of this
+    process and `map_data` is not given to compile it.
+
+    Returns:
+        * `tuple` of a `list` of the id, outcome, legality and path of each
+          order and a `list` of the id and dislodged decision of each piece.
+          Territories and pieces are given by id.
+    """
+    from adjudicator import add_turn, create_turn_state, map_cache
+    from adjudicator.processor import adjudicate
+
+    compiled_map = map_cache.get(variant, map_hash)
+    if compiled_map is None:
+        if map_data is None:
+            raise UnknownMapException(
+                f'Map {map_hash} for variant {variant} has not been compiled.'
+            )
+        compiled_map = map_cache.compile(map_data)
+    state = create_turn_state(compiled_map, validated_data)
+    add_turn(state, validated_data)
+    adjudicate(state, state.orders, state.pieces)
+
+    order_results = []
+    for order in state.orders:
+        illegal = None
+        if order.illegal:
+            illegal = (order.illegal_code, order.illegal_verbose)
+        path = path_message = None
+        if order.is_move:
+            path = order.path_decision.result
+            path_message = order.path_decision.message
+        order_results.append(
+            (order.id, order.outcome, illegal, path, path_message)
+        )
+    piece_results = [
+        (
+            piece.id,
+            piece.dislodged_decision,
+            piece.dislodged_by and piece.dislodged_by.id,
+            piece.dislodged_from and piece.dislodged_from.id,
+        )
+        for piece in state.pieces
+    ]
+    return order_results, piece_results
+
+
+def _resolve_batches(executor, validated_data, compiled_map, batches, map_data):
+    """
+    Resolve batches of clusters with the executor, building the state of the
+    turn while they are resolved, and set their results on the state.
+    Batches sent to a worker which has not compiled the map are sent again
+    with the map.
+    """
+    from adjudicator import add_turn, create_turn_state
+
+    def submit(batch, *args):
+        return executor.submit(
+            resolve_clusters, compiled_map.variant,
+            compiled_map.content_hash, batch, *args
+        )
+
+    futures = [(batch, submit(batch)) for batch in batches]
+    state = create_turn_state(compiled_map, validated_data)
+    add_turn(state, validated_data)
+    results = []
+    for batch, future in futures:
+        try:
+            results.append(future.result())
+        except UnknownMapException:
+            results.append(submit(batch, map_data).result())
+    merge_cluster_results(state, results)
+    return state
+
+
+def _collect(pending, ordered, return_exceptions):
+    """
+    Wait for at least one pending future. In order, only the oldest future is
+    waited for. Otherwise every future which has completed is collected.
+    """
+    if ordered:
+        turn_id, future = pending.popleft()
+        yield _get_result(turn_id, future.result, (), return_exceptions)
+        return
+    done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+    for item in [i for i in pending if i[1] in done]:
+        pending.remove(item)
+        turn_id, future = item
+        yield _get_result(turn_id, future.result, (), return_exceptions)
+
+
+def _get_result(turn_id, func, args, return_exceptions):
+    if not return_exceptions:
+        return func(*args)
+    try:
+        return func(*args)
+    except Exception as e:
+        return TurnError(turn_id, e)
+
+
+def _process(data, trusted=False):
+    """
+    Process a full turn payload using the compiled map of its variant.
+    """
+    from adjudicator import compile_map, process_turn_state
+
+    map_hash = compile_map(data)
+    turn_data = {k: v for k, v in data.items() if k != 'named_coasts'}
+    turn_data['map_hash'] = map_hash
+    return process_turn_state(turn_data, trusted=trusted)
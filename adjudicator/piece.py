@@ -9,6 +9,12 @@ class PieceTypes:
 
 class Piece:
 
+    __slots__ = (
+        'state', 'id', 'nation', 'territory', '_dislodged_decision',
+        'dislodged_by', 'dislodged_from', 'attacker_territory', 'retreating',
+        'destroyed', 'destroyed_message',
+    )
+
     is_army = False
     is_fleet = False
 
@@ -18,7 +24,7 @@ class Piece:
         self.id = id
         self.nation = nation
         self.territory = territory
-        self.dislodged_decision = Outcomes.UNRESOLVED
+        self._dislodged_decision = Outcomes.UNRESOLVED
         self.dislodged_by = None
         self.dislodged_from = None
         self.attacker_territory = kwargs.get('attacker_territory')
@@ -32,17 +38,34 @@ class Piece:
     def __repr__(self):
         return f'{self.__class__.__name__} {self.territory}'
 
+    def reset(self):
+        """
+        Forget the dislodged decision of the piece so that it can be
+        adjudicated again.
+        """
+        self._dislodged_decision = Outcomes.UNRESOLVED
+        self.dislodged_by = None
+        self.dislodged_from = None
+        self.destroyed = False
+        self.destroyed_message = None
+
+    @property
+    def dislodged_decision(self):
+        tracker = self.state.tracker
+        if tracker is not None:
+            tracker.read(self)
+        return self._dislodged_decision
+
+    @dislodged_decision.setter
+    def dislodged_decision(self, dislodged_decision):
+        previous = self._dislodged_decision
+        self._dislodged_decision = dislodged_decision
+        if dislodged_decision != previous:
+            self.state.dislodged_decision_changed(self)
+
     @property
     def order(self):
-        from adjudicator.order import DummyHold
-        return next(
-            iter([
-                o for o in self.state.orders
-                if o.source == self.territory
-                and o.nation == self.nation
-            ]),
-            DummyHold(self.state, self.nation, self.territory)
-        )
+        return self.state.piece_index.order(self)
 
     @property
     def moves(self):
@@ -75,7 +98,7 @@ class Piece:
         Whether every piece attacking this piece's territory fails. True if
         there are no attacking pieces.
         """
-        attacking_pieces = list(self.territory.attacking_pieces)
+        attacking_pieces = self.state.attacking_pieces(self.territory)
         return all(
             [p.order.outcome == Outcomes.FAILS for p in attacking_pieces]
         )
@@ -85,7 +108,7 @@ class Piece:
         """
         Whether any piece attacking this piece's territory moves.
         """
-        attacking_pieces = list(self.territory.attacking_pieces)
+        attacking_pieces = self.state.attacking_pieces(self.territory)
         return [p for p in attacking_pieces if p.order.outcome == Outcomes.SUCCEEDS]
 
     @property
@@ -109,7 +132,8 @@ class Piece:
         """
         if self.moves or self.all_attacking_pieces_fail:
             return self.set_dislodged_decision(Outcomes.SUSTAINS)
-        if self.successful_attacking_pieces:
+        # A piece whose move is unresolved may yet move out of the way.
+        if self.stays and self.successful_attacking_pieces:
             piece = self.successful_attacking_pieces[0]
             return self.set_dislodged_decision(Outcomes.DISLODGED, piece)
         return Outcomes.UNRESOLVED
@@ -123,8 +147,8 @@ class Piece:
         """
         for territory in self.territory.neighbours:
             accessible = territory.accessible_by_piece_type(self)
-            unoccupied = not territory.occupied_after_processing
-            uncontested = not territory.bounce_occurred
+            unoccupied = not self.state.occupied_after_processing(territory)
+            uncontested = territory not in self.state.bounces
             if accessible and unoccupied and uncontested:
                 return True
         return False
@@ -132,6 +156,8 @@ class Piece:
 
 class Army(Piece):
 
+    __slots__ = ()
+
     is_army = True
 
     def can_reach(self, target, *args):
@@ -169,6 +195,8 @@ class Army(Piece):
 
 class Fleet(Piece):
 
+    __slots__ = ('named_coast',)
+
     is_fleet = True
 
     def __init__(self, *args, named_coast=None, **kwargs):
@@ -192,13 +220,13 @@ class Fleet(Piece):
                 'Must specify coast if target is complex territory.'
             )
         if named_coast:
-            return self.territory in named_coast.neighbours
+            return named_coast.adjacent_to(self.territory)
 
         if self.territory.is_complex:
-            return target in self.named_coast.neighbours
+            return self.named_coast.adjacent_to(target)
 
         if self.territory.is_coastal and target.is_coastal:
-            return target in self.territory.shared_coasts
+            return self.territory.shares_coast_with(target)
 
         return self.territory.adjacent_to(target) and \
             target.accessible_by_piece_type(self)
@@ -216,10 +244,10 @@ class Fleet(Piece):
             * `bool`
         """
         if self.territory.is_complex:
-            return target in self.named_coast.neighbours
+            return self.named_coast.adjacent_to(target)
 
         if self.territory.is_coastal and target.is_coastal:
-            return target in self.territory.shared_coasts
+            return self.territory.shares_coast_with(target)
 
         return self.territory.adjacent_to(target) and \
             target.accessible_by_piece_type(self)
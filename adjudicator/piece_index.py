@@ -0,0 +1,80 @@
+class PieceIndex:
+    """
+    Pieces grouped by territory and bound to their orders.
+
+    Built once the pieces and orders of a turn have been registered.
+
+    * `pieces_by_territory` - pieces keyed by territory, in registration
+      order.
+    * `piece_by_territory` - the piece which is considered to be in each
+      territory. When a retreating piece shares a territory with the piece
+      that dislodged it, this is the retreating piece.
+    * `non_retreating_piece_by_territory` - as above, but the piece which is
+      not retreating.
+    * `orders_by_piece` - the order given to each piece. Pieces which were not
+      given an order are bound to a single `DummyHold`.
+    * `pieces_by_order` - the piece which each order was given to.
+    """
+
+    def __init__(self, pieces, orders):
+        from adjudicator.order import DummyHold
+
+        self.pieces_by_territory = {}
+        for piece in pieces:
+            self.pieces_by_territory.setdefault(piece.territory, []).append(piece)
+
+        self.piece_by_territory = {}
+        self.non_retreating_piece_by_territory = {}
+        for territory, territory_pieces in self.pieces_by_territory.items():
+            if len(territory_pieces) == 1:
+                piece = non_retreating_piece = territory_pieces[0]
+            elif len(territory_pieces) == 2:
+                piece = next((p for p in territory_pieces if p.retreating), None)
+                non_retreating_piece = next(
+                    (p for p in territory_pieces if not p.retreating), None
+                )
+            else:
+                piece = non_retreating_piece = None
+            self.piece_by_territory[territory] = piece
+            self.non_retreating_piece_by_territory[territory] = non_retreating_piece
+
+        orders_by_source_and_nation = {}
+        for order in orders:
+            key = (order.source, order.nation)
+            orders_by_source_and_nation.setdefault(key, order)
+
+        self.orders_by_piece = {}
+        self.pieces_by_order = {}
+        for piece in pieces:
+            order = orders_by_source_and_nation.get((piece.territory, piece.nation))
+            if order is None:
+                order = DummyHold(piece.state, piece.nation, piece.territory)
+            self.orders_by_piece[piece] = order
+            self.pieces_by_order.setdefault(order, piece)
+
+    def pieces(self, territory):
+        return self.pieces_by_territory.get(territory, [])
+
+    def piece(self, territory):
+        return self.piece_by_territory.get(territory)
+
+    def non_retreating_piece(self, territory):
+        return self.non_retreating_piece_by_territory.get(territory)
+
+    def first_piece(self, territory):
+        pieces = self.pieces_by_territory.get(territory)
+        return pieces[0] if pieces else None
+
+    def order(self, piece):
+        return self.orders_by_piece[piece]
+
+    def order_piece(self, order):
+        """
+        The piece which the order was given to. Orders which do not belong to
+        the nation of any piece in their source fall back to the first piece
+        in the source.
+        """
+        piece = self.pieces_by_order.get(order)
+        if piece is None:
+            return self.first_piece(order.source)
+        return piece
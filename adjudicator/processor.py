@@ -1,14 +1,38 @@
 from adjudicator.base import Season, Phase
+from adjudicator.cluster import find_clusters
 from adjudicator.decisions import Outcomes
-from adjudicator.paradoxes import find_circular_movements
+from adjudicator.instrumentation import fallback
+from adjudicator.paradoxes import (
+    MAX_GUESS_DEPTH, find_circular_movements, resolve_by_guessing
+)
+from adjudicator.summary import summarize
+from adjudicator.worklist import Worklist
 
 
 def process(state):
     """
     Processes all orders in a turn.
     """
-    orders = state.orders
-    pieces = state.pieces
+    adjudicate(state, state.orders, state.pieces)
+    conclude(state)
+    return state
+
+
+def conclude(state):
+    """
+    Summarize a turn whose orders have been adjudicated and determine the
+    season, phase and year of the next turn.
+    """
+    state.summary = summarize(state)
+    state.next_season, state.next_phase, state.next_year = \
+        get_next_season_phase_and_year(state)
+
+
+def adjudicate(state, orders, pieces):
+    """
+    Check the legality of the given orders and resolve the outcome of each
+    order and the dislodged decision of each piece.
+    """
     for order in orders:
         order.check_legal()
 
@@ -29,119 +53,134 @@ def process(state):
     for m in illegal_moves:
         m.outcome = Outcomes.FAILS
 
-    unresolved_pieces = [p for p in pieces if p.dislodged_decision == Outcomes.UNRESOLVED]
-    unresolved_supports = [s for s in supports if s.outcome == Outcomes.UNRESOLVED]
-
-    unresolved_convoys = [c for c in convoys if c.piece.dislodged_decision == Outcomes.UNRESOLVED]
-    while unresolved_convoys:
-        unresolved_supports = [s for s in supports if s.outcome == Outcomes.UNRESOLVED]
-        unresolved_moves = [m for m in moves if m.outcome == Outcomes.UNRESOLVED]
-        for move in unresolved_moves:
-            move.resolve()
-        for support in unresolved_supports:
-            support.resolve()
-        for piece in unresolved_pieces:
-            piece.update_dislodged_decision()
-        for convoy in unresolved_convoys:
-            convoy.resolve()
-        # resolve fleet movements
-        unresolved_convoys = [c for c in convoys if c.outcome == Outcomes.UNRESOLVED]
-
-    # refresh after convoys resolved
-    unresolved_moves = [m for m in moves if m.outcome == Outcomes.UNRESOLVED]
-
-    depth = 0
-    unresolved_retreats = [r for r in retreats if r.outcome == Outcomes.UNRESOLVED]
-    while unresolved_moves or unresolved_pieces or unresolved_supports or unresolved_retreats:
-        unresolved_retreats = [r for r in retreats if r.outcome == Outcomes.UNRESOLVED]
-        for r in unresolved_retreats:
-            r.resolve()
-
-        if depth == 10:
-            circular_movements = find_circular_movements(moves)
-            for li in circular_movements:
-                for move in li:
-                    move.outcome = Outcomes.SUCCEEDS
-
-        for move in [m for m in moves if m.outcome == Outcomes.UNRESOLVED]:
-            move.resolve()
-
-        unresolved_supports = [s for s in supports if s.outcome == Outcomes.UNRESOLVED]
-        for support in unresolved_supports:
-            support.resolve()
-
-        for piece in unresolved_pieces:
-            piece.update_dislodged_decision()
-
-        unresolved_moves = [m for m in moves if m.outcome == Outcomes.UNRESOLVED]
-        unresolved_pieces = [p for p in pieces if p.dislodged_decision == Outcomes.UNRESOLVED]
-        depth += 1
-
-    # Check update bounce_occurred_during_turn on all territories
-    for territory in state.territories:
-        attacks = [o for o in orders if o.is_move and o.target == territory]
-        bounce_occurred = False
-        for attack in attacks:
-            if attack.legal and attack.outcome == Outcomes.FAILS and \
-                    attack.path_decision() == Outcomes.PATH:
-                bounce_occurred = True
-        territory.bounce_occurred = bounce_occurred
-
-    # Check all dislodged pieces for pieces which can't retreat
-    dislodged_pieces = [p for p in state.pieces
-                        if p.dislodged_decision == Outcomes.DISLODGED]
-    for piece in dislodged_pieces:
-        if not piece.can_retreat():
-            piece.destroyed = True
-            piece.destroyed_message = (
-                'Destroyed because piece cannot retreat to any neighboring '
-                'territories.'
-            )
+    resolve_orders(state, moves, [*supports, *convoys, *retreats], pieces)
+
     for o in [*builds, *disbands]:
         if o.legal:
             o.outcome = Outcomes.SUCCEEDS
         else:
             o.outcome = Outcomes.FAILS
 
-    if state.phase == Phase.RETREAT:
-        for piece in state.pieces:
-            if piece.retreating and (piece.order.outcome == Outcomes.FAILS):
-                piece.destroyed = True
-                piece.destroyed_message = (
-                    'Destroyed because piece must retreat but retreat order failed.'
-                )
-
-    # TODO test
-    # TODO split into sub function
-    # Set captured_by for territories if fall orders
-    if state.season == Season.FALL and state.phase == Phase.ORDER:
-        # Find all pieces that are not dislodged
-        non_dislodged_pieces = [p for p in state.pieces if not p.dislodged]
-        for piece in non_dislodged_pieces:
-            # Ignore pieces that move successfully
-            if piece.order.is_move and piece.order.outcome == Outcomes.SUCCEEDS:
-                continue
-            if piece.nation != getattr(piece.territory, 'controlled_by', False):
-                if not (piece.territory.is_sea):
-                    piece.territory.captured_by = piece.nation
-        # Find all successful move orders
-        successful_move_orders = [
-            m for m in state.orders
-            if m.is_move and m.outcome == Outcomes.SUCCEEDS
-        ]
-        for move in successful_move_orders:
-            if move.piece.nation != getattr(move.target, 'controlled_by', False):
-                if not (move.target.is_sea):
-                    move.target.captured_by = move.piece.nation
-
-    # Determine the next season, phase and year.
-    state.next_season, state.next_phase, state.next_year = \
-        get_next_season_phase_and_year(state)
-    return state
+
+def reset_clusters(state, territories):
+    """
+    Forget the results of the orders and pieces in the clusters which contain
+    any of the given territories (see `find_clusters`), e.g. after orders in
+    those territories have been changed, so that they can be adjudicated
+    again. The results of every other cluster are kept.
+
+    Args:
+        * `state` - `State`
+        * `territories` - iterable of `Territory` instances.
+
+    Returns:
+        * `tuple` of the `list` of orders and the `list` of pieces which were
+          reset.
+    """
+    state.index_orders()
+    state.index_pieces()
+    territories = set(territories)
+    orders = []
+    pieces = []
+    for cluster in find_clusters(state.orders, state.pieces):
+        if cluster.territories & territories:
+            orders.extend(cluster.orders)
+            pieces.extend(cluster.pieces)
+    for order in orders:
+        order.reset()
+    for piece in pieces:
+        piece.reset()
+    # Support counts are kept by the order index so rebuild it now that the
+    # outcomes have been reset.
+    state.index_orders()
+    return orders, pieces
+
+
+def resolve_orders(state, moves, orders, pieces):
+    """
+    Resolve the outcome of every order and the dislodged decision of every
+    piece.
+
+    Orders and pieces are split into clusters which cannot affect each other
+    (see `find_clusters`) and each cluster is resolved on its own, so the
+    work done to resolve a turn, and to settle any paradox, grows with the
+    size of the largest cluster rather than with the size of the board.
+    """
+    for cluster in find_clusters([*moves, *orders], pieces):
+        cluster_moves = [o for o in cluster.orders if o.is_move]
+        items = [*cluster.orders, *cluster.pieces]
+        _resolve(state, cluster_moves, items, 0, items)
+
+
+def _resolve(state, moves, items, depth, scope):
+    """
+    Resolve the given orders and pieces of the cluster `scope`. Each item is only re-evaluated when
+    an outcome or dislodged decision that it read has changed.
+
+    When no more progress can be made, circular movements whose moves are all
+    unresolved are set to succeed. If there are none, the dependency cycle
+    which is holding up resolution is resolved by guessing. Guesses nested
+    more than `MAX_GUESS_DEPTH` deep are abandoned.
+
+    Returns:
+        * `list` of items which could not be resolved.
+    """
+    def resolve(items, depth):
+        return _resolve(state, moves, items, depth, scope)
+
+    instrumentation = state.instrumentation
+    worklist = Worklist(state)
+    unresolved = items
+    while True:
+        if instrumentation is not None:
+            instrumentation.iterations += 1
+        unresolved = worklist.run(unresolved)
+        if not unresolved:
+            return []
+        if instrumentation is not None:
+            instrumentation.cycle_fallbacks += 1
+        with fallback(state, 'circular movement'):
+            forced = force_circular_movements(moves)
+        if forced:
+            continue
+        if depth >= MAX_GUESS_DEPTH:
+            return unresolved
+        with fallback(state, 'guess'):
+            resolve_by_guessing(
+                state, worklist, unresolved, resolve, depth, scope
+            )
+        worklist = Worklist(state)
+
+
+def force_circular_movements(moves):
+    """
+    Set every circular movement whose moves are all unresolved to succeed.
+
+    Returns:
+        * `bool` - whether any moves were set to succeed.
+    """
+    forced = False
+    for li in find_circular_movements(moves):
+        if all(m.outcome == Outcomes.UNRESOLVED for m in li):
+            for move in li:
+                move.outcome = Outcomes.SUCCEEDS
+            forced = True
+    return forced
 
 
 def get_next_season_phase_and_year(state):
-    if any(p for p in state.pieces if p.dislodged and not p.destroyed):
+    """
+    Determine the season, phase and year of the next turn. Reads from the
+    turn summary if the turn has been processed.
+    """
+    summary = state.summary
+    if summary is not None:
+        retreat_required = summary.retreat_required
+    else:
+        retreat_required = any(
+            p for p in state.pieces if p.dislodged and not p.destroyed
+        )
+    if retreat_required:
         return state.season, Phase.RETREAT, state.year
 
     if state.season == Season.SPRING:
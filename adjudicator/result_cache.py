@@ -0,0 +1,167 @@
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+from collections import OrderedDict
+
+
+# Lists of records in the turn data. The order of these lists does not change
+# the outcome of a turn.
+RECORD_LISTS = ['territories', 'named_coasts', 'orders', 'pieces', 'nations']
+
+# Lists of records in the processed turn. Each is in the order of the
+# corresponding list in the turn data.
+RESULT_LISTS = ['territories', 'orders', 'pieces', 'nations']
+
+
+def _sort_key(item):
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def canonical_turn(data):
+    """
+    Get a copy of the turn data with every list of records, and every list of
+    territory ids, sorted. Turns which differ only in the order of these
+    lists have the same canonical form.
+
+    Args:
+        * `data` - `dict` - turn data in the format of `TurnSchema`.
+
+    Returns:
+        * `dict`
+    """
+    canonical = dict(data)
+    for key in RECORD_LISTS:
+        if key not in data:
+            continue
+        records = []
+        for record in data[key]:
+            record = {
+                k: sorted(v, key=_sort_key) if isinstance(v, list) else v
+                for k, v in record.items()
+            }
+            records.append(record)
+        canonical[key] = sorted(records, key=_sort_key)
+    return canonical
+
+
+def turn_hash(data):
+    """
+    Hash the canonical form of the turn data.
+
+    Returns:
+        * `str`
+    """
+    content = json.dumps(
+        canonical_turn(data),
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def match_order(result, data):
+    """
+    Put the lists of records in a processed turn in the order of the given
+    turn data.
+    """
+    result = dict(result)
+    for key in RESULT_LISTS:
+        if key not in result or key not in data:
+            continue
+        position = {item.get('id'): i for i, item in enumerate(data[key])}
+        result[key] = sorted(
+            result[key], key=lambda r: position.get(r.get('id'), len(position))
+        )
+    return result
+
+
+class MemoryResultCache:
+    """
+    Processed turns held in memory. Once `maxsize` results are held the least
+    recently used result is evicted.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key):
+        result = self._results.get(key)
+        if result is None:
+            return None
+        self._results.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def set(self, key, result):
+        self._results[key] = copy.deepcopy(result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+
+class FileResultCache:
+    """
+    Processed turns stored as JSON files in a directory, one file per turn.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def set(self, key, result):
+        # Write to a temporary file first so that readers never see a
+        # partially written result.
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(result, f, sort_keys=True)
+        os.replace(path, self._path(key))
+
+
+class SqliteResultCache:
+    """
+    Processed turns stored in a SQLite database.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._execute(
+            'CREATE TABLE IF NOT EXISTS result '
+            '(key TEXT PRIMARY KEY, data TEXT NOT NULL)'
+        )
+
+    def _execute(self, sql, parameters=()):
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                return connection.execute(sql, parameters).fetchone()
+        finally:
+            connection.close()
+
+    def get(self, key):
+        row = self._execute('SELECT data FROM result WHERE key = ?', (key,))
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, key, result):
+        self._execute(
+            'INSERT OR REPLACE INTO result (key, data) VALUES (?, ?)',
+            (key, json.dumps(result, sort_keys=True)),
+        )
@@ -1,10 +1,12 @@
 from marshmallow import (
-    fields, Schema, validate, validates_schema, ValidationError
+    EXCLUDE, fields, missing, Schema, validate, validates_schema,
+    ValidationError
 )
 
 from adjudicator.base import (
     OrderType, PieceType, Phase, TerritoryType, Variant
 )
+from adjudicator.decisions import Outcomes
 
 
 possible_orders = {
@@ -25,6 +27,47 @@ possible_orders = {
 }
 
 
+def unknown_ids(value, ids):
+    """
+    Whether the given id, or any of the given list of ids, is not in `ids`.
+    Empty values are ignored.
+    """
+    if isinstance(value, list):
+        return any(v and v not in ids for v in value)
+    return bool(value) and value not in ids
+
+
+def load_trusted(schema, data):
+    """
+    Load data for the given schema without deserializing or validating it.
+    Missing fields are given their default value and nested data is loaded
+    with the nested schema.
+    """
+    if schema.many:
+        return [_load_trusted_item(schema, item) for item in data]
+    return _load_trusted_item(schema, data)
+
+
+def _load_trusted_item(schema, data):
+    result = {}
+    for name, field in schema.load_fields.items():
+        key = field.data_key or name
+        if key in data:
+            value = data[key]
+            if isinstance(field, fields.Nested):
+                value = load_trusted(field.schema, value)
+            result[name] = value
+            continue
+        # `missing` was renamed to `load_default` in marshmallow 3.13.
+        if hasattr(field, 'load_default'):
+            default = field.load_default
+        else:
+            default = field.missing
+        if default is not missing:
+            result[name] = default() if callable(default) else default
+    return result
+
+
 class Territory(fields.String):
     def _serialize(self, value, attr, obj, **kwargs):
         if value:
@@ -39,6 +82,27 @@ class Piece(fields.Int):
         return None
 
 
+class TerritoryResults(fields.Nested):
+    """
+    Nested territories which are dumped with the results of the state they
+    are dumped from. The results are kept by the state rather than by the
+    territories, which can be shared between states.
+    """
+    def _serialize(self, value, attr, obj, **kwargs):
+        results = []
+        for territory in value:
+            result = {'id': territory.id, 'bounce_occurred': territory in obj.bounces}
+            if not territory.is_sea:
+                result['captured_by'] = obj.captures.get(territory)
+            results.append(result)
+        return super()._serialize(results, attr, obj, **kwargs)
+
+
+class Outcome(fields.String):
+    def _serialize(self, value, attr, obj, **kwargs):
+        return Outcomes.name(value)
+
+
 class NationSchema(Schema):
     id = fields.String(required=True)
     name = fields.String(load_only=True)
@@ -88,7 +152,7 @@ class OrderSchema(Schema):
     illegal = fields.Boolean(missing=False, dump_only=True)
     illegal_code = fields.String(missing=None, dump_only=True)
     illegal_verbose = fields.String(missing=None, dump_only=True)
-    outcome = fields.String(missing=None, dump_only=True)
+    outcome = Outcome(missing=None, dump_only=True)
     piece_type = fields.String(
         missing=None,
         validate=validate.OneOf(PieceType.CHOICES),
@@ -127,6 +191,71 @@ class TerritorySchema(Schema):
     captured_by = fields.String(missing=None, dump_only=True)
 
 
+class MapTerritorySchema(Schema):
+    """
+    The parts of a territory which are the same on every turn.
+    """
+    id = fields.String(required=True)
+    type = fields.String(
+        required=True,
+        validate=validate.OneOf(TerritoryType.CHOICES),
+    )
+    neighbours = fields.List(Territory(), required=True)
+    shared_coasts = fields.List(Territory(), missing=[])
+    nationality = fields.String(missing=None)
+    name = fields.String(missing=None)
+    supply_center = fields.Boolean(missing=False)
+
+    class Meta:
+        unknown = EXCLUDE
+
+
+class TerritoryStateSchema(Schema):
+    """
+    The parts of a territory which can change from turn to turn.
+    """
+    id = fields.String(required=True)
+    controlled_by = fields.String(missing=None, load_only=True)
+    contested = fields.Boolean(missing=False, load_only=True)
+    bounce_occurred = fields.Boolean(missing=False, dump_only=True)
+    captured_by = fields.String(missing=None, dump_only=True)
+
+    class Meta:
+        unknown = EXCLUDE
+
+
+class MapSchema(Schema):
+    variant = fields.String(missing=Variant.STANDARD)
+    territories = fields.Nested(MapTerritorySchema(many=True), required=True)
+    named_coasts = fields.Nested(NamedCoastSchema(many=True), required=True)
+
+    class Meta:
+        unknown = EXCLUDE
+
+    @validates_schema
+    def validate_territory_ids(self, data, **kwargs):
+        """
+        Ensure that all territory id fields have a corresponding territory.
+        """
+        errors = {}
+        territory_ids = {t['id'] for t in data['territories']}
+        error_message = 'Territory id does not have a corresponding territory.'
+        territory_fields = {
+            'named_coasts': ['parent', 'neighbours'],
+            'territories': ['neighbours', 'shared_coasts'],
+        }
+        for k, field_names in territory_fields.items():
+            for i, item in enumerate(data[k]):
+                item_errors = {
+                    field_name: [error_message] for field_name in field_names
+                    if unknown_ids(item[field_name], territory_ids)
+                }
+                if item_errors:
+                    errors.setdefault(k, {})[i] = item_errors
+        if errors:
+            raise ValidationError(errors)
+
+
 class TurnSchema(Schema):
     id = fields.Int(required=True)
     phase = fields.String(
@@ -137,7 +266,7 @@ class TurnSchema(Schema):
     season = fields.String(required=True, load_only=True)
     year = fields.Int(required=True, load_only=True)
     variant = fields.String(missing=Variant.STANDARD)
-    territories = fields.Nested(TerritorySchema(many=True), required=True)
+    territories = TerritoryResults(TerritorySchema(many=True), required=True)
     orders = fields.Nested(OrderSchema(many=True), required=True)
     pieces = fields.Nested(PieceSchema(many=True), required=True)
     nations = fields.Nested(NationSchema(many=True), required=True)
@@ -149,69 +278,97 @@ class TurnSchema(Schema):
     next_season = fields.String(dump_only=True)
     next_phase = fields.String(dump_only=True)
     next_year = fields.Int(dump_only=True)
+    instrumentation = fields.Method('get_instrumentation', dump_only=True)
+
+    # Fields of each nested collection which refer to a territory or nation.
+    territory_fields = {
+        'orders': ['source', 'target', 'aux'],
+        'pieces': ['territory', 'attacker_territory'],
+        'named_coasts': ['parent', 'neighbours'],
+        'territories': ['neighbours', 'shared_coasts'],
+    }
+    nation_fields = {
+        'orders': ['nation'],
+        'pieces': ['nation'],
+        'territories': ['nationality', 'controlled_by'],
+    }
+
+    def get_territory_ids(self, data):
+        return {t['id'] for t in data['territories']}
+
+    def get_instrumentation(self, state):
+        # Left out of the dump unless the turn was instrumented.
+        instrumentation = getattr(state, 'instrumentation', None)
+        if instrumentation is None:
+            return missing
+        return instrumentation.dump()
 
     @validates_schema
-    def validate_order_types_for_phase(self, data, **kwargs):
+    def validate_turn(self, data, **kwargs):
         """
-        Ensure that order types are valid for the turn phase
+        Ensure that order types are valid for the turn phase and that all
+        territory and nation id fields have a corresponding territory or
+        nation. Each nested item is checked once.
         """
         errors = {}
+        territory_ids = self.get_territory_ids(data)
+        nation_ids = {n['id'] for n in data['nations']}
         allowed = possible_orders[data['phase']]
-        error_message = 'During {} phase valid order types are {}'
-        for i, order in enumerate(data['orders']):
-            if order['type'] not in allowed:
-                message = error_message.format(data['phase'], ', '.join(allowed))
-                errors['orders'] = {i: {'type': [message]}}
-        if errors:
-            raise ValidationError(errors)
+        order_type_message = 'During {} phase valid order types are {}' \
+            .format(data['phase'], ', '.join(allowed))
+        territory_message = 'Territory id does not have a corresponding territory.'
+        nation_message = 'Nation id does not have a corresponding nation.'
 
-    @validates_schema
-    def validate_territory_ids(self, data, **kwargs):
-        """
-        Ensure that all territory id fields have a corresponding territory.
-        """
-        errors = {}
-        territory_ids = [t['id'] for t in data['territories']]
-        error_message = 'Territory id does not have a corresponding territory.'
-        territory_fields = {
-            'orders': ['source', 'target', 'aux'],
-            'pieces': ['territory', 'attacker_territory'],
-            'named_coasts': ['parent', 'neighbours'],
-            'territories': ['neighbours', 'shared_coasts'],
-        }
-        for k, field_names in territory_fields.items():
-            nested_serializer = data[k]
-            for i, item in enumerate(nested_serializer):
-                for field_name in field_names:
-                    value = item[field_name]
-                    # cast to list
-                    value = value if isinstance(value, list) else [value]
-                    if any(v and v not in territory_ids for v in value):
-                        errors[k] = {i: {field_name: [error_message]}}
+        for k in {**self.territory_fields, **self.nation_fields}:
+            territory_fields = self.territory_fields.get(k, [])
+            nation_fields = self.nation_fields.get(k, [])
+            for i, item in enumerate(data[k]):
+                item_errors = {}
+                if k == 'orders' and item['type'] not in allowed:
+                    item_errors['type'] = [order_type_message]
+                for field_name in territory_fields:
+                    if unknown_ids(item.get(field_name), territory_ids):
+                        item_errors[field_name] = [territory_message]
+                for field_name in nation_fields:
+                    if unknown_ids(item.get(field_name), nation_ids):
+                        item_errors[field_name] = [nation_message]
+                if item_errors:
+                    errors.setdefault(k, {})[i] = item_errors
         if errors:
             raise ValidationError(errors)
 
-    @validates_schema
-    def validate_nation_ids(self, data, **kwargs):
+    def load_trusted(self, data):
         """
-        Ensure that all nation id fields have a corresponding nation.
+        Load data which is already known to be valid, e.g. because it was built
+        from the database. Missing fields are given their defaults but no
+        fields are deserialized or validated.
+
+        Args:
+            * `data` - `dict`
+
+        Returns:
+            * `dict`
         """
-        errors = {}
-        nation_ids = [n['id'] for n in data['nations']]
-        error_message = 'Nation id does not have a corresponding nation.'
-        nation_fields = {
-            'orders': ['nation'],
-            'pieces': ['nation'],
-            'territories': ['nationality', 'controlled_by'],
-        }
-        for k, field_names in nation_fields.items():
-            nested_serializer = data[k]
-            for i, item in enumerate(nested_serializer):
-                for field_name in field_names:
-                    value = item[field_name]
-                    # cast to list
-                    value = value if isinstance(value, list) else [value]
-                    if any(v and v not in nation_ids for v in value):
-                        errors[k] = {i: {field_name: [error_message]}}
-        if errors:
-            raise ValidationError(errors)
+        return load_trusted(self, data)
+
+
+class TurnStateSchema(TurnSchema):
+    """
+    A turn of a variant whose map has already been compiled. Only the state of
+    each territory is given. The ids of the map's territories must be passed
+    in the `territory_ids` context.
+    """
+    map_hash = fields.String(required=True, load_only=True)
+    territories = TerritoryResults(TerritoryStateSchema(many=True), required=True)
+
+    territory_fields = {
+        'orders': ['source', 'target', 'aux'],
+        'pieces': ['territory', 'attacker_territory'],
+        'territories': ['id'],
+    }
+
+    class Meta:
+        exclude = ('named_coasts',)
+
+    def get_territory_ids(self, data):
+        return self.context['territory_ids']
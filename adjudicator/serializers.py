@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from adjudicator import order, piece, territory
+from adjudicator.decisions import Outcomes
 from adjudicator.named_coast import NamedCoast
 
 
@@ -16,6 +17,12 @@ class PieceField(serializers.IntegerField):
         return int(value.id)
 
 
+class OutcomeField(serializers.CharField):
+
+    def to_representation(self, value):
+        return Outcomes.name(value)
+
+
 class BaseSerializer(serializers.Serializer):
 
     type = serializers.CharField(allow_null=True, write_only=True)
@@ -116,7 +123,7 @@ class OrderSerializer(BaseSerializer):
     illegal = serializers.BooleanField(required=False)
     illegal_code = serializers.CharField(required=False, allow_null=True)
     illegal_verbose = serializers.CharField(required=False, allow_null=True)
-    outcome = serializers.CharField(required=False)
+    outcome = OutcomeField(required=False)
     nation = serializers.IntegerField(write_only=True)
     piece_type = serializers.CharField(required=False, allow_null=True, write_only=True)
     source = TerritoryField(write_only=True)
@@ -135,7 +142,7 @@ class OrderSerializer(BaseSerializer):
             validated_data['aux'] = self.state.get_territory_by_id(aux_id)
         target_coast_id = validated_data.get('target_coast')
         if target_coast_id:
-            validated_data['target_coast'] = self.state.get_territory_by_id(target_coast_id)
+            validated_data['target_coast'] = self.state.get_named_coast_by_id(target_coast_id)
         return super().create(validated_data)
 
 
@@ -0,0 +1,128 @@
+from marshmallow import ValidationError
+
+from adjudicator import add_turn, create_order, create_state, load_order
+from adjudicator.cluster import order_territories
+from adjudicator.decisions import Outcomes
+from adjudicator.processor import adjudicate, conclude, reset_clusters
+from adjudicator.schema import TurnSchema
+
+
+class Session:
+    """
+    A processed turn whose orders can be edited.
+
+    After each edit only the orders and pieces which can be affected by the
+    edited orders are adjudicated again - those in the same cluster as the
+    territories of the edited orders (see `find_clusters`). Each edit returns
+    the changes it made:
+
+    * `orders` - the new outcome of each order whose outcome changed, keyed by
+      order id. Added orders are always included.
+    * `pieces` - whether each piece whose dislodged decision changed is now
+      dislodged, keyed by piece id.
+
+    Args:
+        * `data` - `dict` - turn data in the format of `TurnSchema`.
+        * `[trusted]` - `bool` - skip validation of the turn.
+    """
+
+    def __init__(self, data, trusted=False):
+        schema = TurnSchema()
+        if trusted:
+            validated_data = schema.load_trusted(data)
+        else:
+            validated_data = schema.load(data)
+        self.id = validated_data['id']
+        self.state = create_state(validated_data)
+        add_turn(self.state, validated_data)
+        self._adjudicate(self.state.orders, self.state.pieces)
+
+    @property
+    def outcomes(self):
+        """
+        The outcome of each order, keyed by order id.
+        """
+        return {o.id: Outcomes.name(o.outcome) for o in self.state.orders}
+
+    def get_order(self, order_id):
+        for order in self.state.orders:
+            if order.id == order_id:
+                return order
+        raise ValidationError({'id': [f'Order {order_id} does not exist.']})
+
+    def add_order(self, data):
+        """
+        Add an order in the format of `OrderSchema`.
+        """
+        order_data = load_order(self.state, data)
+        if any(o.id == order_data['id'] for o in self.state.orders):
+            raise ValidationError(
+                {'id': [f'Order {order_data["id"]} already exists.']}
+            )
+        before = self._snapshot()
+        order = create_order(self.state, order_data)
+        return self._update(order_territories(order), before, added=[order])
+
+    def replace_order(self, data):
+        """
+        Replace the order which has the same id as the given order.
+        """
+        order_data = load_order(self.state, data)
+        old_order = self.get_order(order_data['id'])
+        before = self._snapshot()
+        territories = order_territories(old_order)
+        self.state.unregister(old_order)
+        order = create_order(self.state, order_data)
+        territories += order_territories(order)
+        return self._update(territories, before, added=[order])
+
+    def remove_order(self, order_id):
+        """
+        Remove the order with the given id.
+        """
+        order = self.get_order(order_id)
+        before = self._snapshot()
+        self.state.unregister(order)
+        return self._update(order_territories(order), before)
+
+    def dump(self):
+        """
+        The processed turn in the format of `TurnSchema`.
+        """
+        data = TurnSchema().dump(self.state)
+        data['id'] = self.id
+        return data
+
+    def _snapshot(self):
+        orders = {o.id: o.outcome for o in self.state.orders}
+        pieces = {p.id: p.dislodged for p in self.state.pieces}
+        return orders, pieces
+
+    def _update(self, territories, before, added=()):
+        """
+        Adjudicate the clusters which contain the given territories again and
+        return the changes.
+        """
+        state = self.state
+        orders, pieces = reset_clusters(state, territories)
+        self._adjudicate(orders, pieces)
+
+        orders_before, pieces_before = before
+        changes = {'orders': {}, 'pieces': {}}
+        for order in state.orders:
+            if order in added or orders_before.get(order.id) != order.outcome:
+                changes['orders'][order.id] = Outcomes.name(order.outcome)
+        for piece in state.pieces:
+            if pieces_before.get(piece.id) != piece.dislodged:
+                changes['pieces'][piece.id] = piece.dislodged
+        return changes
+
+    def _adjudicate(self, orders, pieces):
+        state = self.state
+        adjudicate(state, orders, pieces)
+        # The results of the turn depend on every territory so are always
+        # summarized again.
+        for piece in state.pieces:
+            piece.destroyed = False
+            piece.destroyed_message = None
+        conclude(state)
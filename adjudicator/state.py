@@ -1,61 +1,383 @@
+import copy
+
+
 class State:
 
     def __init__(self, season, phase, year):
-        self.subscribers = set()
+        # Registered objects in registration order. A dict is used as an
+        # ordered set so that iteration order is the same on every run.
+        self.subscribers = {}
         self.season = season
         self.phase = phase
         self.year = year
 
+        self._nations = []
+        self._territories = []
+        self._land_territories = []
+        self._pieces = []
+        self._orders = []
+        self._named_coasts = []
+
+        self._territories_by_id = {}
+        self._territories_by_name = {}
+        self._named_coasts_by_id = {}
+
+        self._graph = None
+        self._order_index = None
+        self._piece_index = None
+        # Whether the map collections above are shared with the state this
+        # one was forked from.
+        self._shared_map = False
+
+        # The parts of each territory which change from turn to turn. They
+        # are kept here rather than on the territories so that territories
+        # can be shared between forks.
+        self.contested = set()
+        self.controlled_by = {}
+        # Set when the turn is summarized.
+        self.bounces = set()
+        self.captures = {}
+
+        # Set while orders are being resolved. Told about every outcome and
+        # dislodge decision which is read or changed.
+        self.tracker = None
+
+        # An `Instrumentation` to count the work done to resolve the turn, if
+        # it is wanted.
+        self.instrumentation = None
+
+        # The `TurnSummary` of the turn once it has been processed.
+        self.summary = None
+
     def register(self, *observers):
         for observer in observers:
-            self.subscribers.add(observer)
+            # Subclasses with a decorated `__init__` register more than once.
+            if observer in self.subscribers:
+                continue
+            self.subscribers[observer] = None
+            self._file(observer)
+
+    def _file(self, observer):
+        """
+        Add the observer to the collection and id map for its type.
+        """
+        from adjudicator.named_coast import NamedCoast
+        from adjudicator.nation import Nation
+        from adjudicator.order import Order
+        from adjudicator.piece import Piece
+        from adjudicator.territory import Territory
+
+        if isinstance(observer, (Territory, NamedCoast)) and self._shared_map:
+            self._own_map()
+        if isinstance(observer, Territory):
+            self._territories.append(observer)
+            if not observer.is_sea:
+                self._land_territories.append(observer)
+            # A later territory with the same id replaces an earlier one in
+            # the lookups, as when territories were mapped while loading.
+            self._territories_by_id[observer.id] = observer
+            self._territories_by_name[observer.name] = observer
+            self._graph = None
+        elif isinstance(observer, Piece):
+            self._pieces.append(observer)
+            self._piece_index = None
+        elif isinstance(observer, Order):
+            self._orders.append(observer)
+            self._order_index = None
+            self._piece_index = None
+        elif isinstance(observer, NamedCoast):
+            self._named_coasts.append(observer)
+            self._named_coasts_by_id[observer.id] = observer
+            self._graph = None
+        elif isinstance(observer, Nation):
+            self._nations.append(observer)
+
+    def _own_map(self):
+        """
+        Copy the map collections shared with the state this one was forked
+        from before changing them.
+        """
+        self._territories = list(self._territories)
+        self._land_territories = list(self._land_territories)
+        self._named_coasts = list(self._named_coasts)
+        self._territories_by_id = dict(self._territories_by_id)
+        self._territories_by_name = dict(self._territories_by_name)
+        self._named_coasts_by_id = dict(self._named_coasts_by_id)
+        self._graph = None
+        self._shared_map = False
+
+    def unregister(self, observer):
+        """
+        Remove an order or piece from the state.
+        """
+        from adjudicator.order import Order
+        from adjudicator.piece import Piece
+
+        del self.subscribers[observer]
+        if isinstance(observer, Order):
+            self._orders.remove(observer)
+            self._order_index = None
+            self._piece_index = None
+        elif isinstance(observer, Piece):
+            self._pieces.remove(observer)
+            self._piece_index = None
+        else:
+            raise ValueError('Only orders and pieces can be unregistered.')
+
+    def fork(self, orders=True):
+        """
+        Create a new state in the same position as this one, e.g. to
+        adjudicate alternative orders without loading the turn again.
+
+        The territories, named coasts and map graph do not change during a
+        turn so are shared with this state. The nations, pieces and, if
+        `orders` is given, orders are copied without their results, as are
+        the contested and controlled territories, so that the fork is ready to
+        be processed. The cost of a fork depends on the number of pieces and
+        orders, not on the size of the map. Changes to the fork never affect
+        this state.
+
+        Args:
+            * `[orders]` - `bool` - copy the orders of this state.
+
+        Returns:
+            * `State`
+        """
+        fork = State(self.season, self.phase, self.year)
+        fork._territories = self._territories
+        fork._land_territories = self._land_territories
+        fork._named_coasts = self._named_coasts
+        fork._territories_by_id = self._territories_by_id
+        fork._territories_by_name = self._territories_by_name
+        fork._named_coasts_by_id = self._named_coasts_by_id
+        fork._graph = self.graph
+        fork._shared_map = True
+        fork.contested = set(self.contested)
+        fork.controlled_by = dict(self.controlled_by)
+
+        def copy_all(observers):
+            copies = []
+            for observer in observers:
+                observer_copy = copy.copy(observer)
+                observer_copy.state = fork
+                if hasattr(observer_copy, 'reset'):
+                    observer_copy.reset()
+                copies.append(observer_copy)
+            return copies
+
+        # The copies are filed directly as their types are known.
+        fork._nations = copy_all(self._nations)
+        fork._pieces = copy_all(self._pieces)
+        if orders:
+            fork._orders = copy_all(self._orders)
+        fork.subscribers = dict.fromkeys(
+            [*fork._nations, *fork._pieces, *fork._orders]
+        )
+        return fork
+
+    def outcome_changed(self, order, previous):
+        """
+        Called when the outcome of a registered order changes.
+        """
+        support_key = None
+        if self._order_index is not None:
+            support_key = self._order_index.outcome_changed(order, previous)
+        if self.tracker is not None:
+            self.tracker.changed(order)
+            if support_key is not None:
+                self.tracker.changed(support_key)
+        if self.instrumentation is not None:
+            self.instrumentation.outcome_changed(order, self.tracker)
+
+    def dislodged_decision_changed(self, piece):
+        """
+        Called when the dislodged decision of a piece changes.
+        """
+        if self.tracker is not None:
+            self.tracker.changed(piece)
+
+    # The collections below are returned directly rather than copied and
+    # must not be mutated by callers.
 
     @property
     def nations(self):
-        from adjudicator.nation import Nation
-        return [n for n in self.subscribers if isinstance(n, Nation)]
+        return self._nations
 
     @property
     def territories(self):
-        from adjudicator.territory import Territory
-        return [t for t in self.subscribers if isinstance(t, Territory)]
+        return self._territories
 
     @property
     def land_territories(self):
-        return [t for t in self.territories if not t.is_sea]
+        return self._land_territories
 
     @property
     def pieces(self):
-        from adjudicator.piece import Piece
-        return [p for p in self.subscribers if isinstance(p, Piece)]
+        return self._pieces
 
     @property
     def orders(self):
-        from adjudicator.order import Order
-        return [p for p in self.subscribers if isinstance(p, Order)]
+        return self._orders
 
     @property
     def named_coasts(self):
-        from adjudicator.named_coast import NamedCoast
-        return [s for s in self.subscribers if isinstance(s, NamedCoast)]
+        return self._named_coasts
+
+    @property
+    def graph(self):
+        """
+        The `MapGraph` of the registered territories and named coasts. Built
+        on first access and rebuilt if the map changes afterwards.
+        """
+        if self._graph is None:
+            from adjudicator.map_graph import MapGraph
+            self._graph = MapGraph(self._territories, self._named_coasts)
+        return self._graph
+
+    @property
+    def order_index(self):
+        """
+        The `OrderIndex` of the registered orders. Built on first access if
+        `index_orders` has not been called, and discarded when another order
+        is registered.
+        """
+        if self._order_index is None:
+            self.index_orders()
+        return self._order_index
+
+    def index_orders(self):
+        from adjudicator.order_index import OrderIndex
+        self._order_index = OrderIndex(self._orders)
+        return self._order_index
+
+    @property
+    def piece_index(self):
+        """
+        The `PieceIndex` of the registered pieces and orders. Built on first
+        access if `index_pieces` has not been called, and discarded when
+        another piece or order is registered.
+        """
+        if self._piece_index is None:
+            self.index_pieces()
+        return self._piece_index
+
+    def index_pieces(self):
+        from adjudicator.piece_index import PieceIndex
+        self._piece_index = PieceIndex(self._pieces, self._orders)
+        return self._piece_index
+
+    # The queries below are about the pieces and orders of this state in a
+    # territory. Territories can be shared between states, so these are asked
+    # of the state rather than of the territory.
+
+    def pieces_in(self, territory):
+        return self.piece_index.pieces(territory)
+
+    def piece_in(self, territory):
+        return self.piece_index.piece(territory)
+
+    def non_retreating_piece_in(self, territory):
+        return self.piece_index.non_retreating_piece(territory)
+
+    def attacking_pieces(self, territory):
+        moves = self.order_index.moves(territory)
+        return [o.piece for o in moves if o.piece]
+
+    def retreating_pieces(self, territory):
+        retreats = self.order_index.retreats(territory)
+        return [o.piece for o in retreats if o.piece]
+
+    def other_attacking_pieces(self, territory, piece):
+        """
+        Gets all pieces which are moving into the territory excluding the
+        given piece.
+
+        Args:
+            * `territory` - `Territory`
+            * `piece` - `Piece`
+
+        Returns:
+            * `list` of `Piece` instances.
+        """
+        return [p for p in self.attacking_pieces(territory) if p != piece]
+
+    def other_retreating_pieces(self, territory, piece):
+        """
+        Gets all pieces which are retreating into the territory excluding the
+        given piece.
+
+        Args:
+            * `territory` - `Territory`
+            * `piece` - `Piece`
+
+        Returns:
+            * `list` of `Piece` instances.
+        """
+        return [p for p in self.retreating_pieces(territory) if p != piece]
+
+    def foreign_attacking_pieces(self, territory, nation):
+        """
+        Gets all pieces which are moving into the territory who do not belong
+        to the given nation.
+
+        Args:
+            * `territory` - `Territory`
+            * `nation` - `str`
+
+        Returns:
+            * `list` of `Piece` instances.
+        """
+        return [p for p in self.attacking_pieces(territory) if p.nation != nation]
+
+    def hold_strength(self, territory):
+        from adjudicator.decisions import HoldStrength
+        return HoldStrength(self, territory)()
+
+    def occupied(self, territory):
+        return bool(self.piece_in(territory))
+
+    def occupied_by(self, territory, nation):
+        """
+        Determine whether the territory is occupied by a piece belonging to
+        the given nation.
+
+        Args:
+            * `territory` - `Territory`
+            * `nation` - `str`
+
+        Returns:
+            * `bool`
+        """
+        piece = self.piece_in(territory)
+        if piece:
+            return piece.nation == nation
+        return False
+
+    def occupied_after_processing(self, territory):
+        """
+        Whether the territory will be occupied after orders are processed.
+        Used to determine if pieces can retreat there.
+        """
+        from adjudicator.decisions import Outcomes
+
+        if any([p.order.outcome == Outcomes.SUCCEEDS for p in self.attacking_pieces(territory)]):
+            return False
+        piece = self.piece_in(territory)
+        if piece:
+            return not (
+                (piece.order.is_move and piece.order.outcome == Outcomes.SUCCEEDS)
+                or (piece.destroyed)
+            )
+        return False
 
     def get_territory(self, name):
-        return next(
-            iter(t for t in self.territories if t.name == name),
-            None
-        )
+        return self._territories_by_name.get(name)
 
     def get_territory_by_id(self, id):
-        return next(
-            iter(t for t in self.territories if t.id == id),
-            None
-        )
+        return self._territories_by_id.get(id)
 
     def get_named_coast_by_id(self, id):
-        return next(
-            iter(n for n in self.named_coasts if n.id == id),
-            None
-        )
+        return self._named_coasts_by_id.get(id)
 
 
 def register(init):
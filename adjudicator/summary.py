@@ -0,0 +1,104 @@
+from adjudicator.base import Phase, Season
+from adjudicator.decisions import Outcomes
+
+
+class TurnSummary:
+    """
+    The results of a turn which follow from the resolved orders.
+
+    * `bounces` - `set` of territories where a bounce occurred.
+    * `captures` - `dict` of the nation which captured each territory.
+    * `piece_counts` - `dict` of the number of pieces each nation will have
+      going into the next turn.
+    * `supply_center_counts` - `dict` of the number of supply centers each
+      nation will control going into the next turn.
+    * `retreat_required` - whether any piece is dislodged and not destroyed.
+    """
+
+    def __init__(self):
+        self.bounces = set()
+        self.captures = {}
+        self.piece_counts = {}
+        self.supply_center_counts = {}
+        self.retreat_required = False
+
+    def piece_count(self, nation):
+        return self.piece_counts.get(nation, 0)
+
+    def supply_center_count(self, nation):
+        return self.supply_center_counts.get(nation, 0)
+
+    def supply_delta(self, nation):
+        return self.supply_center_count(nation) - self.piece_count(nation)
+
+
+def summarize(state):
+    """
+    Set the bounces and captures of a resolved turn on the state and
+    `destroyed` on its pieces, and count the pieces and supply centers of
+    each nation, visiting each order, piece and territory once.
+
+    Args:
+        * `state` - `State`
+
+    Returns:
+        * `TurnSummary`
+    """
+    summary = TurnSummary()
+
+    successful_moves = []
+    for order in state.orders:
+        if not order.is_move:
+            continue
+        if order.outcome == Outcomes.SUCCEEDS:
+            successful_moves.append(order)
+        elif order.legal and order.outcome == Outcomes.FAILS and \
+                order.path_decision() == Outcomes.PATH:
+            summary.bounces.add(order.target)
+    # Bounces must all be known before checking whether pieces can retreat.
+    state.bounces = summary.bounces
+
+    retreat_phase = state.phase == Phase.RETREAT
+    capture = state.season == Season.FALL and state.phase == Phase.ORDER
+    for piece in state.pieces:
+        order = piece.order
+        if piece.dislodged:
+            if not piece.can_retreat():
+                piece.destroyed = True
+                piece.destroyed_message = (
+                    'Destroyed because piece cannot retreat to any neighboring '
+                    'territories.'
+                )
+        elif capture and not (order.is_move and order.outcome == Outcomes.SUCCEEDS):
+            _capture(state, summary, piece.territory, piece.nation)
+        if retreat_phase and piece.retreating and order.outcome == Outcomes.FAILS:
+            piece.destroyed = True
+            piece.destroyed_message = (
+                'Destroyed because piece must retreat but retreat order failed.'
+            )
+
+        if piece.dislodged and not piece.destroyed:
+            summary.retreat_required = True
+        disbanded = order.is_disband and order.outcome == Outcomes.SUCCEEDS
+        if not (piece.destroyed or disbanded):
+            summary.piece_counts[piece.nation] = \
+                summary.piece_count(piece.nation) + 1
+
+    if capture:
+        for move in successful_moves:
+            _capture(state, summary, move.target, move.piece.nation)
+    state.captures = summary.captures
+
+    for territory in state.land_territories:
+        if not territory.supply_center:
+            continue
+        nation = summary.captures.get(territory) or state.controlled_by.get(territory)
+        if nation:
+            summary.supply_center_counts[nation] = \
+                summary.supply_center_count(nation) + 1
+    return summary
+
+
+def _capture(state, summary, territory, nation):
+    if not territory.is_sea and nation != state.controlled_by.get(territory):
+        summary.captures[territory] = nation
@@ -1,3 +1,4 @@
+from adjudicator.base import OrderType, Phase, PieceType, Season, TerritoryType
 from adjudicator.named_coast import NamedCoast
 from adjudicator.territory import CoastalTerritory, InlandTerritory, \
     SeaTerritory
@@ -212,3 +213,180 @@ class NamedCoasts:
                                                territories.LIVONIA.id,
                                                territories.GULF_OF_BOTHNIA.id
                                            ])
+
+
+# Turn payloads in the format of `TurnSchema`
+
+INLAND_NEIGHBOURS = {
+    'paris': ['burgundy', 'picardy', 'gascony', 'brest'],
+    'burgundy': ['paris', 'picardy', 'gascony'],
+    'picardy': ['paris', 'burgundy', 'brest'],
+    'gascony': ['paris', 'burgundy', 'brest'],
+    'brest': ['paris', 'picardy', 'gascony'],
+    'moscow': ['ukraine'],
+    'ukraine': ['moscow'],
+}
+
+
+def inland_turn_data():
+    """
+    A spring turn on a small map of inland territories, which carries its own
+    map. `SUPPORT` and `CUT` can be added to its orders.
+    """
+    return {
+        'id': 1,
+        'phase': Phase.ORDER,
+        'season': Season.SPRING,
+        'year': 1901,
+        'territories': [
+            {'id': t, 'type': TerritoryType.INLAND, 'neighbours': n}
+            for t, n in INLAND_NEIGHBOURS.items()
+        ],
+        'named_coasts': [],
+        'nations': [
+            {'id': 'france', 'name': 'France'},
+            {'id': 'germany', 'name': 'Germany'},
+            {'id': 'russia', 'name': 'Russia'},
+        ],
+        'pieces': [
+            {'id': 1, 'type': PieceType.ARMY, 'nation': 'france', 'territory': 'paris'},
+            {'id': 2, 'type': PieceType.ARMY, 'nation': 'germany', 'territory': 'burgundy'},
+            {'id': 3, 'type': PieceType.ARMY, 'nation': 'germany', 'territory': 'picardy'},
+            {'id': 4, 'type': PieceType.ARMY, 'nation': 'france', 'territory': 'brest'},
+            {'id': 5, 'type': PieceType.ARMY, 'nation': 'russia', 'territory': 'moscow'},
+        ],
+        'orders': [
+            {
+                'id': 1, 'type': OrderType.MOVE, 'nation': 'germany',
+                'source': 'burgundy', 'target': 'paris',
+            },
+            {
+                'id': 2, 'type': OrderType.MOVE, 'nation': 'russia',
+                'source': 'moscow', 'target': 'ukraine',
+            },
+        ],
+    }
+
+
+SUPPORT = {
+    'id': 3, 'type': OrderType.SUPPORT, 'nation': 'germany',
+    'source': 'picardy', 'aux': 'burgundy', 'target': 'paris',
+}
+CUT = {
+    'id': 4, 'type': OrderType.MOVE, 'nation': 'france',
+    'source': 'brest', 'target': 'picardy',
+}
+
+
+def map_data():
+    """
+    A small map, without the state of a turn.
+    """
+    return {
+        'variant': 'test',
+        'territories': [
+            {
+                'id': 'paris', 'type': TerritoryType.INLAND, 'name': 'Paris',
+                'neighbours': ['picardy', 'burgundy'], 'nationality': 'france',
+                'supply_center': True, 'controlled_by': 'france',
+            },
+            {
+                'id': 'picardy', 'type': TerritoryType.COASTAL, 'name': 'Picardy',
+                'neighbours': ['paris', 'burgundy'], 'nationality': 'france',
+            },
+            {
+                'id': 'burgundy', 'type': TerritoryType.INLAND, 'name': 'Burgundy',
+                'neighbours': ['paris', 'picardy'], 'nationality': 'france',
+            },
+        ],
+        'named_coasts': [],
+    }
+
+
+def map_turn_data():
+    """
+    A fall turn on the map of `map_data`, without the map.
+    """
+    return {
+        'id': 1,
+        'phase': Phase.ORDER,
+        'season': Season.FALL,
+        'year': 1901,
+        'variant': 'test',
+        'nations': [
+            {'id': 'france', 'name': 'France'},
+            {'id': 'germany', 'name': 'Germany'},
+        ],
+        'pieces': [
+            {'id': 1, 'type': PieceType.ARMY, 'nation': 'germany', 'territory': 'burgundy'},
+        ],
+        'orders': [
+            {
+                'id': 1, 'type': OrderType.MOVE, 'nation': 'germany',
+                'source': 'burgundy', 'target': 'paris',
+            },
+        ],
+    }
+
+
+def full_turn(turn_id, target='paris'):
+    """
+    A turn on the map of `map_data`, with the map.
+    """
+    data = {**map_data(), **map_turn_data()}
+    data['id'] = turn_id
+    data['orders'][0]['target'] = target
+    return data
+
+
+def convoy_paradox_turn():
+    """
+    A convoy paradox which the Szykman rule resolves, with the army convoyed
+    to a territory whose fleet supports an attack on the convoying fleet, and
+    an army holding apart from it.
+    """
+    def territory(id, type, neighbours, shared_coasts=()):
+        data = {'id': id, 'name': id, 'type': type, 'neighbours': neighbours}
+        if type != 'sea':
+            data.update(shared_coasts=list(shared_coasts), supply_center=False)
+        return data
+
+    def order(id, type, source, target=None, aux=None, **kwargs):
+        return {
+            'id': id, 'type': type, 'nation': 'england' if id < 3 else 'france',
+            'source': source, 'target': target, 'aux': aux, **kwargs,
+        }
+
+    pieces = [
+        ('army', 'a'), ('fleet', 'd'), ('fleet', 'b'), ('fleet', 'c'),
+        ('fleet', 'e'), ('fleet', 'f'), ('army', 'g'),
+    ]
+    return {
+        'id': 1, 'season': 'spring', 'phase': 'order', 'year': 1901,
+        'nations': [{'id': 'england', 'name': 'England'}, {'id': 'france', 'name': 'France'}],
+        'named_coasts': [],
+        'territories': [
+            territory('a', 'coastal', ['b', 'd']),
+            territory('b', 'sea', ['a', 'd']),
+            territory('c', 'coastal', ['d']),
+            territory('d', 'sea', ['a', 'b', 'c', 'e', 'f']),
+            territory('e', 'coastal', ['d', 'f'], ['f']),
+            territory('f', 'coastal', ['d', 'e'], ['e']),
+            territory('g', 'inland', ['h']),
+            territory('h', 'inland', ['g']),
+        ],
+        'pieces': [
+            {'id': i, 'type': type, 'nation': 'england' if i < 3 else 'france',
+             'territory': territory}
+            for i, (type, territory) in enumerate(pieces, 1)
+        ],
+        'orders': [
+            order(1, 'move', 'a', 'f', via_convoy=True),
+            order(2, 'convoy', 'd', 'f', 'a'),
+            order(3, 'move', 'b', 'd'),
+            order(4, 'move', 'c', 'd'),
+            order(5, 'support', 'e', 'd', 'b'),
+            order(6, 'support', 'f', 'd', 'c'),
+            order(7, 'hold', 'g'),
+        ],
+    }
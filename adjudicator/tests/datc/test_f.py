@@ -266,7 +266,7 @@ class TestConvoys(AdjudicatorTestCaseMixin, unittest.TestCase):
         self.assertEqual(orders[2].outcome, Outcomes.SUCCEEDS)
         self.assertEqual(orders[3].outcome, Outcomes.SUCCEEDS)
         self.assertEqual(orders[3].outcome, Outcomes.SUCCEEDS)
-        self.assertFalse(self.territories.HOLLAND.bounce_occurred)
+        self.assertNotIn(self.territories.HOLLAND, self.state.bounces)
 
     def test_dislodged_convoy_does_not_cause_a_bounce(self):
         """
@@ -494,7 +494,6 @@ class TestConvoys(AdjudicatorTestCaseMixin, unittest.TestCase):
         self.assertEqual(orders[3].outcome, Outcomes.SUCCEEDS)
         self.assertEqual(orders[4].outcome, Outcomes.SUCCEEDS)
 
-    @unittest.skip
     def test_simple_convoy_paradox(self):
         """
         The most common paradox is when the attacked unit supports an attack on
@@ -536,7 +535,6 @@ class TestConvoys(AdjudicatorTestCaseMixin, unittest.TestCase):
         self.assertEqual(orders[2].outcome, Outcomes.FAILS)
         self.assertEqual(pieces[3].dislodged_decision, Outcomes.DISLODGED)
 
-    @unittest.skip
     def test_simple_convoy_paradox_with_additional_convoy(self):
         """
         Paradox rules only apply on the paradox core.
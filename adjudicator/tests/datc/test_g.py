@@ -33,9 +33,11 @@ class TestConvoyingToAdjacentPlaces(AdjudicatorTestCaseMixin, unittest.TestCase)
 
         I prefer the 2000 rules, so the units are swapped.
         """
-        Army(self.state, 0, Nations.ENGLAND, self.territories.NORWAY),
-        Fleet(self.state, 0, Nations.ENGLAND, self.territories.SKAGERRAK),
-        Army(self.state, 0, Nations.RUSSIA, self.territories.SWEDEN),
+        pieces = [
+            Army(self.state, 0, Nations.ENGLAND, self.territories.NORWAY),
+            Fleet(self.state, 0, Nations.ENGLAND, self.territories.SKAGERRAK),
+            Army(self.state, 0, Nations.RUSSIA, self.territories.SWEDEN),
+        ]
         orders = [
             Move(self.state, 0, Nations.ENGLAND, self.territories.NORWAY, self.territories.SWEDEN, via_convoy=True),
             Convoy(self.state, 0, Nations.ENGLAND, self.territories.SKAGERRAK, self.territories.NORWAY, self.territories.SWEDEN),
@@ -46,6 +48,8 @@ class TestConvoyingToAdjacentPlaces(AdjudicatorTestCaseMixin, unittest.TestCase)
         self.assertEqual(orders[0].path_decision(), Outcomes.PATH)
         self.assertEqual(orders[0].outcome, Outcomes.SUCCEEDS)
         self.assertEqual(orders[2].outcome, Outcomes.SUCCEEDS)
+        self.assertEqual(pieces[0].dislodged_decision, Outcomes.SUSTAINS)
+        self.assertEqual(pieces[2].dislodged_decision, Outcomes.SUSTAINS)
 
     def test_kidnapping_an_army(self):
         """
@@ -38,7 +38,7 @@ class TestRetreating(AdjudicatorTestCaseMixin, unittest.TestCase):
         """
         Stand off prevents retreat to the area.
         """
-        self.territories.SWEDEN.contested = True
+        self.state.contested.add(self.territories.SWEDEN)
         Army(self.state, 0, Nations.ENGLAND, self.territories.NORWAY, attacker_territory=self.territories.FINLAND),
         orders = [
             Retreat(self.state, 0, Nations.ENGLAND, self.territories.NORWAY, self.territories.SWEDEN),
@@ -95,7 +95,7 @@ class TestBuilding(AdjudicatorTestCaseMixin, unittest.TestCase):
         Building a unit is only allowed when supply center is a home supply
         center and is owned. If not owned, build fails.
         """
-        self.territories.ST_PETERSBURG.controlled_by = Nations.GERMANY
+        self.state.controlled_by[self.territories.ST_PETERSBURG] = Nations.GERMANY
         orders = [
             Build(self.state, 0, Nations.RUSSIA, self.territories.ST_PETERSBURG, PieceTypes.FLEET, self.named_coasts.ST_PETERSBURG_SC),
         ]
@@ -114,7 +114,7 @@ class TestBuilding(AdjudicatorTestCaseMixin, unittest.TestCase):
         Building a unit is only allowed when supply center is a home supply
         center and is owned. If it is not a home supply center, the build fails.
         """
-        self.territories.ST_PETERSBURG.controlled_by = Nations.GERMANY
+        self.state.controlled_by[self.territories.ST_PETERSBURG] = Nations.GERMANY
         orders = [
             Build(self.state, 0, Nations.GERMANY, self.territories.ST_PETERSBURG, PieceTypes.FLEET, self.named_coasts.ST_PETERSBURG_SC),
         ]
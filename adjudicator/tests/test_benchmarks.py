@@ -0,0 +1,197 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from adjudicator import process_game_state
+from adjudicator.benchmarks import standard, stress
+from adjudicator.benchmarks.cases import datc_cases, turn_from_state, variant_cases
+from adjudicator.benchmarks.runner import compare, main
+from adjudicator.benchmarks.variant import generate_turn
+from adjudicator.decisions import Outcomes
+from adjudicator.order import Move, Support
+from adjudicator.piece import Army, Fleet
+from adjudicator.processor import process
+from adjudicator.schema import TurnSchema
+from adjudicator.tests.data import NamedCoasts, Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestTurnFromState(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+        self.named_coasts = NamedCoasts(self.state, self.territories)
+
+    def test_turn_processes_like_state(self):
+        Army(self.state, 0, Nations.FRANCE, self.territories.PARIS)
+        Army(self.state, 0, Nations.FRANCE, self.territories.GASCONY)
+        Fleet(self.state, 0, Nations.GERMANY, self.territories.BURGUNDY)
+        Fleet(self.state, 0, Nations.RUSSIA, self.territories.SPAIN,
+              named_coast=self.named_coasts.SPAIN_NC)
+        orders = [
+            Move(self.state, 0, Nations.FRANCE, self.territories.PARIS, self.territories.BURGUNDY),
+            Support(self.state, 0, Nations.FRANCE, self.territories.GASCONY,
+                    self.territories.PARIS, self.territories.BURGUNDY),
+        ]
+        data = turn_from_state(self.state)
+        self.assertEqual([p['named_coast'] for p in data['pieces']][-1], str(self.named_coasts.SPAIN_NC.id))
+
+        result = process_game_state(data)
+        process(self.state)
+        self.assertEqual(
+            [o['outcome'] for o in result['orders']],
+            [Outcomes.name(o.outcome) for o in orders],
+        )
+        self.assertEqual(
+            [p['dislodged'] for p in result['pieces']],
+            [p.dislodged for p in self.state.pieces],
+        )
+
+
+class TestDatcCases(unittest.TestCase):
+
+    def test_cases_process(self):
+        cases = datc_cases()
+        self.assertGreater(len(cases), 100)
+        self.assertEqual(len({c.name for c in cases}), len(cases))
+        for case in cases:
+            process_game_state(case.data, trusted=case.trusted)
+
+
+@unittest.skipUnless(
+    os.path.isdir(standard.STANDARD_FIXTURES_DIR), 'Standard map fixtures not found'
+)
+class TestGameCases(unittest.TestCase):
+
+    def test_standard_map(self):
+        data = standard.load_standard_map()
+        self.assertEqual(len(data['nations']), 7)
+        self.assertEqual(len(data['pieces']), 22)
+
+    def test_parse_orders(self):
+        data = standard.load_standard_map()
+        parser = standard.OrderParser(data)
+        text = (
+            'RUSSIA\n'
+            'St. Petersburg (South Coast) MOVE Gulf of Bothnia -> resolved\n'
+            'Warsaw SPPORT Moscow to hold -> resolved\n'
+            'BUILD fleet St. Petersburg (North Coast) -> resolved\n'
+        )
+        orders = parser.parse(text, data['pieces'], 'order')
+        self.assertEqual(orders[0]['nation'], 'standard-russia')
+        self.assertEqual(orders[0]['target'], 'standard-gulf-of-bothnia')
+        self.assertEqual(orders[1]['type'], 'support')
+        self.assertEqual(orders[1]['aux'], orders[1]['target'])
+        self.assertEqual(orders[2]['piece_type'], 'fleet')
+        self.assertIsNotNone(orders[2]['target_coast'])
+
+    def test_game_turns(self):
+        directory = os.path.join(standard.ORDER_HISTORIES_DIR, 'game_1')
+        turns = standard.game_turns(directory)
+        self.assertEqual(len(turns), len(os.listdir(directory)))
+        name, data = turns[-1]
+        self.assertEqual(name, '24_spring_1906_order')
+        self.assertEqual(data['year'], 1906)
+        self.assertTrue(data['pieces'])
+
+
+class TestStressCases(unittest.TestCase):
+
+    def test_rotation_succeeds(self):
+        result = process_game_state(stress.rotation(20))
+        self.assertTrue(all(o['outcome'] == 'succeeds' for o in result['orders']))
+
+    def test_convoy_succeeds(self):
+        result = process_game_state(stress.convoy(20))
+        self.assertEqual(result['orders'][0]['outcome'], 'succeeds')
+
+    def test_supports_legal(self):
+        result = process_game_state(stress.supports(20))
+        self.assertFalse(any(o['illegal'] for o in result['orders']))
+
+
+class TestVariantGenerator(unittest.TestCase):
+
+    def test_same_seed_same_turn(self):
+        self.assertEqual(generate_turn(100, 15, seed=1), generate_turn(100, 15, seed=1))
+        self.assertNotEqual(generate_turn(100, 15, seed=1), generate_turn(100, 15, seed=2))
+
+    def test_turn_valid(self):
+        data = generate_turn(300, 16, seed=0)
+        TurnSchema().load(data)
+        self.assertEqual(len(data['territories']), 300)
+        self.assertEqual(len(data['nations']), 16)
+        self.assertEqual(
+            {t['type'] for t in data['territories']}, {'sea', 'coastal', 'inland'}
+        )
+        self.assertTrue(data['named_coasts'])
+        self.assertEqual(len(data['orders']), len(data['pieces']))
+
+    def test_orders_legal(self):
+        for seed in range(5):
+            data = generate_turn(200, 15, seed=seed)
+            result = process_game_state(data)
+            self.assertFalse([o for o in result['orders'] if o['illegal']], seed)
+            self.assertIn('support', {o['type'] for o in data['orders']})
+
+    def test_variant_cases(self):
+        cases = variant_cases(sizes=[(200, 15)])
+        self.assertEqual([c.name for c in cases], ['variant-200-15'])
+        self.assertEqual(cases[0].group, 'variant')
+
+
+class TestRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.results = {
+            'cases': {
+                'a': {'time': 1.0, 'min_time': 1.0, 'peak_memory': 100, 'evaluations': 10},
+                'b': {'time': 1.0, 'min_time': 1.0, 'peak_memory': 100, 'evaluations': 10},
+            },
+        }
+
+    def test_compare(self):
+        baseline = {
+            'cases': {
+                'a': {'time': 0.5, 'min_time': 0.5, 'peak_memory': 95, 'evaluations': 9},
+                'c': {'time': 0.5, 'min_time': 0.5, 'peak_memory': 95, 'evaluations': 9},
+            },
+        }
+        self.assertEqual(
+            compare(baseline, self.results),
+            [('a', 'min_time', 0.5, 1.0), ('a', 'evaluations', 9, 10)],
+        )
+
+    def test_compare_no_regression(self):
+        self.assertEqual(compare(self.results, self.results), [])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+            args = ['--group', 'stress', '--filter', 'convoy-10', '--repeat', '1']
+            with redirect_stdout(io.StringIO()) as stdout:
+                self.assertEqual(main(args + ['-o', output]), 0)
+            self.assertIn('convoy-10', stdout.getvalue())
+            with open(output) as f:
+                results = json.load(f)
+            self.assertEqual(
+                sorted(results['cases']), ['convoy-10', 'convoy-100']
+            )
+            self.assertEqual(results['totals']['stress']['cases'], 2)
+
+            for result in results['cases'].values():
+                result['evaluations'] -= 1
+            with open(output, 'w') as f:
+                json.dump(results, f)
+            with redirect_stdout(io.StringIO()) as stdout:
+                self.assertEqual(main(args + ['--compare', output, '--threshold', '100']), 1)
+            self.assertIn('Regression: convoy-10 evaluations', stdout.getvalue())
+
+            file = io.StringIO()
+            self.assertEqual(main(args + ['--compare', output, '--threshold', '100'], file=file), 1)
+            self.assertIn('Regression: convoy-10 evaluations', file.getvalue())
@@ -23,7 +23,7 @@ class TestBounceOccured(AdjudicatorTestCaseMixin, unittest.TestCase):
             Move(self.state, 0, Nations.GERMANY, self.territories.BURGUNDY, self.territories.PARIS),
         ]
         process(self.state)
-        self.assertTrue(orders[0].target.bounce_occurred)
+        self.assertIn(orders[0].target, self.state.bounces)
 
     def test_three_way_bounce(self):
         Army(self.state, 0, Nations.FRANCE, self.territories.PICARDY),
@@ -35,7 +35,7 @@ class TestBounceOccured(AdjudicatorTestCaseMixin, unittest.TestCase):
             Move(self.state, 0, Nations.GERMANY, self.territories.GASCONY, self.territories.PARIS),
         ]
         process(self.state)
-        self.assertTrue(orders[0].target.bounce_occurred)
+        self.assertIn(orders[0].target, self.state.bounces)
 
     def test_no_contest(self):
         Army(self.state, 0, Nations.FRANCE, self.territories.PICARDY),
@@ -43,9 +43,9 @@ class TestBounceOccured(AdjudicatorTestCaseMixin, unittest.TestCase):
             Move(self.state, 0, Nations.FRANCE, self.territories.PICARDY, self.territories.PARIS),
         ]
         process(self.state)
-        self.assertFalse(orders[0].target.bounce_occurred)
+        self.assertNotIn(orders[0].target, self.state.bounces)
 
     def test_no_attack(self):
         territory = self.territories.PARIS
         process(self.state)
-        self.assertFalse(territory.bounce_occurred)
+        self.assertNotIn(territory, self.state.bounces)
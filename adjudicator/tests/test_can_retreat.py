@@ -23,7 +23,7 @@ class TestCanRetreat(AdjudicatorTestCaseMixin, unittest.TestCase):
         Army(self.state, 0, Nations.ITALY, self.territories.GASCONY)
         Army(self.state, 0, Nations.ITALY, self.territories.PICARDY)
         paris = self.state.get_territory('paris')
-        paris.bounce_occurred = True
+        self.state.bounces.add(paris)
         self.assertFalse(retreating_army.can_retreat())
 
     def test_fleet_all_neighbouring_seas_occupied(self):
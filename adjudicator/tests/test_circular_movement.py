@@ -110,3 +110,32 @@ class TestCircularMovement(AdjudicatorTestCaseMixin, unittest.TestCase):
         orders = []
         result = find_circular_movements(orders)
         self.assertEqual(len(result), 0)
+
+    def test_chain_into_hold_and_empty_territory(self):
+        Army(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE),
+        Army(self.state, 0, Nations.TURKEY, self.territories.SMYRNA),
+        Army(self.state, 0, Nations.TURKEY, self.territories.ARMENIA),
+        Fleet(self.state, 0, Nations.TURKEY, self.territories.ANKARA),
+
+        orders = [
+            Move(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE, self.territories.SMYRNA),
+            Move(self.state, 0, Nations.TURKEY, self.territories.SMYRNA, self.territories.ARMENIA),
+            Move(self.state, 0, Nations.TURKEY, self.territories.ANKARA, self.territories.BLACK_SEA),
+        ]
+        result = find_circular_movements(orders)
+        self.assertEqual(len(result), 0)
+
+    def test_chain_into_circular_movement(self):
+        Fleet(self.state, 0, Nations.TURKEY, self.territories.ANKARA),
+        Army(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE),
+        Army(self.state, 0, Nations.TURKEY, self.territories.SMYRNA),
+        Army(self.state, 0, Nations.TURKEY, self.territories.ARMENIA),
+
+        orders = [
+            Move(self.state, 0, Nations.TURKEY, self.territories.ARMENIA, self.territories.ANKARA),
+            Move(self.state, 0, Nations.TURKEY, self.territories.ANKARA, self.territories.CONSTANTINOPLE),
+            Move(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE, self.territories.SMYRNA),
+            Move(self.state, 0, Nations.TURKEY, self.territories.SMYRNA, self.territories.ANKARA),
+        ]
+        result = find_circular_movements(orders)
+        self.assertEqual(result, [orders[1:]])
@@ -0,0 +1,56 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from adjudicator.cli import main
+from adjudicator.tests.data import full_turn
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.infile = os.path.join(directory.name, 'turns.jsonl')
+        self.outfile = os.path.join(directory.name, 'results.jsonl')
+
+    def write_turns(self, lines):
+        with open(self.infile, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def read_results(self):
+        with open(self.outfile) as f:
+            return [json.loads(line) for line in f]
+
+    def test_results_in_order(self):
+        self.write_turns([json.dumps(full_turn(i)) for i in range(4)])
+        status = main([self.infile, '-o', self.outfile, '--workers', '2'])
+        self.assertEqual(status, 0)
+        results = self.read_results()
+        self.assertEqual([r['id'] for r in results], [0, 1, 2, 3])
+        self.assertEqual(results[0]['orders'][0]['outcome'], 'succeeds')
+
+    def test_unordered(self):
+        self.write_turns([json.dumps(full_turn(i)) for i in range(4)])
+        status = main([self.infile, '-o', self.outfile, '-w', '2', '--unordered'])
+        self.assertEqual(status, 0)
+        self.assertEqual(sorted(r['id'] for r in self.read_results()), [0, 1, 2, 3])
+
+    def test_errors(self):
+        self.write_turns([
+            json.dumps(full_turn(0)),
+            'not json',
+            '',
+            json.dumps(full_turn(1, target='ruhr')),
+        ])
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            status = main([self.infile, '-o', self.outfile])
+        self.assertEqual(status, 1)
+        self.assertIn('Line 2: invalid JSON', stderr.getvalue())
+        results = self.read_results()
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1]['id'], 1)
+        self.assertIn('orders', results[1]['error'])
@@ -0,0 +1,125 @@
+import unittest
+
+from adjudicator import add_turn, create_state
+from adjudicator.benchmarks.variant import generate_turn
+from adjudicator.cluster import (
+    find_clusters, find_data_clusters, order_territories
+)
+from adjudicator.order import Convoy, Hold, Move, Support
+from adjudicator.piece import Army, Fleet
+from adjudicator.schema import TurnSchema
+from adjudicator.tests.data import NamedCoasts, Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestFindClusters(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+        self.named_coasts = NamedCoasts(self.state, self.territories)
+
+    def test_order_territories(self):
+        support = Support(
+            self.state, 0, Nations.FRANCE, self.territories.GASCONY,
+            self.territories.PARIS, self.territories.BURGUNDY,
+        )
+        hold = Hold(self.state, 0, Nations.FRANCE, self.territories.PARIS)
+        self.assertEqual(
+            order_territories(support),
+            [self.territories.GASCONY, self.territories.PARIS, self.territories.BURGUNDY],
+        )
+        self.assertEqual(order_territories(hold), [self.territories.PARIS])
+
+    def test_distant_orders_in_separate_clusters(self):
+        pieces = [
+            Army(self.state, 0, Nations.FRANCE, self.territories.PARIS),
+            Army(self.state, 0, Nations.FRANCE, self.territories.GASCONY),
+            Army(self.state, 0, Nations.RUSSIA, self.territories.MOSCOW),
+            Army(self.state, 0, Nations.GERMANY, self.territories.MUNICH),
+        ]
+        orders = [
+            Move(self.state, 0, Nations.FRANCE, self.territories.PARIS, self.territories.BURGUNDY),
+            Support(
+                self.state, 0, Nations.FRANCE, self.territories.GASCONY,
+                self.territories.PARIS, self.territories.BURGUNDY,
+            ),
+            Move(self.state, 0, Nations.RUSSIA, self.territories.MOSCOW, self.territories.UKRAINE),
+        ]
+        clusters = find_clusters(orders, pieces)
+
+        self.assertEqual(len(clusters), 3)
+        self.assertEqual(clusters[0].orders, orders[:2])
+        self.assertEqual(clusters[0].pieces, pieces[:2])
+        self.assertEqual(
+            clusters[0].territories,
+            {self.territories.PARIS, self.territories.GASCONY, self.territories.BURGUNDY},
+        )
+        self.assertEqual(clusters[1].orders, orders[2:])
+        self.assertEqual(clusters[1].pieces, [pieces[2]])
+        self.assertEqual(clusters[2].orders, [])
+        self.assertEqual(clusters[2].pieces, [pieces[3]])
+
+    def test_moves_into_same_territory_in_same_cluster(self):
+        pieces = [
+            Army(self.state, 0, Nations.FRANCE, self.territories.PARIS),
+            Army(self.state, 0, Nations.GERMANY, self.territories.MUNICH),
+        ]
+        orders = [
+            Move(self.state, 0, Nations.FRANCE, self.territories.PARIS, self.territories.BURGUNDY),
+            Move(self.state, 0, Nations.GERMANY, self.territories.MUNICH, self.territories.BURGUNDY),
+        ]
+        clusters = find_clusters(orders, pieces)
+
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0].orders, orders)
+
+    def test_convoy_links_convoyed_move(self):
+        pieces = [
+            Army(self.state, 0, Nations.ENGLAND, self.territories.LONDON),
+            Fleet(self.state, 0, Nations.ENGLAND, self.territories.ENGLISH_CHANNEL),
+            Army(self.state, 0, Nations.FRANCE, self.territories.PICARDY),
+        ]
+        orders = [
+            Move(
+                self.state, 0, Nations.ENGLAND, self.territories.LONDON,
+                self.territories.BELGIUM, via_convoy=True,
+            ),
+            Convoy(
+                self.state, 0, Nations.ENGLAND, self.territories.ENGLISH_CHANNEL,
+                self.territories.LONDON, self.territories.BELGIUM,
+            ),
+            Move(self.state, 0, Nations.FRANCE, self.territories.PICARDY, self.territories.BELGIUM),
+        ]
+        clusters = find_clusters(orders, pieces)
+
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0].pieces, pieces)
+
+
+class TestFindDataClusters(unittest.TestCase):
+
+    def test_same_clusters_as_find_clusters(self):
+        data = generate_turn(200, 15, seed=0)
+        validated_data = TurnSchema().load(data)
+        clusters = find_data_clusters(
+            validated_data['orders'], validated_data['pieces']
+        )
+        state = create_state(validated_data)
+        add_turn(state, validated_data)
+        expected = find_clusters(state.orders, state.pieces)
+
+        self.assertGreater(len(clusters), 1)
+        self.assertEqual(
+            [[o['id'] for o in c.orders] for c in clusters],
+            [[o.id for o in c.orders] for c in expected],
+        )
+        self.assertEqual(
+            [[p['id'] for p in c.pieces] for c in clusters],
+            [[p.id for p in c.pieces] for c in expected],
+        )
+        self.assertEqual(
+            [c.territories for c in clusters],
+            [{t.id for t in c.territories} for c in expected],
+        )
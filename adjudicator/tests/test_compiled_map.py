@@ -0,0 +1,128 @@
+import copy
+import unittest
+
+from marshmallow import ValidationError
+
+from adjudicator import (
+    _map_state, compile_map, map_cache, process_game_state,
+    process_turn_state
+)
+from adjudicator.compiled_map import MapCache, content_hash
+from adjudicator.exceptions import UnknownMapException
+from adjudicator.tests.data import map_data, map_turn_data
+
+
+class TestCompiledMap(unittest.TestCase):
+
+    def setUp(self):
+        map_cache.clear()
+
+    def test_content_hash_ignores_turn_state(self):
+        data = map_data()
+        key = content_hash(data)
+        data['territories'][0]['controlled_by'] = 'germany'
+        data['territories'][0]['contested'] = True
+        self.assertEqual(content_hash(data), key)
+        data['territories'][0]['supply_center'] = False
+        self.assertNotEqual(content_hash(data), key)
+
+    def test_map_compiled_once(self):
+        key = compile_map(map_data())
+        compiled_map = map_cache.get('test', key)
+        self.assertEqual(compile_map(map_data()), key)
+        self.assertIs(map_cache.get('test', key), compiled_map)
+        self.assertEqual(len(map_cache), 1)
+
+    def test_least_recently_used_map_evicted(self):
+        cache = MapCache(maxsize=2)
+        first = cache.compile(map_data())
+        second_data = map_data()
+        second_data['variant'] = 'other'
+        second = cache.compile(second_data)
+        cache.get('test', first.content_hash)
+        third_data = map_data()
+        third_data['territories'].pop()
+        for territory in third_data['territories']:
+            territory['neighbours'].remove('burgundy')
+        cache.compile(third_data)
+        self.assertIsNotNone(cache.get('test', first.content_hash))
+        self.assertIsNone(cache.get('other', second.content_hash))
+
+    def test_invalid_map(self):
+        data = map_data()
+        data['territories'][0]['neighbours'].append('ruhr')
+        with self.assertRaises(ValidationError):
+            compile_map(data)
+
+    def test_process_turn_state_matches_full_turn(self):
+        full_data = {**map_data(), **map_turn_data()}
+        expected = process_game_state(copy.deepcopy(full_data))
+
+        key = compile_map(map_data())
+        data = map_turn_data()
+        data['map_hash'] = key
+        data['territories'] = [
+            {'id': 'paris', 'controlled_by': 'france'},
+        ]
+        result = process_turn_state(data)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(result['orders'][0]['outcome'], 'succeeds')
+        captured_by = {t['id']: t['captured_by'] for t in result['territories']}
+        self.assertEqual(captured_by['paris'], 'germany')
+
+    def test_map_state_built_once(self):
+        key = compile_map(map_data())
+        compiled_map = map_cache.get('test', key)
+        data = map_turn_data()
+        data['map_hash'] = key
+        data['territories'] = [{'id': 'paris', 'controlled_by': 'france'}]
+        process_turn_state(data)
+        map_state = compiled_map.state
+        self.assertIsNotNone(map_state)
+
+        data = map_turn_data()
+        data['map_hash'] = key
+        data['territories'] = [{'id': 'paris', 'controlled_by': 'germany'}]
+        data['orders'] = []
+        result = process_turn_state(data)
+        self.assertIs(compiled_map.state, map_state)
+        self.assertEqual(map_state.controlled_by, {})
+        self.assertEqual(map_state.pieces, [])
+        captured_by = {t['id']: t['captured_by'] for t in result['territories']}
+        self.assertIsNone(captured_by['paris'])
+
+    def test_turns_share_map_objects(self):
+        key = compile_map(map_data())
+        compiled_map = map_cache.get('test', key)
+        first = _map_state(compiled_map)
+        second = _map_state(compiled_map)
+        map_state = compiled_map.state
+        self.assertIs(first.territories, map_state.territories)
+        self.assertIs(second.territories, map_state.territories)
+        self.assertIs(first.named_coasts, map_state.named_coasts)
+        self.assertIs(first.graph, map_state.graph)
+        paris = map_state.get_territory_by_id('paris')
+        self.assertIs(first.get_territory_by_id('paris'), paris)
+        self.assertIs(paris.state, map_state)
+
+        first.contested.add(paris)
+        first.controlled_by[paris] = 'germany'
+        self.assertEqual(map_state.contested, set())
+        self.assertEqual(second.controlled_by, {})
+
+    def test_unknown_map(self):
+        data = map_turn_data()
+        data['map_hash'] = 'unknown'
+        data['territories'] = []
+        with self.assertRaises(UnknownMapException):
+            process_turn_state(data)
+
+    def test_unknown_territory_in_turn(self):
+        data = map_turn_data()
+        data['map_hash'] = compile_map(map_data())
+        data['territories'] = []
+        data['orders'][0]['target'] = 'ruhr'
+        with self.assertRaises(ValidationError) as context:
+            process_turn_state(data)
+        self.assertIn('orders', context.exception.messages)
@@ -0,0 +1,98 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from adjudicator import process_game_state
+from adjudicator.benchmarks.differential import (
+    ALTERNATIVES, Mismatch, check_random_turns, check_turn, compare_results,
+    get_resolver, main, minimize, random_turn,
+)
+
+from .data import inland_turn_data
+
+
+def fail_moves(data, trusted=False):
+    """
+    A resolver which gets moves wrong, for testing the harness.
+    """
+    result = process_game_state(data, trusted)
+    moves = {o['id'] for o in data['orders'] if o['type'] == 'move'}
+    for order in result['orders']:
+        if order['id'] in moves:
+            order['outcome'] = 'fails'
+    return result
+
+
+class TestCompareResults(unittest.TestCase):
+
+    def test_same_results(self):
+        result = process_game_state(inland_turn_data())
+        self.assertEqual(compare_results(result, result), [])
+
+    def test_mismatches(self):
+        expected = process_game_state(inland_turn_data())
+        actual = fail_moves(inland_turn_data())
+        self.assertEqual(
+            compare_results(expected, actual),
+            [Mismatch('orders', 2, 'outcome', 'succeeds', 'fails')],
+        )
+
+    def test_resolver_error(self):
+        def broken(data, trusted=False):
+            raise KeyError('order')
+
+        mismatches = check_turn(inland_turn_data(), broken)
+        self.assertEqual(mismatches[0].kind, ('error', 'exception'))
+
+    def test_invalid_turn(self):
+        self.assertIsNone(check_turn({'id': 1}, fail_moves))
+
+
+class TestAlternatives(unittest.TestCase):
+
+    def test_alternatives_match(self):
+        for name, resolver in ALTERNATIVES.items():
+            for seed in range(5):
+                self.assertEqual(check_turn(random_turn(seed), resolver), [], (name, seed))
+
+    def test_get_resolver(self):
+        self.assertIs(get_resolver('clusters'), ALTERNATIVES['clusters'])
+        self.assertIs(
+            get_resolver('adjudicator.tests.test_differential:fail_moves'), fail_moves
+        )
+        with self.assertRaises(ValueError):
+            get_resolver('unknown')
+
+
+class TestMinimize(unittest.TestCase):
+
+    def test_minimize(self):
+        data = random_turn(0)
+        mismatches = check_turn(data, fail_moves)
+        self.assertTrue(mismatches)
+        minimized = minimize(data, fail_moves, mismatches)
+        self.assertEqual(len(minimized['orders']), 1)
+        self.assertLessEqual(len(minimized['pieces']), 1)
+        self.assertLess(len(minimized['territories']), len(data['territories']))
+        self.assertTrue(check_turn(minimized, fail_moves))
+
+    def test_random_turns(self):
+        results = list(check_random_turns('clusters', 3, seed=5))
+        self.assertEqual(results, [(5, []), (6, []), (7, [])])
+        self.assertEqual(random_turn(5), random_turn(5))
+
+    def test_main(self):
+        resolver = 'adjudicator.tests.test_differential:fail_moves'
+        args = [
+            resolver, '--group', 'datc', '--filter', 'swap_places_by_convoy',
+            '--random', '1', '--max-size', '20',
+        ]
+        with redirect_stdout(io.StringIO()) as stdout:
+            self.assertEqual(main(args), 1)
+        output = stdout.getvalue()
+        self.assertIn(
+            'Mismatch in datc.test_g.TestConvoyingToAdjacentPlaces.'
+            'test_two_units_can_swap_places_by_convoy:', output
+        )
+        self.assertIn('Mismatch in random turn 0:', output)
+        self.assertIn('Checked 2 turns, 2 did not match.', output)
@@ -0,0 +1,67 @@
+import unittest
+
+from adjudicator import distance
+from adjudicator.distance import UNREACHABLE, get_distances
+from adjudicator.piece import Army, Fleet
+from adjudicator.tests.data import NamedCoasts, Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestDistances(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+        self.named_coasts = NamedCoasts(self.state, self.territories)
+        self.distances = get_distances(self.state)
+
+    def test_army_distance(self):
+        army = self.distances.army
+        self.assertEqual(army.distance(self.territories.PARIS.id, self.territories.PARIS.id), 0)
+        self.assertEqual(army.distance(self.territories.PARIS.id, self.territories.BURGUNDY.id), 1)
+        self.assertEqual(army.distance(self.territories.PARIS.id, self.territories.MUNICH.id), 2)
+        self.assertIsNone(army.distance(self.territories.PARIS.id, self.territories.NORTH_SEA.id))
+
+    def test_fleet_distance_from_named_coast(self):
+        fleet = self.distances.fleet
+        spain, marseilles = self.territories.SPAIN.id, self.territories.MARSEILLES.id
+        self.assertEqual(fleet.distance(spain, marseilles, self.named_coasts.SPAIN_SC.id), 1)
+        self.assertEqual(fleet.distance(spain, marseilles, self.named_coasts.SPAIN_NC.id), 3)
+        # The nearest named coast is used if none is given.
+        self.assertEqual(fleet.distance(spain, marseilles), 1)
+        self.assertIsNone(fleet.distance(self.territories.BREST.id, self.territories.PARIS.id))
+
+    def test_within(self):
+        self.assertEqual(
+            self.distances.army.within(self.territories.PARIS.id, 1),
+            {
+                self.territories.PARIS.id, *(
+                    t.id for t in self.territories.PARIS.neighbours if not t.is_sea
+                )
+            },
+        )
+
+    def test_matrix_symmetric_for_armies(self):
+        matrix = self.distances.army.matrix
+        size = len(self.distances.army.positions)
+        for i in range(size):
+            self.assertEqual(matrix[i][i], 0)
+            for j in range(size):
+                self.assertEqual(matrix[i][j] == UNREACHABLE, matrix[j][i] == UNREACHABLE)
+
+    def test_for_piece(self):
+        army = Army(self.state, 1, Nations.FRANCE, self.territories.PARIS)
+        fleet = Fleet(self.state, 2, Nations.FRANCE, self.territories.BREST)
+        self.assertIs(self.distances.for_piece(army), self.distances.army)
+        self.assertIs(self.distances.for_piece(fleet), self.distances.fleet)
+
+    def test_cached(self):
+        self.assertIs(get_distances(self.state), self.distances)
+
+    @unittest.skipIf(distance.numpy is None, 'NumPy is not installed')
+    def test_numpy_matrix(self):
+        matrix = self.distances.fleet.matrix
+        size = len(self.distances.fleet.positions)
+        self.assertEqual(matrix.shape, (size, size))
+        self.assertEqual(matrix.dtype, distance.numpy.int16)
@@ -0,0 +1,116 @@
+import os
+import time
+import unittest
+from unittest import mock
+
+from marshmallow import ValidationError
+
+from adjudicator import estimate, estimate_outcomes
+from adjudicator.base import OrderType
+from adjudicator.benchmarks import standard
+from adjudicator.tests.data import SUPPORT, inland_turn_data
+
+HOLD = {'type': OrderType.HOLD, 'source': 'brest'}
+CUT = {'type': OrderType.MOVE, 'source': 'brest', 'target': 'picardy'}
+
+
+class TestEstimateOutcomes(unittest.TestCase):
+
+    def setUp(self):
+        self.data = inland_turn_data()
+        self.data['orders'] = [self.data['orders'][0], SUPPORT]
+
+    def test_certain_orders(self):
+        result = estimate_outcomes(self.data, 'germany', {'france': [[(CUT, 1)]]}, samples=10)
+        self.assertEqual(result.samples, 10)
+        self.assertEqual(result.adjudications, 1)
+        self.assertEqual(result.order_success, {1: 0, 3: 0})
+        self.assertEqual(result.territory_held, {'burgundy': 1, 'picardy': 1})
+
+    def test_sampled_orders(self):
+        distributions = {'france': [[(HOLD, 0.25), (CUT, 0.75)]]}
+        result = estimate_outcomes(self.data, 'germany', distributions, samples=2000, seed=1)
+        self.assertEqual(result.adjudications, 2)
+        self.assertAlmostEqual(result.order_success[1], 0.25, delta=0.05)
+        self.assertEqual(result.order_success[1], result.order_success[3])
+        self.assertAlmostEqual(result.territory_held['paris'], 0.25, delta=0.05)
+        self.assertAlmostEqual(
+            result.territory_held['paris'] + result.territory_held['burgundy'], 1
+        )
+        self.assertEqual(result.territory_held['picardy'], 1)
+
+    def test_seed_reproducible(self):
+        distributions = {'france': [[(HOLD, 0.5), (CUT, 0.5)]]}
+        results = [
+            estimate_outcomes(self.data, 'germany', distributions, samples=50, seed=3)
+            for _ in range(2)
+        ]
+        self.assertEqual(results[0].order_success, results[1].order_success)
+
+    def test_distinct_order_sets_processed_once(self):
+        distributions = {'france': [[(HOLD, 0.5), (CUT, 0.5)]]}
+        with mock.patch.object(estimate, 'adjudicate', wraps=estimate.adjudicate) as adjudicate:
+            estimate_outcomes(self.data, 'germany', distributions, samples=100, seed=0)
+        self.assertEqual(adjudicate.call_count, 2)
+
+    def test_only_changed_clusters_adjudicated_again(self):
+        self.data['orders'].append({
+            'id': 5, 'type': OrderType.HOLD, 'nation': 'russia', 'source': 'moscow',
+        })
+        distributions = {'france': [[(HOLD, 0.5), (CUT, 0.5)]]}
+        with mock.patch.object(estimate, 'adjudicate', wraps=estimate.adjudicate) as adjudicate:
+            estimate_outcomes(self.data, 'germany', distributions, samples=100, seed=0)
+        orders = [o.id for o in adjudicate.call_args_list[1][0][1]]
+        self.assertEqual(sorted(orders), [1, 3, 7])
+
+    def test_orders_changed_back(self):
+        # Germany's move fails only if the army in Paris holds and its
+        # support is cut. Consecutive order sets change the order of Brest
+        # back from a cut to a hold.
+        distributions = {'france': [
+            [({'type': OrderType.HOLD, 'source': 'paris'}, 0.5),
+             ({'type': OrderType.MOVE, 'source': 'paris', 'target': 'gascony'}, 0.5)],
+            [(HOLD, 0.5), (CUT, 0.5)],
+        ]}
+        result = estimate_outcomes(self.data, 'germany', distributions, samples=4000, seed=2)
+        self.assertEqual(result.adjudications, 4)
+        self.assertAlmostEqual(result.order_success[1], 0.75, delta=0.05)
+        self.assertEqual(result.territory_held['paris'], result.order_success[1])
+
+    def test_invalid_order(self):
+        distributions = {'france': [[(HOLD, 0.5), ({**CUT, 'target': 'ruhr'}, 0.5)]]}
+        with self.assertRaises(ValidationError) as context:
+            estimate_outcomes(self.data, 'germany', distributions)
+        self.assertEqual(list(context.exception.messages['france'][0]), [1])
+
+
+@unittest.skipUnless(
+    os.path.isdir(standard.STANDARD_FIXTURES_DIR), 'Standard map fixtures not found'
+)
+class TestEstimateThroughput(unittest.TestCase):
+
+    def test_thousands_of_samples_per_second(self):
+        # Each order of the other nations in a game position is as likely as
+        # a hold.
+        directory = os.path.join(standard.ORDER_HISTORIES_DIR, 'game_1')
+        data = dict(standard.game_turns(directory))['07_fall_1902_order']
+        nation = 'standard-england'
+        distributions = {}
+        for order in data['orders']:
+            if order['nation'] == nation:
+                continue
+            order_data = {k: v for k, v in order.items() if k not in ['id', 'nation']}
+            hold = {'type': OrderType.HOLD, 'source': order['source']}
+            distributions.setdefault(order['nation'], []).append(
+                [(order_data, 0.5), (hold, 0.5)]
+            )
+        data['orders'] = [o for o in data['orders'] if o['nation'] == nation]
+        samples = 5000
+
+        start = time.perf_counter()
+        result = estimate_outcomes(data, nation, distributions, samples=samples, seed=0)
+        elapsed = time.perf_counter() - start
+
+        self.assertGreater(len(distributions), 3)
+        self.assertLess(result.adjudications, samples / 10)
+        self.assertGreater(samples / elapsed, 2000)
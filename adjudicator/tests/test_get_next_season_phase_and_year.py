@@ -1,6 +1,7 @@
 import unittest
 
 from adjudicator.base import Phase, Season
+from adjudicator.decisions import Outcomes
 from adjudicator.nation import Nation
 from adjudicator.piece import Army
 from adjudicator.processor import get_next_season_phase_and_year
@@ -11,7 +12,7 @@ class TestGetNextSeasonPhaseAndYear(AdjudicatorTestCaseMixin, unittest.TestCase)
 
     def test_spring_order_to_retreat(self):
         army = Army(self.state, 1, 1, 1)
-        army.dislodged_decision = 'dislodged'
+        army.dislodged_decision = Outcomes.DISLODGED
         result = get_next_season_phase_and_year(self.state)
         self.assertEqual(result, (Season.SPRING, Phase.RETREAT, 1900))
 
@@ -22,7 +23,7 @@ class TestGetNextSeasonPhaseAndYear(AdjudicatorTestCaseMixin, unittest.TestCase)
     def test_fall_order_to_retreat(self):
         self.state.season = Season.FALL
         army = Army(self.state, 1, 1, 1)
-        army.dislodged_decision = 'dislodged'
+        army.dislodged_decision = Outcomes.DISLODGED
         result = get_next_season_phase_and_year(self.state)
         self.assertEqual(result, (Season.FALL, Phase.RETREAT, 1900))
 
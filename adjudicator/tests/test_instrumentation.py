@@ -0,0 +1,92 @@
+import unittest
+
+from adjudicator import process_game_state
+from adjudicator.benchmarks import stress
+from adjudicator.benchmarks.variant import generate_turn
+from adjudicator.instrumentation import DECISION_TYPES, Instrumentation
+from adjudicator.order import Move
+from adjudicator.piece import Army
+from adjudicator.processor import process
+from adjudicator.result_cache import MemoryResultCache
+from adjudicator.tests.data import (
+    Nations, Territories, convoy_paradox_turn
+)
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestInstrumentation(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+
+    def test_not_instrumented(self):
+        Army(self.state, 0, Nations.FRANCE, self.territories.PARIS)
+        Move(self.state, 0, Nations.FRANCE, self.territories.PARIS, self.territories.PICARDY)
+        process(self.state)
+        self.assertIsNone(self.state.instrumentation)
+
+    def test_circular_movement(self):
+        territories = [
+            self.territories.PARIS, self.territories.PICARDY,
+            self.territories.BURGUNDY,
+        ]
+        for i, source in enumerate(territories):
+            Army(self.state, 0, Nations.FRANCE, source)
+            Move(self.state, 0, Nations.FRANCE, source, territories[i - 2])
+        self.state.instrumentation = Instrumentation(trace=True)
+        process(self.state)
+
+        instrumentation = self.state.instrumentation
+        self.assertEqual(instrumentation.cycle_fallbacks, 1)
+        self.assertEqual(instrumentation.iterations, 2)
+        self.assertGreater(instrumentation.decisions['AttackStrength'], 0)
+        self.assertEqual(
+            instrumentation.trace[self.state.orders[0].id][-1],
+            'outcome: succeeds (circular movement)',
+        )
+
+
+class TestProcessGameState(unittest.TestCase):
+
+    def test_counters_dumped(self):
+        data = stress.convoy(10)
+        self.assertNotIn('instrumentation', process_game_state(data))
+
+        result = process_game_state(data, instrument=True)
+        counters = result['instrumentation']
+        self.assertEqual(list(counters['decisions']), DECISION_TYPES)
+        self.assertEqual(counters['evaluations'], 36)
+        self.assertGreater(counters['convoy_searches'], 0)
+        self.assertNotIn('trace', counters)
+        del result['instrumentation']
+        self.assertEqual(result, process_game_state(data))
+
+    def test_trace(self):
+        result = process_game_state(convoy_paradox_turn(), trace=True)
+        trace = result['instrumentation']['trace']
+        self.assertEqual(result['instrumentation']['cycle_fallbacks'], 1)
+        self.assertIn('outcome: fails (guess)', trace[3])
+        self.assertEqual(trace[1][-2:], ['Path: no path', 'AttackStrength: 0-0'])
+
+    def test_counts_same_every_run(self):
+        data = generate_turn(300, 16, seed=0)
+        counts = [
+            process_game_state(data, instrument=True)['instrumentation']
+            for _ in range(3)
+        ]
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(counts[0], counts[2])
+
+    def test_cached_result_not_instrumented(self):
+        cache = MemoryResultCache()
+        data = stress.convoy(10)
+        expected = process_game_state(data, instrument=True)['instrumentation']
+        process_game_state(data, cache=cache)
+        result = process_game_state(data, cache=cache, instrument=True)
+        self.assertEqual(result['instrumentation'], expected)
+
+        cache = MemoryResultCache()
+        process_game_state(data, cache=cache, trace=True)
+        self.assertNotIn('instrumentation', process_game_state(data, cache=cache))
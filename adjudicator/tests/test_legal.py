@@ -0,0 +1,195 @@
+import unittest
+
+from adjudicator import order_type_dict
+from adjudicator.base import OrderType, Phase
+from adjudicator.legal import (
+    LegalOrders, MapTableCache, ReachabilityTable, reachability_cache
+)
+from adjudicator.piece import Army, Fleet
+from adjudicator.tests.data import NamedCoasts, Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class LegalOrdersTestCase(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+        self.named_coasts = NamedCoasts(self.state, self.territories)
+
+    def create_order(self, order_data):
+        order_data = dict(order_data)
+        order_class = order_type_dict[order_data.pop('type')]
+        for name in ['source', 'target', 'aux']:
+            if name in order_data:
+                order_data[name] = self.state.get_territory_by_id(order_data[name])
+        if 'target_coast' in order_data:
+            order_data['target_coast'] = \
+                self.state.get_named_coast_by_id(order_data['target_coast'])
+        return order_class(self.state, 0, **order_data)
+
+    def is_legal(self, order_data):
+        order = self.create_order(order_data)
+        try:
+            order.check_legal()
+        finally:
+            self.state.unregister(order)
+        return order.legal
+
+    def assertAllLegal(self, orders):
+        self.assertTrue(orders)
+        for order_data in orders:
+            self.assertTrue(self.is_legal(order_data), order_data)
+
+
+class TestOrderPhase(LegalOrdersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.pieces = [
+            Army(self.state, 1, Nations.FRANCE, self.territories.PARIS),
+            Army(self.state, 2, Nations.FRANCE, self.territories.BREST),
+            Fleet(self.state, 3, Nations.FRANCE, self.territories.SPAIN,
+                  named_coast=self.named_coasts.SPAIN_NC),
+            Fleet(self.state, 4, Nations.FRANCE, self.territories.MID_ATLANTIC),
+            Fleet(self.state, 5, Nations.ENGLAND, self.territories.ENGLISH_CHANNEL),
+            Fleet(self.state, 6, Nations.RUSSIA, self.territories.ST_PETERSBURG,
+                  named_coast=self.named_coasts.ST_PETERSBURG_SC),
+            Army(self.state, 7, Nations.GERMANY, self.territories.MUNICH),
+            Fleet(self.state, 8, Nations.ENGLAND, self.territories.LONDON),
+        ]
+        self.legal_orders = LegalOrders(self.state)
+
+    def test_generated_orders_legal(self):
+        for piece in self.pieces:
+            self.assertAllLegal(self.legal_orders.piece_orders(piece))
+
+    def test_moves_match_checks(self):
+        for piece in self.pieces:
+            generated = {
+                (o['target'], o.get('target_coast'))
+                for o in self.legal_orders.piece_orders(piece)
+                if o['type'] == OrderType.MOVE and not o.get('via_convoy')
+            }
+            expected = set()
+            for territory in self.state.territories:
+                coasts = [None]
+                if piece.is_fleet and territory.is_complex:
+                    coasts = [n.id for n in territory.named_coasts]
+                for coast in coasts:
+                    order_data = {
+                        'type': OrderType.MOVE, 'nation': piece.nation,
+                        'source': piece.territory.id, 'target': territory.id,
+                        'target_coast': coast,
+                    }
+                    if self.is_legal(order_data):
+                        expected.add((territory.id, coast))
+            self.assertEqual(generated, expected, piece)
+
+    def test_supports_match_checks(self):
+        paris = self.pieces[0]
+        for piece in self.pieces[1:]:
+            generated = {
+                o['target'] for o in self.legal_orders.piece_orders(piece)
+                if o['type'] == OrderType.SUPPORT and o['aux'] == paris.territory.id
+            }
+            expected = set()
+            for territory in self.state.territories:
+                order_data = {
+                    'type': OrderType.SUPPORT, 'nation': piece.nation,
+                    'source': piece.territory.id, 'aux': paris.territory.id,
+                    'target': territory.id,
+                }
+                if self.is_legal(order_data):
+                    expected.add(territory.id)
+            # Supports are only given for moves the supported piece could make.
+            reachable = {
+                o['target'] for o in self.legal_orders.piece_orders(paris)
+                if o['type'] == OrderType.MOVE
+            } | {paris.territory.id}
+            self.assertEqual(generated, expected & reachable, piece)
+
+    def test_convoys(self):
+        fleet = self.pieces[4]
+        convoys = [
+            o for o in self.legal_orders.piece_orders(fleet)
+            if o['type'] == OrderType.CONVOY
+        ]
+        self.assertEqual({o['aux'] for o in convoys}, {self.territories.BREST.id})
+        self.assertIn(self.territories.LONDON.id, {o['target'] for o in convoys})
+        self.assertFalse(any(
+            o['type'] == OrderType.CONVOY
+            for o in self.legal_orders.piece_orders(self.pieces[7])
+        ))
+
+    def test_nation_orders(self):
+        orders = self.legal_orders.nation_orders(Nations.FRANCE)
+        self.assertEqual(list(orders), [1, 2, 3, 4])
+        self.assertEqual(orders[1][0], {
+            'type': OrderType.HOLD, 'nation': Nations.FRANCE,
+            'source': self.territories.PARIS.id,
+        })
+
+    def test_reachability_table_cached(self):
+        cache = MapTableCache(lambda state: ReachabilityTable(state.territories))
+        table = cache.get(self.state)
+        self.assertIs(cache.get(self.state), table)
+        self.assertIs(reachability_cache.get(self.state), self.legal_orders.table)
+        self.assertEqual(len(cache), 1)
+
+
+class TestRetreatPhase(LegalOrdersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.state.phase = Phase.RETREAT
+        self.state.contested.add(self.territories.PICARDY)
+        self.fleet = Fleet(
+            self.state, 1, Nations.FRANCE, self.territories.BREST,
+            retreating=True, attacker_territory=self.territories.ENGLISH_CHANNEL,
+        )
+        self.army = Army(self.state, 2, Nations.ENGLAND, self.territories.BREST)
+        self.legal_orders = LegalOrders(self.state)
+
+    def test_retreats(self):
+        orders = self.legal_orders.piece_orders(self.fleet)
+        self.assertAllLegal(orders)
+        self.assertEqual(
+            {o.get('target') for o in orders},
+            {self.territories.MID_ATLANTIC.id, self.territories.GASCONY.id, None},
+        )
+        self.assertEqual(orders[-1]['type'], OrderType.DISBAND)
+
+    def test_non_retreating_piece(self):
+        self.assertEqual(self.legal_orders.piece_orders(self.army), [])
+
+
+class TestBuildPhase(LegalOrdersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.state.phase = Phase.BUILD
+        self.legal_orders = LegalOrders(self.state)
+
+    def test_builds(self):
+        orders = self.legal_orders.build_orders(Nations.RUSSIA)
+        self.assertAllLegal(orders)
+        self.assertEqual(
+            [(o['source'], o['piece_type'], o.get('target_coast')) for o in orders],
+            [
+                (self.territories.MOSCOW.id, 'army', None),
+                (self.territories.ST_PETERSBURG.id, 'army', None),
+                (self.territories.ST_PETERSBURG.id, 'fleet', self.named_coasts.ST_PETERSBURG_NC.id),
+                (self.territories.ST_PETERSBURG.id, 'fleet', self.named_coasts.ST_PETERSBURG_SC.id),
+            ],
+        )
+
+    def test_no_builds_in_occupied_territory(self):
+        army = Army(self.state, 1, Nations.RUSSIA, self.territories.MOSCOW)
+        orders = self.legal_orders.build_orders(Nations.RUSSIA)
+        self.assertNotIn(self.territories.MOSCOW.id, {o['source'] for o in orders})
+        self.assertEqual(
+            self.legal_orders.piece_orders(army),
+            [{'type': OrderType.DISBAND, 'nation': Nations.RUSSIA, 'source': self.territories.MOSCOW.id}],
+        )
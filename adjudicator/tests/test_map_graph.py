@@ -0,0 +1,45 @@
+import unittest
+
+from adjudicator.named_coast import NamedCoast
+from adjudicator.territory import CoastalTerritory, SeaTerritory
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestMapGraph(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.spain = CoastalTerritory(self.state, 1, 'Spain', None, [2, 3], [3])
+        self.mid_atlantic = SeaTerritory(self.state, 2, 'Mid Atlantic', [1, 3])
+        self.portugal = CoastalTerritory(self.state, 3, 'Portugal', None, [1, 2], [1])
+        self.spain_nc = NamedCoast(self.state, 4, 'north coast', self.spain, [2, 3])
+
+    def test_neighbours_in_registration_order(self):
+        graph = self.state.graph
+        self.assertEqual(graph.neighbours[1], [self.mid_atlantic, self.portugal])
+        self.assertEqual(graph.neighbours[3], [self.spain, self.mid_atlantic])
+
+    def test_adjacent(self):
+        graph = self.state.graph
+        self.assertTrue(graph.adjacent(self.spain, self.portugal))
+        self.assertTrue(graph.share_coast(self.spain, self.portugal))
+        self.assertFalse(graph.share_coast(self.spain, self.mid_atlantic))
+        self.assertTrue(graph.coast_adjacent(self.spain_nc, self.mid_atlantic))
+        self.assertFalse(graph.coast_adjacent(self.spain_nc, self.spain))
+
+    def test_named_coasts_by_parent(self):
+        self.assertEqual(self.state.graph.named_coasts[1], [self.spain_nc])
+        self.assertNotIn(3, self.state.graph.named_coasts)
+
+    def test_rebuilt_when_map_changes(self):
+        graph = self.state.graph
+        self.assertEqual(self.state.graph, graph)
+        gascony = CoastalTerritory(self.state, 5, 'Gascony', None, [1], [])
+        self.assertNotEqual(self.state.graph, graph)
+        self.assertEqual(gascony.neighbours, [self.spain])
+
+    def test_unknown_neighbour_ids_ignored(self):
+        london = CoastalTerritory(self.state, 6, 'London', None, [99], [99])
+        self.assertEqual(london.neighbours, [])
+        self.assertEqual(london.shared_coasts, [])
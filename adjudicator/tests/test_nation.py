@@ -44,7 +44,7 @@ class TestControlledTerritores(NationTestCase):
 
     def test_controlled_includes_captured_by_other(self):
         territory = InlandTerritory(self.state, 1, 'Paris', 2, [], controlled_by=self.nation.id)
-        territory.captured_by = self.other_nation.id
+        self.state.captures[territory] = self.other_nation.id
         self.assertEqual(self.nation.controlled_territories, [territory])
 
 
@@ -55,7 +55,7 @@ class TestCapturedTerritories(NationTestCase):
 
     def test_captured_includes_controlled_by_other(self):
         territory = InlandTerritory(self.state, 1, 'Paris', 2, [], controlled_by=self.other_nation.id)
-        territory.captured_by = self.nation.id
+        self.state.captures[territory] = self.nation.id
         self.assertEqual(self.nation.captured_territories, [territory])
 
 
@@ -97,17 +97,17 @@ class TestNextTurnSupplyCenterCount(NationTestCase):
 
     def test_does_not_include_no_supply_center_captured(self):
         territory = InlandTerritory(self.state, 1, 'Paris', 2, [])
-        territory.captured_by = self.nation.id
+        self.state.captures[territory] = self.nation.id
         self.assertEqual(self.nation.next_turn_supply_center_count, 0)
 
     def test_next_turn_supply_center_count_captured_by_other(self):
         territory = InlandTerritory(self.state, 1, 'Paris', 2, [], True, controlled_by=self.nation.id)
-        territory.captured_by = self.other_nation.id
+        self.state.captures[territory] = self.other_nation.id
         self.assertEqual(self.nation.next_turn_supply_center_count, 0)
 
     def test_next_turn_supply_center_count_captured_from_other(self):
         territory = InlandTerritory(self.state, 1, 'Paris', 2, [], True, controlled_by=self.other_nation.id)
-        territory.captured_by = self.nation.id
+        self.state.captures[territory] = self.nation.id
         self.assertEqual(self.nation.next_turn_supply_center_count, 1)
 
     def test_next_turn_supply_center_count_controlled(self):
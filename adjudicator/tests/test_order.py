@@ -1,7 +1,10 @@
 import unittest
-from adjudicator.order import Hold
-from adjudicator.piece import Army
+from adjudicator.decisions import Outcomes
+from adjudicator.order import Convoy, Hold, Move, Support
+from adjudicator.piece import Army, Fleet
+from adjudicator.processor import process
 from adjudicator.territory import CoastalTerritory
+from adjudicator.tests.data import Nations, Territories
 
 from .base import AdjudicatorTestCaseMixin
 
@@ -32,3 +35,51 @@ class TestIsOrder(AdjudicatorTestCaseMixin, unittest.TestCase):
         self.assertFalse(london_hold.is_move)
         with self.assertRaises(AttributeError):
             london_hold.is_fake_class_name
+
+
+class TestSupport(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def test_support_into_empty_territory_attacked_by_disrupted_convoy(self):
+        territories = Territories(self.state)
+        Army(self.state, 1, Nations.FRANCE, territories.PICARDY)
+        Army(self.state, 2, Nations.FRANCE, territories.PARIS)
+        Army(self.state, 3, Nations.ENGLAND, territories.LONDON)
+        Fleet(self.state, 4, Nations.ENGLAND, territories.ENGLISH_CHANNEL)
+        Fleet(self.state, 5, Nations.FRANCE, territories.BREST)
+        Fleet(self.state, 6, Nations.FRANCE, territories.MID_ATLANTIC)
+        orders = [
+            Support(self.state, 1, Nations.FRANCE, territories.PICARDY, territories.PARIS, territories.BURGUNDY),
+            Move(self.state, 2, Nations.FRANCE, territories.PARIS, territories.BURGUNDY),
+            Move(self.state, 3, Nations.ENGLAND, territories.LONDON, territories.PICARDY, via_convoy=True),
+            Convoy(self.state, 4, Nations.ENGLAND, territories.ENGLISH_CHANNEL, territories.LONDON, territories.PICARDY),
+            Move(self.state, 5, Nations.FRANCE, territories.BREST, territories.ENGLISH_CHANNEL),
+            Support(self.state, 6, Nations.FRANCE, territories.MID_ATLANTIC, territories.BREST, territories.ENGLISH_CHANNEL),
+        ]
+
+        process(self.state)
+
+        self.assertEqual(orders[0].outcome, Outcomes.SUCCEEDS)
+        self.assertEqual(orders[1].outcome, Outcomes.SUCCEEDS)
+        self.assertEqual(orders[2].outcome, Outcomes.FAILS)
+        self.assertEqual(orders[3].outcome, Outcomes.FAILS)
+        self.assertEqual(self.state.pieces[3].dislodged_decision, Outcomes.DISLODGED)
+
+    def test_support_into_empty_territory_cut_by_convoyed_attack(self):
+        territories = Territories(self.state)
+        Army(self.state, 1, Nations.FRANCE, territories.PICARDY)
+        Army(self.state, 2, Nations.FRANCE, territories.PARIS)
+        Army(self.state, 3, Nations.ENGLAND, territories.LONDON)
+        Fleet(self.state, 4, Nations.ENGLAND, territories.ENGLISH_CHANNEL)
+        orders = [
+            Support(self.state, 1, Nations.FRANCE, territories.PICARDY, territories.PARIS, territories.BURGUNDY),
+            Move(self.state, 2, Nations.FRANCE, territories.PARIS, territories.BURGUNDY),
+            Move(self.state, 3, Nations.ENGLAND, territories.LONDON, territories.PICARDY, via_convoy=True),
+            Convoy(self.state, 4, Nations.ENGLAND, territories.ENGLISH_CHANNEL, territories.LONDON, territories.PICARDY),
+        ]
+
+        process(self.state)
+
+        self.assertEqual(orders[0].outcome, Outcomes.FAILS)
+        self.assertEqual(orders[1].outcome, Outcomes.SUCCEEDS)
+        self.assertEqual(orders[2].outcome, Outcomes.FAILS)
+        self.assertEqual(orders[3].outcome, Outcomes.SUCCEEDS)
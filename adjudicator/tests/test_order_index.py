@@ -0,0 +1,40 @@
+import unittest
+
+from adjudicator.order import Convoy, Hold, Move, Retreat, Support
+from adjudicator.tests.data import Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestOrderIndex(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+
+    def test_orders_grouped_by_territories(self):
+        london = self.territories.LONDON
+        north_sea = self.territories.NORTH_SEA
+        norway = self.territories.NORWAY
+        move = Move(self.state, 0, Nations.ENGLAND, london, norway, via_convoy=True)
+        convoy = Convoy(self.state, 0, Nations.ENGLAND, north_sea, london, norway)
+        support = Support(self.state, 0, Nations.ENGLAND, self.territories.SKAGERRAK, london, norway)
+        hold = Hold(self.state, 0, Nations.ENGLAND, self.territories.EDINBURGH)
+        retreat = Retreat(self.state, 0, Nations.ENGLAND, self.territories.YORKSHIRE, norway)
+
+        index = self.state.order_index
+        self.assertEqual(index.moves(norway), [move])
+        self.assertEqual(index.retreats(norway), [retreat])
+        self.assertEqual(index.supports(london, norway), [support])
+        self.assertEqual(index.convoys(london, norway), [convoy])
+        self.assertEqual(index.moves(london), [])
+        self.assertEqual(index.supports(norway, london), [])
+        self.assertNotIn(hold, index.moves(self.territories.EDINBURGH))
+
+    def test_index_discarded_when_order_registered(self):
+        london = self.territories.LONDON
+        wales = self.territories.WALES
+        index = self.state.index_orders()
+        self.assertEqual(index.moves(wales), [])
+        move = Move(self.state, 0, Nations.ENGLAND, london, wales)
+        self.assertEqual(self.state.order_index.moves(wales), [move])
@@ -0,0 +1,98 @@
+import unittest
+
+from adjudicator.decisions import Outcomes
+from adjudicator.exceptions import ResolutionStalledException
+from adjudicator.order import Convoy, Move, Support
+from adjudicator.paradoxes import (
+    resolve_by_guessing, restore_resolution, save_resolution
+)
+from adjudicator.piece import Army, Fleet
+from adjudicator.processor import process
+from adjudicator.tests.data import Nations, Territories
+from adjudicator.worklist import Worklist
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestSaveResolution(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+
+    def test_restore_resolution(self):
+        army = Army(self.state, 0, Nations.FRANCE, self.territories.PARIS)
+        Army(self.state, 0, Nations.FRANCE, self.territories.GASCONY)
+        move = Move(self.state, 0, Nations.FRANCE, self.territories.PARIS, self.territories.BURGUNDY)
+        support = Support(self.state, 0, Nations.FRANCE, self.territories.GASCONY, self.territories.PARIS, self.territories.BURGUNDY)
+        saved = save_resolution(self.state)
+
+        move.outcome = Outcomes.SUCCEEDS
+        support.outcome = Outcomes.SUCCEEDS
+        army.dislodged_decision = Outcomes.SUSTAINS
+        move.path_decision()
+        self.assertEqual(move.move_support_count(Outcomes.SUCCEEDS), 1)
+
+        restore_resolution(self.state, saved)
+        self.assertEqual(move.outcome, Outcomes.UNRESOLVED)
+        self.assertEqual(support.outcome, Outcomes.UNRESOLVED)
+        self.assertEqual(army.dislodged_decision, Outcomes.UNRESOLVED)
+        self.assertEqual(move.path_decision.result, Outcomes.UNRESOLVED)
+        self.assertEqual(move.move_support_count(Outcomes.SUCCEEDS), 0)
+        self.assertEqual(move.move_support_count(Outcomes.UNRESOLVED), 1)
+
+
+class TestResolveByGuessing(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+
+    def test_stall_without_moves(self):
+        army = Army(self.state, 0, Nations.FRANCE, self.territories.PARIS)
+        Army(self.state, 0, Nations.FRANCE, self.territories.GASCONY)
+        support = Support(self.state, 0, Nations.FRANCE, self.territories.GASCONY, self.territories.PARIS, self.territories.PARIS)
+        self.state.index_orders()
+        self.state.index_pieces()
+
+        def resolve(items, depth):
+            raise AssertionError('Nothing should be guessed.')
+
+        worklist = Worklist(self.state)
+        with self.assertRaises(ResolutionStalledException):
+            resolve_by_guessing(self.state, worklist, [support, army], resolve, 0)
+        self.assertEqual(support.outcome, Outcomes.UNRESOLVED)
+        self.assertEqual(army.dislodged_decision, Outcomes.UNRESOLVED)
+
+
+class TestSzykmanRule(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+
+    def test_only_applied_to_cluster(self):
+        """
+        Settling a convoy paradox does not affect convoyed moves of other
+        clusters, which may not have been resolved yet.
+        """
+        Army(self.state, 1, Nations.ENGLAND, self.territories.LONDON)
+        Army(self.state, 2, Nations.ENGLAND, self.territories.WALES)
+        Fleet(self.state, 3, Nations.ENGLAND, self.territories.ENGLISH_CHANNEL)
+        Army(self.state, 4, Nations.ITALY, self.territories.TUNIS)
+        Fleet(self.state, 5, Nations.ITALY, self.territories.IONIAN_SEA)
+        Army(self.state, 6, Nations.ITALY, self.territories.ROME)
+        orders = [
+            Move(self.state, 1, Nations.ENGLAND, self.territories.LONDON, self.territories.WALES, via_convoy=True),
+            Move(self.state, 2, Nations.ENGLAND, self.territories.WALES, self.territories.LONDON),
+            Convoy(self.state, 3, Nations.ENGLAND, self.territories.ENGLISH_CHANNEL, self.territories.LONDON, self.territories.WALES),
+            Move(self.state, 4, Nations.ITALY, self.territories.TUNIS, self.territories.NAPLES, via_convoy=True),
+            Convoy(self.state, 5, Nations.ITALY, self.territories.IONIAN_SEA, self.territories.TUNIS, self.territories.NAPLES),
+            Move(self.state, 6, Nations.ITALY, self.territories.ROME, self.territories.NAPLES),
+        ]
+
+        process(self.state)
+
+        self.assertEqual(orders[3].outcome, Outcomes.FAILS)
+        self.assertEqual(orders[5].outcome, Outcomes.FAILS)
+        self.assertIn(self.territories.NAPLES, self.state.bounces)
@@ -0,0 +1,196 @@
+import os
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from marshmallow import ValidationError
+
+from adjudicator import (
+    compile_map, load_turn_state, map_cache, process_game_state,
+    process_game_states, process_turn_clusters
+)
+from adjudicator.benchmarks.variant import VARIANT_SIZES, generate_turn
+from adjudicator.cluster import find_data_clusters
+from adjudicator.exceptions import UnknownMapException
+from adjudicator.parallel import (
+    batch_clusters, cluster_batch, resolve_clusters
+)
+from adjudicator.tests.data import (
+    CUT, SUPPORT, convoy_paradox_turn, full_turn, inland_turn_data
+)
+
+
+class TestProcessGameStates(unittest.TestCase):
+
+    def setUp(self):
+        self.turns = [full_turn(i) for i in range(10)]
+        self.turns[3] = full_turn(3, target='picardy')
+
+    def test_results_match_process_game_state(self):
+        expected = [process_game_state(full_turn(t['id'], t['orders'][0]['target']))
+                    for t in self.turns]
+        for workers in [1, 2]:
+            result = list(process_game_states(iter(self.turns), workers=workers, max_pending=3))
+            self.assertEqual(result, expected)
+
+    def test_unordered(self):
+        result = process_game_states(self.turns, workers=2, ordered=False)
+        self.assertEqual(sorted(r['id'] for r in result), list(range(10)))
+
+    def test_return_exceptions(self):
+        self.turns[5]['orders'][0]['target'] = 'ruhr'
+        result = list(process_game_states(self.turns, workers=2, return_exceptions=True))
+        self.assertEqual(result[5].turn_id, 5)
+        self.assertIsInstance(result[5].exception, ValidationError)
+        self.assertEqual(result[6]['id'], 6)
+
+    def test_exception_raised(self):
+        self.turns[5]['orders'][0]['target'] = 'ruhr'
+        with self.assertRaises(ValidationError):
+            list(process_game_states(self.turns, workers=1))
+
+
+class TestProcessTurnClusters(unittest.TestCase):
+
+    def setUp(self):
+        self.turn = inland_turn_data()
+        self.turn['orders'] += [SUPPORT, CUT]
+
+    def test_results_match_process_game_state(self):
+        # Without the cut the piece in Paris is dislodged.
+        for orders in [[SUPPORT], [SUPPORT, CUT]]:
+            turn = inland_turn_data()
+            turn['orders'] += orders
+            expected = process_game_state(turn)
+            for workers in [1, 2]:
+                self.assertEqual(process_turn_clusters(turn, workers=workers), expected)
+
+    def test_single_cluster(self):
+        self.turn['orders'] = self.turn['orders'][:1]
+        self.turn['pieces'] = self.turn['pieces'][:2]
+        self.assertEqual(
+            process_turn_clusters(self.turn, workers=2),
+            process_game_state(self.turn),
+        )
+
+    def test_validation_error(self):
+        self.turn['orders'][0]['target'] = 'ruhr'
+        with self.assertRaises(ValidationError):
+            process_turn_clusters(self.turn, workers=2)
+
+    def test_convoy_paradox(self):
+        # The convoyed army has no path, so there is no bounce in the
+        # territory it moves to.
+        expected = process_game_state(convoy_paradox_turn())
+        result = process_turn_clusters(convoy_paradox_turn(), workers=2)
+        self.assertEqual(result, expected)
+        self.assertEqual(result['orders'][0]['outcome'], 'fails')
+        self.assertFalse(result['territories'][5]['bounce_occurred'])
+
+    def test_variant_turns_with_executor(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for seed in range(3):
+                data = generate_turn(200, 15, seed=seed)
+                result = process_turn_clusters(
+                    data, workers=3, executor=executor
+                )
+                self.assertEqual(result, process_game_state(data))
+
+
+class TestResolveClusters(unittest.TestCase):
+
+    def setUp(self):
+        map_cache.clear()
+        self.data = generate_turn(200, 15, seed=0)
+        turn_data = {k: v for k, v in self.data.items() if k != 'named_coasts'}
+        turn_data['map_hash'] = compile_map(self.data)
+        self.compiled_map, self.validated_data = load_turn_state(turn_data)
+        self.clusters = find_data_clusters(
+            self.validated_data['orders'], self.validated_data['pieces']
+        )
+
+    def test_batches_balanced(self):
+        batches = batch_clusters(self.clusters, 4)
+        self.assertEqual(len(batches), 4)
+        self.assertCountEqual(sum(batches, []), self.clusters)
+        sizes = [sum(len(c.orders) + len(c.pieces) for c in b) for b in batches]
+        largest = max(len(c.orders) + len(c.pieces) for c in self.clusters)
+        self.assertLessEqual(max(sizes) - min(sizes), largest)
+        self.assertEqual(len(batch_clusters(self.clusters[:2], 4)), 2)
+
+    def test_results_by_id(self):
+        cluster = self.clusters[0]
+        batch = cluster_batch(self.validated_data, [cluster])
+        order_results, piece_results = resolve_clusters(
+            self.compiled_map.variant, self.compiled_map.content_hash, batch
+        )
+        self.assertEqual(
+            [r[0] for r in order_results], [o['id'] for o in cluster.orders]
+        )
+        self.assertEqual(
+            [r[0] for r in piece_results], [p['id'] for p in cluster.pieces]
+        )
+        self.assertEqual(
+            {t['id'] for t in batch['territories']} - cluster.territories,
+            set(),
+        )
+
+    def test_unknown_map_compiled_from_map_data(self):
+        def resolve(*args):
+            batch = cluster_batch(self.validated_data, self.clusters[:1])
+            return resolve_clusters(
+                self.compiled_map.variant, self.compiled_map.content_hash,
+                batch, *args
+            )
+
+        expected = resolve()
+        map_cache.clear()
+        with self.assertRaises(UnknownMapException):
+            resolve()
+        self.assertEqual(resolve(self.data), expected)
+
+
+class TestProcessTurnClustersSpeed(unittest.TestCase):
+    """
+    The parallel path on the variant boards against the serial path, with a
+    pool kept for many turns.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.turns = [
+            generate_turn(size, players, seed=0)
+            for size, players in VARIANT_SIZES
+        ]
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+        for data in cls.turns:
+            process_turn_clusters(data, workers=2, executor=cls.executor)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def best_time(self, clock, **kwargs):
+        times = []
+        for _ in range(5):
+            start = clock()
+            for data in self.turns:
+                process_turn_clusters(data, **kwargs)
+            times.append(clock() - start)
+        return min(times)
+
+    def test_less_work_in_this_process(self):
+        serial = self.best_time(time.process_time, workers=1)
+        parallel = self.best_time(
+            time.process_time, workers=2, executor=self.executor
+        )
+        self.assertLess(parallel, serial)
+
+    @unittest.skipIf((os.cpu_count() or 1) < 2, 'Only one CPU')
+    def test_not_slower_than_serial(self):
+        serial = self.best_time(time.perf_counter, workers=1)
+        parallel = self.best_time(
+            time.perf_counter, workers=2, executor=self.executor
+        )
+        # Allow for noise in the timings.
+        self.assertLess(parallel, serial * 1.1)
@@ -1,5 +1,6 @@
 import unittest
 
+from adjudicator.decisions import Outcomes
 from adjudicator.named_coast import NamedCoast
 from adjudicator.order import Move
 from adjudicator.piece import Army, Fleet
@@ -19,6 +20,27 @@ class TestOrder(AdjudicatorTestCaseMixin, unittest.TestCase):
         self.assertEqual(army.order, london_move)
 
 
+class TestUpdateDislodgedDecision(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        london = CoastalTerritory(self.state, 1, 'London', 'England', [2], [2])
+        wales = CoastalTerritory(self.state, 2, 'Wales', 'England', [1], [1])
+        self.army = Army(self.state, 0, 'England', london)
+        Army(self.state, 0, 'France', wales)
+        self.london_move = Move(self.state, 0, 'England', london, wales)
+        self.wales_move = Move(self.state, 0, 'France', wales, london)
+        self.wales_move.outcome = Outcomes.SUCCEEDS
+
+    def test_unresolved_move_not_dislodged(self):
+        self.assertEqual(self.army.update_dislodged_decision(), Outcomes.UNRESOLVED)
+
+    def test_failed_move_dislodged(self):
+        self.london_move.outcome = Outcomes.FAILS
+        self.assertEqual(self.army.update_dislodged_decision(), Outcomes.DISLODGED)
+        self.assertEqual(self.army.dislodged_by.territory.name, 'Wales')
+
+
 class TestCanReachArmy(AdjudicatorTestCaseMixin, unittest.TestCase):
 
     def setUp(self):
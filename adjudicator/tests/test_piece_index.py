@@ -0,0 +1,46 @@
+import unittest
+
+from adjudicator.order import DummyHold, Hold, Move, Retreat
+from adjudicator.piece import Army
+from adjudicator.tests.data import Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestPieceIndex(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+
+    def test_retreating_piece_shares_territory(self):
+        paris = self.territories.PARIS
+        attacker = Army(self.state, 0, Nations.GERMANY, paris)
+        retreating = Army(self.state, 1, Nations.FRANCE, paris, retreating=True)
+
+        index = self.state.piece_index
+        self.assertEqual(index.pieces(paris), [attacker, retreating])
+        self.assertEqual(index.piece(paris), retreating)
+        self.assertEqual(index.non_retreating_piece(paris), attacker)
+        self.assertIsNone(index.piece(self.territories.PICARDY))
+
+    def test_piece_bound_to_order_for_nation(self):
+        paris = self.territories.PARIS
+        army = Army(self.state, 0, Nations.FRANCE, paris)
+        Hold(self.state, 0, Nations.GERMANY, paris)
+        move = Move(self.state, 1, Nations.FRANCE, paris, self.territories.PICARDY)
+        self.assertEqual(self.state.piece_index.order(army), move)
+
+    def test_unordered_piece_has_one_dummy_hold(self):
+        army = Army(self.state, 0, Nations.FRANCE, self.territories.PARIS)
+        order = army.order
+        self.assertIsInstance(order, DummyHold)
+        self.assertIs(army.order, order)
+        self.assertEqual(order.piece, army)
+
+    def test_order_bound_to_piece_of_its_nation(self):
+        paris = self.territories.PARIS
+        Army(self.state, 0, Nations.GERMANY, paris)
+        retreating = Army(self.state, 1, Nations.FRANCE, paris, retreating=True)
+        retreat = Retreat(self.state, 0, Nations.FRANCE, paris, self.territories.PICARDY)
+        self.assertEqual(retreat.piece, retreating)
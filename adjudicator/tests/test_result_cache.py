@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+from adjudicator import process_game_state
+from adjudicator.result_cache import (
+    FileResultCache, MemoryResultCache, SqliteResultCache, canonical_turn,
+    turn_hash,
+)
+from adjudicator.tests.data import full_turn
+
+
+def permuted_turn():
+    data = full_turn(1)
+    data['territories'].reverse()
+    for territory in data['territories']:
+        territory['neighbours'].reverse()
+    data['nations'].reverse()
+    return data
+
+
+class TestTurnHash(unittest.TestCase):
+
+    def test_order_independent(self):
+        self.assertEqual(turn_hash(full_turn(1)), turn_hash(permuted_turn()))
+        self.assertEqual(canonical_turn(full_turn(1)), canonical_turn(permuted_turn()))
+
+    def test_content_dependent(self):
+        self.assertNotEqual(turn_hash(full_turn(1)), turn_hash(full_turn(2)))
+        self.assertNotEqual(
+            turn_hash(full_turn(1)), turn_hash(full_turn(1, target='picardy'))
+        )
+
+
+class TestProcessGameStateCached(unittest.TestCase):
+
+    def get_caches(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return [
+            MemoryResultCache(),
+            FileResultCache(os.path.join(directory.name, 'results')),
+            SqliteResultCache(os.path.join(directory.name, 'results.sqlite3')),
+        ]
+
+    def test_cached_result_matches_uncached(self):
+        expected = process_game_state(full_turn(1))
+        self.assertEqual(process_game_state(full_turn(1)), expected)
+        for cache in self.get_caches():
+            self.assertEqual(process_game_state(full_turn(1), cache=cache), expected)
+            self.assertEqual(process_game_state(full_turn(1), cache=cache), expected)
+
+    def test_permuted_turn_uses_cached_result(self):
+        for cache in self.get_caches():
+            process_game_state(full_turn(1), cache=cache)
+            cache.set = None
+            result = process_game_state(permuted_turn(), cache=cache)
+            self.assertEqual(result, process_game_state(permuted_turn()))
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        cache = MemoryResultCache(maxsize=2)
+        cache.set('a', {})
+        cache.set('b', {})
+        cache.get('a')
+        cache.set('c', {})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), {})
+
+    def test_memory_cache_returns_copy(self):
+        cache = MemoryResultCache()
+        cache.set('a', {'orders': []})
+        cache.get('a')['orders'].append(1)
+        self.assertEqual(cache.get('a'), {'orders': []})
@@ -1,4 +1,5 @@
 from django.test import TestCase
+from marshmallow import ValidationError
 
 from adjudicator.base import OrderType, PieceType, Phase, Season
 from adjudicator.nation import Nation
@@ -31,6 +32,7 @@ class TestSerializeTurn(AdjudicatorTestCaseMixin, TestCase):
             sorted(order_data.keys()),
             ['id', 'illegal', 'illegal_code', 'illegal_verbose', 'outcome']
         )
+        self.assertEqual(order_data['outcome'], 'succeeds')
 
     def test_serialize_state_territory(self):
         CoastalTerritory(self.state, 1, 'London', 1, [2], [])
@@ -75,3 +77,63 @@ class TestDeserializeOrder(AdjudicatorTestCaseMixin, TestCase):
             'piece_type': PieceType.FLEET,
         }
         OrderSchema().load(data)
+
+
+class TestValidateTurn(TestCase):
+
+    def setUp(self):
+        self.data = {
+            'id': 1,
+            'phase': Phase.ORDER,
+            'season': Season.SPRING,
+            'year': 1901,
+            'territories': [
+                {'id': 'paris', 'type': 'inland', 'neighbours': ['picardy']},
+                {'id': 'picardy', 'type': 'coastal', 'neighbours': ['paris']},
+            ],
+            'named_coasts': [],
+            'nations': [{'id': 'france', 'name': 'France'}],
+            'pieces': [
+                {'id': 1, 'type': PieceType.ARMY, 'nation': 'france', 'territory': 'paris'},
+            ],
+            'orders': [
+                {
+                    'id': 1, 'type': OrderType.MOVE, 'nation': 'france',
+                    'source': 'paris', 'target': 'picardy',
+                },
+            ],
+        }
+
+    def test_valid(self):
+        TurnSchema().load(self.data)
+
+    def test_invalid_ids(self):
+        self.data['orders'][0]['target'] = 'ruhr'
+        self.data['orders'][0]['nation'] = 'germany'
+        self.data['pieces'][0]['territory'] = 'ruhr'
+        with self.assertRaises(ValidationError) as context:
+            TurnSchema().load(self.data)
+        self.assertEqual(context.exception.messages, {
+            'orders': {0: {
+                'target': ['Territory id does not have a corresponding territory.'],
+                'nation': ['Nation id does not have a corresponding nation.'],
+            }},
+            'pieces': {0: {
+                'territory': ['Territory id does not have a corresponding territory.'],
+            }},
+        })
+
+    def test_invalid_order_type_for_phase(self):
+        self.data['orders'][0]['type'] = OrderType.BUILD
+        self.data['orders'][0]['piece_type'] = PieceType.ARMY
+        with self.assertRaises(ValidationError) as context:
+            TurnSchema().load(self.data)
+        self.assertEqual(context.exception.messages, {
+            'orders': {0: {
+                'type': ['During order phase valid order types are move, convoy, hold, support'],
+            }},
+        })
+
+    def test_load_trusted(self):
+        data = TurnSchema().load_trusted(self.data)
+        self.assertEqual(data, TurnSchema().load(self.data))
@@ -0,0 +1,78 @@
+import unittest
+from unittest import mock
+
+from marshmallow import ValidationError
+
+from adjudicator import process_game_state
+from adjudicator.base import OrderType
+from adjudicator.order import Move
+from adjudicator.session import Session
+from adjudicator.tests.data import CUT, SUPPORT, inland_turn_data
+
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.session = Session(inland_turn_data())
+
+    def assertMatchesProcessedTurn(self, orders):
+        data = inland_turn_data()
+        data['orders'] = orders
+        self.assertEqual(self.session.dump(), process_game_state(data))
+
+    def test_initial_outcomes(self):
+        self.assertEqual(self.session.outcomes, {1: 'fails', 2: 'succeeds'})
+
+    def test_add_order(self):
+        changes = self.session.add_order(SUPPORT)
+        self.assertEqual(changes, {
+            'orders': {1: 'succeeds', 3: 'succeeds'},
+            'pieces': {1: True},
+        })
+        self.assertMatchesProcessedTurn([*inland_turn_data()['orders'], SUPPORT])
+
+    def test_add_cutting_order(self):
+        self.session.add_order(SUPPORT)
+        changes = self.session.add_order(CUT)
+        self.assertEqual(changes, {
+            'orders': {1: 'fails', 3: 'fails', 4: 'fails'},
+            'pieces': {1: False},
+        })
+        self.assertMatchesProcessedTurn([*inland_turn_data()['orders'], SUPPORT, CUT])
+
+    def test_replace_order(self):
+        self.session.add_order(SUPPORT)
+        hold = {'id': 3, 'type': OrderType.HOLD, 'nation': 'germany', 'source': 'picardy'}
+        changes = self.session.replace_order(hold)
+        self.assertEqual(changes, {
+            'orders': {1: 'fails', 3: 'succeeds'},
+            'pieces': {1: False},
+        })
+        self.assertMatchesProcessedTurn([*inland_turn_data()['orders'], hold])
+
+    def test_remove_order(self):
+        self.session.add_order(SUPPORT)
+        changes = self.session.remove_order(3)
+        self.assertEqual(changes, {'orders': {1: 'fails'}, 'pieces': {1: False}})
+        self.assertMatchesProcessedTurn(inland_turn_data()['orders'])
+
+    def test_unaffected_cluster_not_adjudicated_again(self):
+        resolved = []
+        resolve = Move.resolve
+
+        def record(move):
+            resolved.append(move.id)
+            return resolve(move)
+
+        with mock.patch.object(Move, 'resolve', autospec=True, side_effect=record):
+            self.session.add_order(SUPPORT)
+        self.assertNotIn(2, resolved)
+        self.assertIn(1, resolved)
+
+    def test_invalid_edits(self):
+        with self.assertRaises(ValidationError):
+            self.session.add_order({**SUPPORT, 'id': 1})
+        with self.assertRaises(ValidationError):
+            self.session.add_order({**SUPPORT, 'target': 'ruhr'})
+        with self.assertRaises(ValidationError):
+            self.session.remove_order(10)
@@ -0,0 +1,160 @@
+import copy
+import unittest
+from unittest import mock
+
+from adjudicator import add_turn, create_order, create_state, process_game_state
+from adjudicator.benchmarks.variant import generate_turn
+from adjudicator.decisions import Outcomes
+from adjudicator.named_coast import NamedCoast
+from adjudicator.nation import Nation
+from adjudicator.order import Hold, Move
+from adjudicator.piece import Army
+from adjudicator.processor import process
+from adjudicator.schema import OrderSchema, TurnSchema
+from adjudicator.territory import CoastalTerritory, SeaTerritory
+from adjudicator.tests.data import SUPPORT, inland_turn_data
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestRegister(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def test_objects_filed_by_type(self):
+        london = CoastalTerritory(self.state, 1, 'London', 'England', [2], [])
+        north_sea = SeaTerritory(self.state, 2, 'North Sea', [1])
+        nation = Nation(self.state, 'England', 'England')
+        army = Army(self.state, 0, 'England', london)
+        hold = Hold(self.state, 0, 'England', london)
+
+        self.assertEqual(self.state.territories, [london, north_sea])
+        self.assertEqual(self.state.land_territories, [london])
+        self.assertEqual(self.state.nations, [nation])
+        self.assertEqual(self.state.pieces, [army])
+        self.assertEqual(self.state.orders, [hold])
+
+    def test_subclass_registered_once(self):
+        london = CoastalTerritory(self.state, 1, 'London', 'England', [2], [])
+        wales = CoastalTerritory(self.state, 2, 'Wales', 'England', [1], [])
+        move = Move(self.state, 0, 'England', london, wales)
+        self.assertEqual(self.state.orders, [move])
+
+    def test_registration_order_preserved(self):
+        territories = [
+            SeaTerritory(self.state, i, f'Sea {i}', []) for i in range(20)
+        ]
+        self.assertEqual(self.state.territories, territories)
+
+
+class TestLookups(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.spain = CoastalTerritory(self.state, 1, 'Spain', None, [], [])
+        self.south_coast = NamedCoast(self.state, 2, 'south coast', self.spain, [])
+
+    def test_get_territory_by_id(self):
+        self.assertEqual(self.state.get_territory_by_id(1), self.spain)
+        self.assertIsNone(self.state.get_territory_by_id(3))
+
+    def test_get_territory(self):
+        self.assertEqual(self.state.get_territory('Spain'), self.spain)
+        self.assertIsNone(self.state.get_territory('Portugal'))
+
+    def test_get_named_coast_by_id(self):
+        self.assertEqual(self.state.get_named_coast_by_id(2), self.south_coast)
+        self.assertIsNone(self.state.get_named_coast_by_id(1))
+
+    def test_duplicate_id_last_registered(self):
+        spain = CoastalTerritory(self.state, 1, 'Spain', None, [], [])
+        self.assertEqual(self.state.get_territory_by_id(1), spain)
+        self.assertEqual(self.state.get_territory('Spain'), spain)
+
+
+class TestFork(unittest.TestCase):
+
+    def setUp(self):
+        validated_data = TurnSchema().load(inland_turn_data())
+        self.state = create_state(validated_data)
+        add_turn(self.state, validated_data)
+        process(self.state)
+        self.result = TurnSchema().dump(self.state)
+
+    def process_fork(self, fork, orders):
+        for order_data in OrderSchema(many=True).load(orders):
+            create_order(fork, order_data)
+        process(fork)
+        data = TurnSchema().dump(fork)
+        data['id'] = 1
+        return data
+
+    def test_map_shared(self):
+        fork = self.state.fork()
+        for name in ['territories', 'land_territories', 'named_coasts']:
+            self.assertIs(getattr(fork, name), getattr(self.state, name))
+        self.assertIs(fork.graph, self.state.graph)
+        paris = self.state.get_territory_by_id('paris')
+        self.assertIs(fork.get_territory_by_id('paris'), paris)
+        self.assertIs(fork.pieces[0].territory, paris)
+        self.assertIs(fork.orders[0].target, paris)
+
+    def test_copies_bound_to_fork(self):
+        fork = self.state.fork()
+        for name in ['nations', 'pieces', 'orders']:
+            originals, copies = getattr(self.state, name), getattr(fork, name)
+            self.assertEqual(len(originals), len(copies))
+            for original, observer_copy in zip(originals, copies):
+                self.assertIsNot(original, observer_copy)
+                self.assertIs(observer_copy.state, fork)
+
+    def test_fork_cost_independent_of_map(self):
+        data = generate_turn(300, 4, seed=0, occupancy=0.1)
+        validated_data = TurnSchema().load(data)
+        state = create_state(validated_data)
+        add_turn(state, validated_data)
+        with mock.patch('adjudicator.state.copy.copy', wraps=copy.copy) as copied:
+            state.fork()
+        self.assertEqual(
+            copied.call_count,
+            len(state.nations) + len(state.pieces) + len(state.orders),
+        )
+        self.assertGreater(len(state.territories), copied.call_count)
+
+    def test_fork_without_results(self):
+        self.state.bounces.add(self.state.get_territory_by_id('paris'))
+        fork = self.state.fork()
+        self.assertEqual(fork.bounces, set())
+        self.assertEqual(fork.captures, {})
+        self.assertTrue(all(o.outcome == Outcomes.UNRESOLVED for o in fork.orders))
+        self.assertIsNone(fork.summary)
+
+    def test_territory_state_copied(self):
+        paris = self.state.get_territory_by_id('paris')
+        self.state.contested.add(paris)
+        self.state.controlled_by[paris] = 'france'
+        fork = self.state.fork()
+        fork.controlled_by[paris] = 'germany'
+        self.assertIn(paris, fork.contested)
+        self.assertEqual(self.state.controlled_by.get(paris), 'france')
+
+    def test_map_copied_on_write(self):
+        fork = self.state.fork()
+        territories = list(self.state.territories)
+        sea = SeaTerritory(fork, 'sea', 'Sea', [])
+        self.assertEqual(fork.territories, [*territories, sea])
+        self.assertEqual(self.state.territories, territories)
+        self.assertIsNone(self.state.get_territory_by_id('sea'))
+        self.assertIs(fork.get_territory_by_id('sea'), sea)
+
+    def test_process_alternative_orders(self):
+        fork = self.state.fork(orders=False)
+        self.assertEqual(fork.orders, [])
+        orders = [*inland_turn_data()['orders'], SUPPORT]
+        data = inland_turn_data()
+        data['orders'] = orders
+        self.assertEqual(self.process_fork(fork, orders), process_game_state(data))
+        # The original state is unchanged.
+        self.assertEqual(TurnSchema().dump(self.state), self.result)
+
+    def test_process_copied_orders(self):
+        expected = process_game_state(inland_turn_data())
+        self.assertEqual(self.process_fork(self.state.fork(), []), expected)
@@ -0,0 +1,65 @@
+import unittest
+
+from adjudicator.base import Phase, Season
+from adjudicator.nation import Nation
+from adjudicator.order import Move
+from adjudicator.piece import Army
+from adjudicator.processor import process
+from adjudicator.tests.data import NamedCoasts, Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestSummarize(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.state.season = Season.FALL
+        self.territories = Territories(self.state)
+        self.named_coasts = NamedCoasts(self.state, self.territories)
+
+    def test_summarize_fall_orders(self):
+        france = Nation(self.state, Nations.FRANCE, 'France')
+        germany = Nation(self.state, Nations.GERMANY, 'Germany')
+        self.territories.BELGIUM.supply_center = True
+        self.territories.PARIS.supply_center = True
+        self.state.controlled_by[self.territories.PARIS] = Nations.FRANCE
+
+        Army(self.state, 0, Nations.FRANCE, self.territories.PICARDY)
+        Army(self.state, 0, Nations.FRANCE, self.territories.GASCONY)
+        Army(self.state, 0, Nations.GERMANY, self.territories.BURGUNDY)
+        Move(self.state, 0, Nations.FRANCE, self.territories.PICARDY, self.territories.BELGIUM)
+        Move(self.state, 0, Nations.FRANCE, self.territories.GASCONY, self.territories.PARIS)
+        Move(self.state, 0, Nations.GERMANY, self.territories.BURGUNDY, self.territories.PARIS)
+
+        process(self.state)
+        summary = self.state.summary
+
+        self.assertEqual(summary.bounces, {self.territories.PARIS})
+        self.assertIn(self.territories.PARIS, self.state.bounces)
+        self.assertEqual(self.state.captures.get(self.territories.BELGIUM), Nations.FRANCE)
+        self.assertEqual(self.state.captures.get(self.territories.BURGUNDY), Nations.GERMANY)
+        self.assertEqual(self.state.captures.get(self.territories.GASCONY), Nations.FRANCE)
+        self.assertNotIn(self.territories.PARIS, self.state.captures)
+        self.assertFalse(summary.retreat_required)
+
+        self.assertEqual(france.next_turn_piece_count, 2)
+        self.assertEqual(france.next_turn_supply_center_count, 2)
+        self.assertEqual(france.next_turn_supply_delta, 0)
+        # Germany controls Berlin.
+        self.assertEqual(germany.next_turn_supply_delta, 0)
+        self.assertEqual(
+            (self.state.next_season, self.state.next_phase, self.state.next_year),
+            (Season.SPRING, Phase.ORDER, 1901)
+        )
+
+    def test_no_captures_in_spring(self):
+        self.state.season = Season.SPRING
+        Army(self.state, 0, Nations.FRANCE, self.territories.PICARDY)
+        Move(self.state, 0, Nations.FRANCE, self.territories.PICARDY, self.territories.BELGIUM)
+
+        process(self.state)
+
+        self.assertEqual(self.state.summary.captures, {})
+        self.assertNotIn(self.territories.BELGIUM, self.state.captures)
+        self.assertEqual(self.state.summary.piece_count(Nations.FRANCE), 1)
@@ -66,24 +66,9 @@ class TestPiece(TerritoryTestCase):
         army_london = Army(self.state, 0, 'England', london)
         army_wales = Army(self.state, 0, 'England', wales)
 
-        self.assertEqual(army_london, london.piece)
-        self.assertEqual(army_wales, wales.piece)
-        self.assertIsNone(paris.piece)
-
-
-class TestFriendlyPieceExists(TerritoryTestCase):
-
-    def test_friendly_piece_exists(self):
-        london = CoastalTerritory(self.state, 1, 'London', 'England', [], [])
-        wales = CoastalTerritory(self.state, 2, 'Wales', 'England', [], [])
-        paris = InlandTerritory(self.state, 3, 'Paris', 'France', [])
-
-        Army(self.state, 0, 'England', london)
-        Army(self.state, 0, 'France', wales)
-
-        self.assertTrue(london.friendly_piece_exists('England'))
-        self.assertFalse(wales.friendly_piece_exists('England'))
-        self.assertFalse(paris.friendly_piece_exists('England'))
+        self.assertEqual(army_london, self.state.piece_in(london))
+        self.assertEqual(army_wales, self.state.piece_in(wales))
+        self.assertIsNone(self.state.piece_in(paris))
 
 
 class TestOccupied(TerritoryTestCase):
@@ -94,8 +79,8 @@ class TestOccupied(TerritoryTestCase):
 
         Army(self.state, 0, 'England', london)
 
-        self.assertTrue(london.occupied)
-        self.assertFalse(wales.occupied)
+        self.assertTrue(self.state.occupied(london))
+        self.assertFalse(self.state.occupied(wales))
 
 
 class TestOccupiedBy(TerritoryTestCase):
@@ -108,9 +93,9 @@ class TestOccupiedBy(TerritoryTestCase):
         Army(self.state, 0, 'England', london)
         Army(self.state, 0, 'France', paris)
 
-        self.assertTrue(london.occupied_by('England'))
-        self.assertFalse(wales.occupied_by('England'))
-        self.assertFalse(paris.occupied_by('England'))
+        self.assertTrue(self.state.occupied_by(london, 'England'))
+        self.assertFalse(self.state.occupied_by(wales, 'England'))
+        self.assertFalse(self.state.occupied_by(paris, 'England'))
 
 
 class TestAccessibleByPieceType(TerritoryTestCase):
@@ -153,7 +138,7 @@ class TestAttackingPieces(TerritoryTestCase):
 
     def test_attacking_pieces_none(self):
         picardy = CoastalTerritory(self.state, 1, 'Picardy', 'France', [], [])
-        self.assertEqual(picardy.attacking_pieces, [])
+        self.assertEqual(self.state.attacking_pieces(picardy), [])
 
     def test_attacking_piece_exists(self):
         picardy = CoastalTerritory(self.state, 1, 'Picardy', 'France', [2], [])
@@ -161,7 +146,7 @@ class TestAttackingPieces(TerritoryTestCase):
         army_paris = Army(self.state, 0, 'France', paris)
         Move(self.state, 0, 'France', paris, picardy)
 
-        self.assertEqual(picardy.attacking_pieces, [army_paris])
+        self.assertEqual(self.state.attacking_pieces(picardy), [army_paris])
 
     def test_multiple_attacking_piece_exist(self):
         picardy = CoastalTerritory(self.state, 1, 'Picardy', 'France', [2, 3], [])
@@ -173,7 +158,7 @@ class TestAttackingPieces(TerritoryTestCase):
         Move(self.state, 0, 'France', brest, picardy)
 
         self.assertEqual(
-            set(picardy.attacking_pieces),
+            set(self.state.attacking_pieces(picardy)),
             set([army_paris, fleet_brest])
         )
 
@@ -185,7 +170,7 @@ class TestAttackingPieces(TerritoryTestCase):
         Support(self.state, 0, 'France', paris, brest, picardy)
         Move(self.state, 0, 'France', brest, picardy)
 
-        self.assertEqual(picardy.attacking_pieces, [fleet_brest])
+        self.assertEqual(self.state.attacking_pieces(picardy), [fleet_brest])
 
 
 class TestForeignAttackingPieces(TerritoryTestCase):
@@ -200,7 +185,7 @@ class TestForeignAttackingPieces(TerritoryTestCase):
         Move(self.state, 0, 'France', brest, picardy)
 
         self.assertEqual(
-            picardy.foreign_attacking_pieces('France'),
+            self.state.foreign_attacking_pieces(picardy, 'France'),
             [army_paris]
         )
 
@@ -217,7 +202,7 @@ class TestOtherAttackingPieces(TerritoryTestCase):
         Move(self.state, 0, 'France', brest, picardy)
 
         self.assertEqual(
-            picardy.other_attacking_pieces(fleet_brest),
+            self.state.other_attacking_pieces(picardy, fleet_brest),
             [army_paris]
         )
 
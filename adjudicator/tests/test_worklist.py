@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+from adjudicator.decisions import Outcomes
+from adjudicator.order import Move, Support
+from adjudicator.piece import Army
+from adjudicator.processor import process
+from adjudicator.tests.data import Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestWorklist(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+
+    def test_independent_moves_evaluated_once(self):
+        pairs = [
+            (self.territories.PARIS, self.territories.PICARDY),
+            (self.territories.MUNICH, self.territories.RUHR),
+            (self.territories.MOSCOW, self.territories.UKRAINE),
+        ]
+        orders = []
+        for source, target in pairs:
+            Army(self.state, 0, Nations.FRANCE, source)
+            orders.append(Move(self.state, 0, Nations.FRANCE, source, target))
+
+        with mock.patch.object(Move, 'resolve', autospec=True, side_effect=Move.resolve) as resolve:
+            process(self.state)
+
+        self.assertEqual(resolve.call_count, 3)
+        self.assertTrue(all(o.outcome == Outcomes.SUCCEEDS for o in orders))
+
+    def test_supported_move_requeued_when_support_resolves(self):
+        Army(self.state, 0, Nations.FRANCE, self.territories.PARIS)
+        Army(self.state, 0, Nations.FRANCE, self.territories.GASCONY)
+        Army(self.state, 0, Nations.GERMANY, self.territories.BURGUNDY)
+        move = Move(self.state, 0, Nations.FRANCE, self.territories.PARIS, self.territories.BURGUNDY)
+        support = Support(self.state, 0, Nations.FRANCE, self.territories.GASCONY, self.territories.PARIS, self.territories.BURGUNDY)
+
+        process(self.state)
+
+        self.assertEqual(support.outcome, Outcomes.SUCCEEDS)
+        self.assertEqual(move.outcome, Outcomes.SUCCEEDS)
+        self.assertTrue(self.state.piece_in(self.territories.BURGUNDY).dislodged)
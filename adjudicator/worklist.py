@@ -0,0 +1,85 @@
+from collections import deque
+
+from adjudicator.decisions import Outcomes
+from adjudicator.piece import Piece
+
+
+class Worklist:
+    """
+    Resolves orders and piece dislodged decisions, re-evaluating each item
+    only when something it depends on has changed.
+
+    While an item is evaluated the worklist is set as the state's tracker and
+    is told about every order outcome and dislodged decision that is read,
+    and about every `(aux, target)` group of supports whose count is read.
+    When one of those changes, the items which read it are queued again.
+    Items which are resolved are never evaluated again.
+
+    Items are orders with a `resolve` method and pieces, whose dislodged
+    decision is resolved with `update_dislodged_decision`.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.queue = deque()
+        self.queued = set()
+        self.readers = {}
+        self.current = None
+
+    def read(self, subject):
+        if self.current is not None and subject is not self.current:
+            # A dict is used as an ordered set so that items are queued
+            # again in the same order, and do the same work, on every run.
+            self.readers.setdefault(subject, {})[self.current] = None
+
+    def changed(self, subject):
+        for item in self.readers.pop(subject, ()):
+            self.push(item)
+
+    def push(self, item):
+        if item not in self.queued:
+            self.queued.add(item)
+            self.queue.append(item)
+
+    def run(self, items):
+        """
+        Evaluate the given items until the queue is empty, i.e. until none of
+        the unresolved items can make any more progress.
+
+        Returns:
+            * `list` of the items which are still unresolved.
+        """
+        for item in items:
+            self.push(item)
+        previous_tracker = self.state.tracker
+        self.state.tracker = self
+        instrumentation = self.state.instrumentation
+        try:
+            while self.queue:
+                item = self.queue.popleft()
+                self.queued.discard(item)
+                if is_resolved(item):
+                    continue
+                if instrumentation is not None:
+                    instrumentation.evaluations += 1
+                self.current = item
+                try:
+                    evaluate(item)
+                finally:
+                    self.current = None
+        finally:
+            self.state.tracker = previous_tracker
+        return [i for i in items if not is_resolved(i)]
+
+
+def is_resolved(item):
+    if isinstance(item, Piece):
+        return item.dislodged_decision != Outcomes.UNRESOLVED
+    return item.outcome != Outcomes.UNRESOLVED
+
+
+def evaluate(item):
+    if isinstance(item, Piece):
+        item.update_dislodged_decision()
+    else:
+        item.resolve()
@@ -4,7 +4,9 @@ the `adjudicator` module.
 """
 import logging
 
-from adjudicator import process_game_state
+from django.conf import settings
+
+from adjudicator import compile_map, process_turn_state
 
 from core import models
 from core.models.base import DrawStatus, OrderType, OutcomeType, Phase
@@ -28,8 +30,16 @@ def process_turn(turn, dry_run=False):
 
     logger.info('Processing turn: {}'.format(turn))
     turn_data = TurnSerializer(turn).data
-    outcome = process_game_state(turn_data)
-    logger.info('Turn processed by adjudicator')
+    # The map of the variant is only validated and built for the first turn
+    # processed. The turn data is built from the database so is already
+    # consistent.
+    turn_data['map_hash'] = compile_map(turn_data)
+    instrument = getattr(settings, 'ADJUDICATOR_INSTRUMENTATION', False)
+    outcome = process_turn_state(turn_data, trusted=True, instrument=instrument)
+    if instrument:
+        logger.info(
+            'Turn processed by adjudicator: {}'.format(outcome['instrumentation'])
+        )
 
     if dry_run:
         return outcome
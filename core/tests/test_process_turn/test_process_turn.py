@@ -2,7 +2,7 @@
 Add games to the DATA_DIR using the `dump_turn` management command.
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from core import models
 from core.game import process_turn
@@ -47,3 +47,20 @@ class TestProcessTurn1(TestCase):
             self.assertEqual(nation_state.user, old_nation_state.user)
             # orders_finailzed set to False
             self.assertFalse(nation_state.orders_finalized)
+
+    def test_instrumentation_off_by_default(self):
+        with self.assertLogs('core.game', level='INFO') as logs:
+            outcome = process_turn(self.turn, dry_run=True)
+        self.assertNotIn('instrumentation', outcome)
+        self.assertFalse(
+            [line for line in logs.output if 'processed by adjudicator' in line]
+        )
+
+    @override_settings(ADJUDICATOR_INSTRUMENTATION=True)
+    def test_instrumentation_setting(self):
+        with self.assertLogs('core.game', level='INFO') as logs:
+            outcome = process_turn(self.turn, dry_run=True)
+        self.assertIn('instrumentation', outcome)
+        self.assertTrue(
+            [line for line in logs.output if 'processed by adjudicator' in line]
+        )
@@ -93,6 +93,9 @@ WSGI_APPLICATION = 'project.wsgi.application'
 
 CELERY_BROKER_URL = os.environ.get('AMQP_HOST', 'diplomacy.rabbitmq')
 
+# Log the adjudicator's counters for every processed turn.
+ADJUDICATOR_INSTRUMENTATION = False
+
 # Database
 # https://docs.djangoproject.com/en/2.1/ref/settings/#databases
 